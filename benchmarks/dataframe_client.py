@@ -0,0 +1,387 @@
+"""Measure DataFrameClient operations against a local stand-in for the service.
+
+Run with ``poetry run poe benchmark-client`` or
+``python benchmarks/dataframe_client.py``. An HTTP server in the same process
+serves a synthetic table for the ``append_table_data``, ``query_table_data``,
+``query_decimated_data``, and ``export_table_data`` routes, and the real
+``DataFrameClient`` is used to call it over a local socket.
+
+For each operation and page size, the table is read or written ``--repeat``
+times and the rows per second and latency percentiles of the individual
+requests are reported, followed by the peak memory allocated by one more pass.
+The server's responses are prepared before they are timed, so the results
+mostly reflect the client's cost. Because the server runs in the same process,
+the peak memory includes the buffers it uses to read request bodies.
+
+Pass ``--json PATH`` to also write the results to a file, so that runs of
+different releases can be compared.
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    DataFrame,
+    DecimationOptions,
+    ExportFormat,
+    ExportTableDataRequest,
+    QueryDecimatedDataRequest,
+    QueryTableDataRequest,
+)
+
+_TABLE_ID = "benchmark-table"
+_COLUMNS = ["index", "time", "value", "label"]
+_ROUTE = re.compile(r"^/nidataframe/v1/tables/([^/]+)/([a-z-]+)$")
+_EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def synthetic_row(index: int) -> List[Optional[str]]:
+    """Create the encoded values of a row of the synthetic table."""
+    return [
+        str(index),
+        "2023-01-01T{:02d}:{:02d}:{:02d}.{:03d}Z".format(
+            index // 3600000 % 24, index // 60000 % 60, index // 1000 % 60, index % 1000
+        ),
+        repr(index * 0.001),
+        "label {}".format(index % 100) if index % 10 else None,
+    ]
+
+
+class _SyntheticTable:
+    """Serves the synthetic table's rows, caching each response body so that
+    repeated requests only cost the server a write to the socket.
+    """
+
+    def __init__(self, rows: int) -> None:
+        self.rows = rows
+        self._bodies = {}  # type: Dict[Tuple[Any, ...], bytes]
+        self._lock = threading.Lock()
+
+    def query_data(self, take: int, continuation_token: Optional[str]) -> bytes:
+        start = int(continuation_token) if continuation_token else 0
+        end = min(start + take, self.rows)
+        return self._cached(
+            ("query", start, end),
+            lambda: {
+                "frame": {
+                    "columns": _COLUMNS,
+                    "data": [synthetic_row(index) for index in range(start, end)],
+                },
+                "totalRowCount": self.rows,
+                "continuationToken": str(end) if end < self.rows else None,
+            },
+        )
+
+    def decimated_data(self, intervals: int) -> bytes:
+        # MAX_MIN decimation returns up to two rows per interval.
+        count = min(intervals * 2, self.rows)
+        step = max(self.rows // max(count, 1), 1)
+        return self._cached(
+            ("decimated", count),
+            lambda: {
+                "frame": {
+                    "columns": _COLUMNS,
+                    "data": [synthetic_row(index * step) for index in range(count)],
+                }
+            },
+        )
+
+    def export_csv(self) -> bytes:
+        with self._lock:
+            body = self._bodies.get(("export",))
+        if body is None:
+            lines = [",".join(_COLUMNS)]
+            for index in range(self.rows):
+                lines.append(",".join(value or "" for value in synthetic_row(index)))
+            body = ("\r\n".join(lines) + "\r\n").encode("utf-8")
+            with self._lock:
+                self._bodies[("export",)] = body
+        return body
+
+    def _cached(self, key: Tuple[Any, ...], create: Callable[[], Any]) -> bytes:
+        with self._lock:
+            body = self._bodies.get(key)
+        if body is None:
+            body = json.dumps(create()).encode("utf-8")
+            with self._lock:
+                self._bodies[key] = body
+        return body
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send each write at once rather than waiting for the client's delayed ACK.
+    disable_nagle_algorithm = True
+    server: "_StandInServer"
+
+    def do_POST(self) -> None:  # noqa: N802
+        match = _ROUTE.match(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if match is None or match.group(1) != _TABLE_ID:
+            self._respond(404, b"")
+            return
+
+        table = self.server.table
+        route = match.group(2)
+        if route == "data":
+            # Appended rows are discarded without being parsed.
+            self._respond(204, b"")
+            return
+
+        request = json.loads(body) if body else {}
+        if route == "query-data":
+            take = request.get("take") or 500
+            self._respond(200, table.query_data(take, request.get("continuationToken")))
+        elif route == "query-decimated-data":
+            intervals = (request.get("decimation") or {}).get("intervals") or 1000
+            self._respond(200, table.decimated_data(intervals))
+        elif route == "export-data":
+            self._stream(table.export_csv())
+        else:
+            self._respond(404, b"")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _respond(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for start in range(0, len(body), _EXPORT_CHUNK_SIZE):
+            chunk = body[start : start + _EXPORT_CHUNK_SIZE]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class _StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, table: _SyntheticTable) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.table = table
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+
+class Result(NamedTuple):
+    """The measurements of one operation with one page size."""
+
+    operation: str
+    page_size: int
+    rows_per_second: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    peak_mib: float
+
+
+# A pass of an operation, yielding the latency and number of rows of each request.
+Pass = Callable[[DataFrameClient, int, int], Iterator[Tuple[float, int]]]
+
+
+def _append_pass(
+    client: DataFrameClient, rows: int, page_size: int
+) -> Iterator[Tuple[float, int]]:
+    for start in range(0, rows, page_size):
+        count = min(page_size, rows - start)
+        request = AppendTableDataRequest(
+            frame=DataFrame(
+                columns=_COLUMNS,
+                data=[synthetic_row(index) for index in range(start, start + count)],
+            )
+        )
+        began = time.perf_counter()
+        client.append_table_data(_TABLE_ID, request)
+        yield time.perf_counter() - began, count
+
+
+def _query_pass(
+    client: DataFrameClient, rows: int, page_size: int
+) -> Iterator[Tuple[float, int]]:
+    query = QueryTableDataRequest(take=page_size)
+    while True:
+        began = time.perf_counter()
+        page = client.query_table_data(_TABLE_ID, query)
+        yield time.perf_counter() - began, len(page.frame.data)
+        if page.continuation_token is None:
+            return
+        query = QueryTableDataRequest(
+            take=page_size, continuation_token=page.continuation_token
+        )
+
+
+def _decimated_pass(
+    client: DataFrameClient, rows: int, page_size: int
+) -> Iterator[Tuple[float, int]]:
+    query = QueryDecimatedDataRequest(
+        decimation=DecimationOptions(intervals=max(page_size // 2, 1))
+    )
+    began = time.perf_counter()
+    result = client.query_decimated_data(_TABLE_ID, query)
+    yield time.perf_counter() - began, len(result.frame.data)
+
+
+def _export_pass(
+    client: DataFrameClient, rows: int, page_size: int
+) -> Iterator[Tuple[float, int]]:
+    began = time.perf_counter()
+    export = client.export_table_data(
+        _TABLE_ID, ExportTableDataRequest(response_format=ExportFormat.CSV)
+    )
+    size = 0
+    while True:
+        data = export.read(page_size * 64)
+        if not data:
+            break
+        size += len(data)
+    yield time.perf_counter() - began, rows
+
+
+_OPERATIONS = {
+    "append_table_data": _append_pass,
+    "query_table_data": _query_pass,
+    "query_decimated_data": _decimated_pass,
+    "export_table_data": _export_pass,
+}  # type: Dict[str, Pass]
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(percent / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def measure(
+    client: DataFrameClient,
+    operation: str,
+    rows: int,
+    page_size: int,
+    repeat: int,
+) -> Result:
+    """Measure one operation with one page size.
+
+    Args:
+        client: The client to call the stand-in server with.
+        operation: The name of the operation to measure.
+        rows: The number of rows in the synthetic table.
+        page_size: The number of rows to send or request at a time.
+        repeat: The number of timed passes.
+
+    Returns:
+        The operation's measurements.
+    """
+    run = _OPERATIONS[operation]
+    # The first pass prepares the server's responses and warms up the connection.
+    for _ in run(client, rows, page_size):
+        pass
+
+    latencies = []  # type: List[float]
+    total_rows = 0
+    began = time.perf_counter()
+    for _ in range(repeat):
+        for latency, count in run(client, rows, page_size):
+            latencies.append(latency)
+            total_rows += count
+    elapsed = time.perf_counter() - began
+
+    tracemalloc.start()
+    try:
+        for _ in run(client, rows, page_size):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        operation=operation,
+        page_size=page_size,
+        rows_per_second=total_rows / elapsed,
+        p50_ms=_percentile(latencies, 50) * 1000,
+        p90_ms=_percentile(latencies, 90) * 1000,
+        p99_ms=_percentile(latencies, 99) * 1000,
+        peak_mib=peak / (1024 * 1024),
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Print the measurements of each operation and page size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, default=50000, help="rows in the synthetic table"
+    )
+    parser.add_argument(
+        "--page-sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000],
+        help="rows to send or request at a time",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes")
+    parser.add_argument(
+        "--operations",
+        nargs="+",
+        choices=sorted(_OPERATIONS),
+        default=list(_OPERATIONS),
+        help="operations to measure",
+    )
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    server = _StandInServer(_SyntheticTable(args.rows))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    results = []
+    try:
+        client = DataFrameClient(HttpConfiguration(server.url, "api-key"))
+        print(
+            "{:<22} {:>9} {:>12} {:>9} {:>9} {:>9} {:>10}".format(
+                "Operation", "Page", "Rows/s", "p50", "p90", "p99", "Peak"
+            )
+        )
+        for operation in args.operations:
+            for page_size in args.page_sizes:
+                result = measure(client, operation, args.rows, page_size, args.repeat)
+                results.append(result)
+                print(
+                    "{:<22} {:>9} {:>12,.0f} {:>7.1f}ms {:>7.1f}ms {:>7.1f}ms "
+                    "{:>7.1f}MiB".format(
+                        result.operation,
+                        result.page_size,
+                        result.rows_per_second,
+                        result.p50_ms,
+                        result.p90_ms,
+                        result.p99_ms,
+                        result.peak_mib,
+                    )
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump([result._asdict() for result in results], file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
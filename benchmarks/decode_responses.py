@@ -0,0 +1,128 @@
+"""Compare validated and trusted decoding of large response models.
+
+Run with ``poetry run poe benchmark`` or ``python benchmarks/decode_responses.py``.
+For each model, the same decoded JSON payload is converted with ``parse_obj_as``,
+as clients do by default, and with ``construct_obj_as``, as clients do when
+created with ``trusted_responses=True``. Trusted decoding reuses the lists of
+string values in a table page as-is, so its time for ``PagedTableRows`` does not
+depend on the number of rows.
+"""
+
+import timeit
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from nisystemlink.clients.core._uplink._construct import construct_obj_as
+from nisystemlink.clients.dataframe.models import PagedTableRows, PagedTables
+from nisystemlink.clients.spec.models import QuerySpecifications
+from pydantic import parse_obj_as
+
+_REPEAT = 5
+
+
+def paged_table_rows(rows: int = 10000, columns: int = 8) -> Dict[str, Any]:
+    """Create a page of table rows like a response to ``query_table_data``."""
+    return {
+        "frame": {
+            "columns": ["column{}".format(column) for column in range(columns)],
+            "data": [
+                [str(row * columns + column) for column in range(columns)]
+                for row in range(rows)
+            ],
+        },
+        "totalRowCount": rows,
+        "continuationToken": None,
+    }
+
+
+def paged_tables(tables: int = 1000) -> Dict[str, Any]:
+    """Create a page of table metadata like a response to ``query_tables``."""
+    timestamp = "2023-01-01T12:00:00.123Z"
+    return {
+        "tables": [
+            {
+                "columns": [
+                    {"name": "index", "dataType": "INT64", "columnType": "INDEX"},
+                    {"name": "value", "dataType": "FLOAT64", "columnType": "NULLABLE"},
+                ],
+                "createdAt": timestamp,
+                "id": "table{}".format(table),
+                "metadataModifiedAt": timestamp,
+                "metadataRevision": 1,
+                "name": "Table {}".format(table),
+                "properties": {"key": "value"},
+                "rowCount": 100,
+                "rowsModifiedAt": timestamp,
+                "supportsAppend": True,
+                "workspace": "workspace",
+            }
+            for table in range(tables)
+        ],
+        "continuationToken": None,
+    }
+
+
+def query_specifications(specs: int = 2000) -> Dict[str, Any]:
+    """Create a page of specifications like a response to ``query_specs``."""
+    return {
+        "specs": [
+            {
+                "id": str(spec),
+                "productId": "product",
+                "specId": "spec{}".format(spec),
+                "version": 0,
+                "type": "PARAMETRIC",
+                "name": "Specification {}".format(spec),
+                "limit": {"min": 0.5, "max": 10},
+                "unit": "V",
+                "conditions": [
+                    {
+                        "name": "temperature",
+                        "value": {
+                            "conditionType": "NUMERIC",
+                            "discrete": [25, 85],
+                            "range": [{"min": -40, "max": 125, "step": 5}],
+                            "unit": "C",
+                        },
+                    }
+                ],
+                "keywords": ["keyword"],
+                "properties": {"key": "value"},
+                "workspace": "workspace",
+                "createdAt": "2023-01-01T12:00:00Z",
+                "createdBy": "user",
+            }
+            for spec in range(specs)
+        ],
+        "continuationToken": None,
+    }
+
+
+_CASES = [
+    ("PagedTableRows (10k rows x 8 columns)", PagedTableRows, paged_table_rows),
+    ("PagedTables (1k tables)", PagedTables, paged_tables),
+    ("QuerySpecifications (2k specs)", QuerySpecifications, query_specifications),
+]  # type: List[Tuple[str, Type, Callable[[], Dict[str, Any]]]]
+
+
+def _best_time(function: Callable[[], Any]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=_REPEAT))
+
+
+def main() -> None:
+    """Print the decode time of each model with and without validation."""
+    print(
+        "{:<40} {:>12} {:>12} {:>8}".format("Model", "Validated", "Trusted", "Speedup")
+    )
+    for name, model, create_payload in _CASES:
+        payload = create_payload()
+        validated = _best_time(lambda: parse_obj_as(model, payload))
+        trusted = _best_time(lambda: construct_obj_as(model, payload))
+        print(
+            "{:<40} {:>10.2f}ms {:>10.2f}ms {:>7.1f}x".format(
+                name, validated * 1000, trusted * 1000, validated / trusted
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
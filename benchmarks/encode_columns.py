@@ -0,0 +1,67 @@
+"""Compare ways of encoding a FLOAT64 column as strings for appending rows.
+
+Run with ``poetry run poe benchmark-encoding`` or
+``python benchmarks/encode_columns.py``. Each formatter writes the shortest
+string that converts back to the same double. ``encode_column`` uses the fastest,
+and the benchmark checks that every formatter produces the same strings.
+"""
+
+import timeit
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+from nisystemlink.clients.dataframe.columnar import encode_column, TypedColumn
+from nisystemlink.clients.dataframe.models import DataType
+
+_REPEAT = 5
+_ROWS = 1000000
+
+
+def _values(kind: str) -> np.ndarray:
+    random = np.random.default_rng(0)
+    if kind == "measurements":
+        return random.normal(size=_ROWS)
+    return random.integers(-(10**6), 10**6, _ROWS).astype(np.float64)
+
+
+_FORMATTERS = [
+    (
+        "repr per value, list comprehension",
+        lambda values: np.array([repr(v) for v in values.tolist()], dtype=object),
+    ),
+    (
+        "repr per value, map",
+        lambda values: np.array(list(map(repr, values.tolist())), dtype=object),
+    ),
+    ("ndarray.astype(str)", lambda values: values.astype(str)),
+    ('np.char.mod("%s")', lambda values: np.char.mod("%s", values)),
+    (
+        "encode_column",
+        lambda values: encode_column(TypedColumn("value", DataType.Float64, values)),
+    ),
+]  # type: List[Tuple[str, Callable[[np.ndarray], Any]]]
+
+
+def _best_time(function: Callable[[], Any]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=_REPEAT))
+
+
+def main() -> None:
+    """Print the time each formatter takes to encode a million values."""
+    print("{:<40} {:>14} {:>14}".format("Formatter", "Measurements", "Integers"))
+    for name, formatter in _FORMATTERS:
+        times = []
+        for kind in ("measurements", "integers"):
+            values = _values(kind)
+            expected = [repr(value) for value in values.tolist()]
+            assert formatter(values).tolist() == expected, name
+            times.append(_best_time(lambda: formatter(values)))
+        print(
+            "{:<40} {:>12.0f}ms {:>12.0f}ms".format(
+                name, times[0] * 1000, times[1] * 1000
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
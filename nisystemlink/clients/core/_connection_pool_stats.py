@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of ConnectionPoolStats."""
+
+from typing import NamedTuple
+
+
+class ConnectionPoolStats(NamedTuple):
+    """A snapshot of the HTTP connections held by a client such as a ``TagManager``."""
+
+    clients: int
+    """The number of pooled HTTP clients, one for each thread or event loop that has
+    made requests."""
+
+    open_connections: int
+    """The number of connections that are open, whether or not they are in use."""
+
+    idle_connections: int
+    """The number of open connections that are not in use and can be reused."""
+
+    created_connections: int
+    """The number of connections that have been opened, including those since closed."""
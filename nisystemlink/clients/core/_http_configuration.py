@@ -73,6 +73,12 @@ class HttpConfiguration:
 
         self._workspace = workspace
 
+        self._connection_pool_size = None  # type: Optional[int]
+        self._max_connections_per_host = None  # type: Optional[int]
+        self._keep_alive = True
+        self._share_connections = False
+        self._http2 = False
+
     @property
     def timeout_milliseconds(self) -> int:  # noqa: D401
         """The number of milliseconds before a request times out with an error.
@@ -100,6 +106,108 @@ class HttpConfiguration:
     def user_agent(self, value: Optional[str]) -> None:
         self._user_agent = value
 
+    @property
+    def connection_pool_size(self) -> Optional[int]:  # noqa: D401
+        """The number of connections to the server to keep open for reuse, or None to
+        use the HTTP library's default.
+
+        The defaults are 10 for clients such as ``DataFrameClient`` and 20 for
+        ``TagManager``. Threads or tasks making requests at the same time each need
+        a connection, so a pool smaller than the number of concurrent requests causes
+        connections to be opened and closed repeatedly.
+
+        Changing the pool size will not affect APIs that have already read the
+        configuration.
+        """
+        return self._connection_pool_size
+
+    @connection_pool_size.setter
+    def connection_pool_size(self, value: Optional[int]) -> None:
+        if value is not None and value <= 0:
+            raise ValueError("connection_pool_size cannot be 0 or negative")
+        self._connection_pool_size = value
+
+    @property
+    def max_connections_per_host(self) -> Optional[int]:  # noqa: D401
+        """The largest number of connections to open to the server at once, or None to
+        use the HTTP library's default.
+
+        When this many connections are in use, a request waits for one of them to be
+        free. By default, clients such as ``DataFrameClient`` open as many
+        connections as needed, and ``TagManager`` opens up to 100 per thread or event
+        loop. Clients such as ``DataFrameClient`` can only limit the number of
+        connections they keep, so for them this value replaces
+        :attr:`connection_pool_size`.
+
+        Changing the limit will not affect APIs that have already read the
+        configuration.
+        """
+        return self._max_connections_per_host
+
+    @max_connections_per_host.setter
+    def max_connections_per_host(self, value: Optional[int]) -> None:
+        if value is not None and value <= 0:
+            raise ValueError("max_connections_per_host cannot be 0 or negative")
+        self._max_connections_per_host = value
+
+    @property
+    def keep_alive(self) -> bool:  # noqa: D401
+        """Whether to keep connections open after a request so that later requests can
+        reuse them. Defaults to True.
+
+        When disabled, each connection is closed once its response has been read.
+        With :attr:`http2`, this also applies to HTTP/2 connections, so concurrent
+        requests may still share a connection but it isn't kept for later ones.
+
+        Changing the setting will not affect APIs that have already read the
+        configuration.
+        """
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value: bool) -> None:
+        self._keep_alive = value
+
+    @property
+    def share_connections(self) -> bool:  # noqa: D401
+        """Whether the clients created with this configuration share their connections
+        to the server. Defaults to False.
+
+        When enabled, clients such as ``DataFrameClient``, ``FileClient``, and
+        ``SpecClient`` created with this configuration object use one pool of
+        connections, and ``TagManager`` and ``AsyncDataFrameClient`` use another,
+        rather than each opening its own. The pools are closed once every client
+        sharing them has been closed or garbage collected.
+
+        Changing the setting will not affect APIs that have already read the
+        configuration.
+        """
+        return self._share_connections
+
+    @share_connections.setter
+    def share_connections(self, value: bool) -> None:
+        self._share_connections = value
+
+    @property
+    def http2(self) -> bool:  # noqa: D401
+        """Whether to use HTTP/2 with servers that support it. Defaults to False.
+
+        With HTTP/2, many concurrent requests share a few connections instead of
+        each needing its own. Clients such as ``DataFrameClient`` then send requests
+        with ``httpx`` instead of ``requests``. Requires the ``http2`` extra
+        (``pip install "nisystemlink-clients[http2]"``). Servers that only support
+        HTTP/1.1, and servers reached over plain ``http``, are still sent HTTP/1.1
+        requests.
+
+        Changing the setting will not affect APIs that have already read the
+        configuration.
+        """
+        return self._http2
+
+    @http2.setter
+    def http2(self, value: bool) -> None:
+        self._http2 = value
+
     @property
     def api_keys(self) -> Optional[Dict[str, str]]:  # noqa: D401
         """The available API keys to use for authorization, or None if none were provided."""
@@ -2,72 +2,328 @@
 
 """Implementation of HttpClient."""
 
+import asyncio
 import json.decoder
 import sys
 import threading
 import typing
 import urllib.parse
-from typing import Any, Awaitable, Dict, Iterable, Optional, Tuple, Union
-
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from httpx import AsyncClient, Client, Limits, Response as HttpResponse
 from nisystemlink.clients import core
 
-if sys.version_info >= (3, 6):
-    from httpx import AsyncClient, Client, Response as HttpResponse
-else:
-    from requests import Session as Client, Response as HttpResponse
+from ._pooled_transport import AsyncPooledTransport, PooledTransport
+from ._shared_connections import SharedConnections
+
 
-    AsyncClient = None  # type: Any
+# The limits httpx uses by default.
+_DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=20)
 
 
 class HttpClient:
     """Base client for HTTP connections."""
 
-    def __init__(self, configuration: core.HttpConfiguration) -> None:
+    DEFAULT_MAX_CLIENTS = 32
+    """The default number of per-thread clients to keep before closing those of
+    threads that have ended."""
+
+    def __init__(
+        self,
+        configuration: core.HttpConfiguration,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+    ) -> None:
+        """Initialize an instance.
+
+        If the configuration shares connections, instances for the same
+        configuration use the same clients, and those are closed once every instance
+        has been closed or garbage collected. A closed instance can't be used.
+
+        Args:
+            configuration: Defines the web server to connect to and information about
+                how to connect.
+            max_clients: The number of per-thread clients to keep before closing
+                those of threads that have ended. When a thread needs a new client
+                and this many are kept, the clients of ended threads are closed. The
+                clients of live threads are never closed, so more than this many are
+                kept while more threads are alive.
+
+        Raises:
+            ValueError: if ``max_clients`` is 0 or negative.
+        """
+        if max_clients <= 0:
+            raise ValueError("max_clients cannot be 0 or negative")
         self._server = configuration.server_uri.rstrip("/")
 
-        self._kwargs = {}  # type: Dict[str, Any]
-        self._kwargs["headers"] = {
+        kwargs = {}  # type: Dict[str, Any]
+        kwargs["headers"] = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
         if configuration.api_keys is not None:
-            self._kwargs["headers"].update(configuration.api_keys)
+            kwargs["headers"].update(configuration.api_keys)
         elif configuration.username is not None and configuration.password is not None:
-            self._kwargs["auth"] = (configuration.username, configuration.password)
+            kwargs["auth"] = (configuration.username, configuration.password)
+        transport_kwargs = {}  # type: Dict[str, Any]
         if configuration.cert_path:
-            self._kwargs["verify"] = str(configuration.cert_path)
-
-        # Keep a client per thread
-        # - https://toolbelt.readthedocs.io/en/latest/threading.html
-        # - "there are still a couple corner cases where it isn't perfectly threadsafe"
-        self._clients = {}  # type: Dict[int, Client]
-        self._aclients = {}  # type: Dict[int, AsyncClient]
+            kwargs["verify"] = str(configuration.cert_path)
+            transport_kwargs["verify"] = str(configuration.cert_path)
+        transport_kwargs["limits"] = _limits(configuration)
+        if configuration.http2:
+            _import_h2()
+            transport_kwargs["http2"] = True
+        if not configuration.keep_alive:
+            kwargs["headers"]["Connection"] = "close"
+
+        def create_pool() -> _ClientPool:
+            return _ClientPool(kwargs, transport_kwargs, max_clients)
+
+        self._shared = configuration.share_connections
+        self._released = False
+        if self._shared:
+            shared = SharedConnections.acquire(configuration)
+            self.__pool = shared.pool("httpx", create_pool, _ClientPool.close)
+            self._close = weakref.finalize(
+                self, shared.release
+            )  # type: Callable[[], Any]
+        else:
+            self.__pool = create_pool()
+            self._close = self.__pool.close
 
     def at_uri(self, uri: str) -> "_HttpClientAtUri":
         """Get a client interface for which all queries are relative to ``uri``."""
         return _HttpClientAtUri(self, self._server + uri)
 
+    def pool_stats(self) -> core.ConnectionPoolStats:
+        """Get a snapshot of the clients and connections in use."""
+        return self._pool.stats()
+
+    def close(self) -> None:
+        """Close the clients of all threads and their connections.
+
+        The async clients are dropped without waiting for their connections to close;
+        call :meth:`aclose` on each event loop to close them first. A later request
+        opens a new client.
+
+        If the configuration shares connections, this instead releases the instance's
+        share of them, and the clients are closed once every instance sharing them
+        has been released. The instance can't be used afterwards.
+        """
+        self._close()
+        if self._shared:
+            self._released = True
+
+    async def aclose(self) -> None:
+        """Close the async client used by the running event loop and its connections.
+
+        A later async request on the same loop opens a new client. Does nothing if
+        the instance's share of connections has been released.
+        """
+        if not self._released:
+            await self._pool.aclose()
+
+    @property
+    def _pool(self) -> "_ClientPool":
+        if self._released:
+            raise ReferenceError("HttpClient")
+        return self.__pool
+
     @property
     def _client(self) -> Client:
-        thread_id = threading.get_ident()
-        if thread_id not in self._clients:
-            if sys.version_info >= (3, 6):
-                client = Client(**self._kwargs)
-            else:
-                client = Client()
-                for k, v in self._kwargs.items():
-                    setattr(client, k, v)
-            self._clients[thread_id] = client
-        return self._clients[thread_id]
+        return self._pool.client
 
     @property
     def _async_client(self) -> AsyncClient:
+        if sys.version_info < (3, 6):
+            raise RuntimeError("async support is only available for python 3.6+")
+        return self._pool.async_client
+
+
+class _ClientPool:
+    """The clients of each thread and event loop that make requests to a server."""
+
+    def __init__(
+        self,
+        kwargs: Dict[str, Any],
+        transport_kwargs: Dict[str, Any],
+        max_clients: int,
+    ) -> None:
+        self._kwargs = kwargs
+        self._transport_kwargs = transport_kwargs
+        self._max_clients = max_clients
+
+        # Keep a client per thread
+        # - https://toolbelt.readthedocs.io/en/latest/threading.html
+        # - "there are still a couple corner cases where it isn't perfectly threadsafe"
+        self._clients = (
+            {}
+        )  # type: Dict[int, Tuple[threading.Thread, Client, PooledTransport]]
+
+        # Keep an async client per event loop, since an AsyncClient's connections can
+        # only be used by the loop that opened them. The connections refer to their
+        # loop, so a client is dropped once its loop has closed.
+        self._aclients = (
+            {}
+        )  # type: Dict[asyncio.AbstractEventLoop, Tuple[AsyncClient, AsyncPooledTransport]]
+
+        self._lock = threading.Lock()
+        self._closed_created_connections = 0
+
+    def stats(self) -> core.ConnectionPoolStats:
+        """Get a snapshot of the clients and connections in the pool."""
+        with self._lock:
+            self._drop_closed_loops_locked()
+            counters = [transport.counter for _, _, transport in self._clients.values()]
+            counters += [transport.counter for _, transport in self._aclients.values()]
+            closed_created_connections = self._closed_created_connections
+        return core.ConnectionPoolStats(
+            clients=len(counters),
+            open_connections=sum(c.open_connections for c in counters),
+            idle_connections=sum(c.idle_connections for c in counters),
+            created_connections=closed_created_connections
+            + sum(c.created_connections for c in counters),
+        )
+
+    def close(self) -> None:
+        """Close the clients of all threads and their connections.
+
+        The async clients are dropped without waiting for their connections to close.
+        A later request opens a new client.
+        """
+        with self._lock:
+            clients = [
+                (client, transport) for _, client, transport in self._clients.values()
+            ]
+            self._clients.clear()
+            counters = [transport.counter for _, transport in clients]
+            counters += [transport.counter for _, transport in self._aclients.values()]
+            self._closed_created_connections += sum(
+                c.created_connections for c in counters
+            )
+            self._aclients.clear()
+        self._close_clients(clients)
+
+    async def aclose(self) -> None:
+        """Close the async client used by the running event loop and its connections.
+
+        A later async request on the same loop opens a new client.
+        """
+        with self._lock:
+            entry = self._aclients.pop(asyncio.get_running_loop(), None)
+            if entry is not None:
+                self._closed_created_connections += entry[1].counter.created_connections
+        if entry is not None:
+            await entry[0].aclose()
+
+    @property
+    def client(self) -> Client:
+        """The current thread's client."""
+        thread = threading.current_thread()
         thread_id = threading.get_ident()
-        if thread_id not in self._clients:
-            if sys.version_info < (3, 6):
-                raise RuntimeError("async support is only available for python 3.6+")
-            self._aclients[thread_id] = AsyncClient(**self._kwargs)
-        return self._aclients[thread_id]
+        with self._lock:
+            entry = self._clients.get(thread_id)
+            # A thread id can be reused once its thread has ended.
+            if entry is not None and entry[0] is thread:
+                return entry[1]
+            evicted = self._evict_locked(replaced=entry)
+            transport = PooledTransport(**self._transport_kwargs)
+            client = Client(transport=transport, **self._kwargs)
+            self._clients[thread_id] = (thread, client, transport)
+        self._close_clients(evicted)
+        return client
+
+    @property
+    def async_client(self) -> AsyncClient:
+        """The running event loop's client."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._drop_closed_loops_locked()
+            entry = self._aclients.get(loop)
+            if entry is None:
+                transport = AsyncPooledTransport(**self._transport_kwargs)
+                entry = (AsyncClient(transport=transport, **self._kwargs), transport)
+                self._aclients[loop] = entry
+        return entry[0]
+
+    def _drop_closed_loops_locked(self) -> None:
+        """Drop the async clients of event loops that have closed.
+
+        Their connections can no longer be closed cleanly, so their sockets are
+        closed when they are garbage collected.
+        """
+        for loop, (_, transport) in list(self._aclients.items()):
+            if loop.is_closed():
+                del self._aclients[loop]
+                self._closed_created_connections += (
+                    transport.counter.created_connections
+                )
+
+    def _evict_locked(
+        self, replaced: Optional[Tuple[threading.Thread, Client, PooledTransport]]
+    ) -> List[Tuple[Client, PooledTransport]]:
+        """Remove the clients to close before a client is added for the current thread."""
+        evicted = []  # type: List[Tuple[Client, PooledTransport]]
+        if replaced is not None:
+            del self._clients[threading.get_ident()]
+            evicted.append((replaced[1], replaced[2]))
+        if len(self._clients) >= self._max_clients:
+            # Only the clients of ended threads are closed, since a live thread may
+            # be about to use its client, even if that leaves more than max_clients.
+            for thread_id, (thread, client, transport) in list(self._clients.items()):
+                if not thread.is_alive():
+                    del self._clients[thread_id]
+                    evicted.append((client, transport))
+        for _, transport in evicted:
+            self._closed_created_connections += transport.counter.created_connections
+        return evicted
+
+    @staticmethod
+    def _close_clients(clients: List[Tuple[Client, PooledTransport]]) -> None:
+        for client, _ in clients:
+            client.close()
+
+
+def _import_h2() -> Any:
+    try:
+        import h2
+    except ImportError as ex:
+        raise ImportError(
+            "HTTP/2 requires the h2 package. Install it with "
+            'pip install "nisystemlink-clients[http2]".'
+        ) from ex
+    return h2
+
+
+def _limits(configuration: core.HttpConfiguration) -> Limits:
+    """Get the limits of a client's pool of connections."""
+    max_connections = configuration.max_connections_per_host
+    pool_size = configuration.connection_pool_size
+    if not configuration.keep_alive:
+        pool_size = 0
+    return Limits(
+        max_connections=(
+            _DEFAULT_LIMITS.max_connections
+            if max_connections is None
+            else max_connections
+        ),
+        max_keepalive_connections=(
+            _DEFAULT_LIMITS.max_keepalive_connections
+            if pool_size is None
+            else pool_size
+        ),
+        keepalive_expiry=_DEFAULT_LIMITS.keepalive_expiry,
+    )
 
 
 class _HttpClientAtUri:
@@ -89,7 +345,7 @@ class _HttpClientAtUri:
         method: str,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Tuple[Any, HttpResponse]:
         client = self._client._client
@@ -98,19 +354,19 @@ class _HttpClientAtUri:
         return _handle_response(response, method, uri), response
 
     def get(
-        self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
+        self, uri: str, *, params: Optional[Dict[str, Any]] = None
     ) -> Tuple[Any, HttpResponse]:
         """Perform a GET request."""
         return self._request("GET", self._base_uri + uri, params=params)
 
     def head(
-        self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
+        self, uri: str, *, params: Optional[Dict[str, Any]] = None
     ) -> Tuple[Any, HttpResponse]:
         """Perform a HEAD request."""
         return self._request("HEAD", self._base_uri + uri, params=params)
 
     def delete(
-        self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
+        self, uri: str, *, params: Optional[Dict[str, Any]] = None
     ) -> Tuple[Any, HttpResponse]:
         """Perform a DELETE request."""
         return self._request("DELETE", self._base_uri + uri, params=params)
@@ -119,7 +375,7 @@ class _HttpClientAtUri:
         self,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Tuple[Any, HttpResponse]:
         """Perform a POST request."""
@@ -129,7 +385,7 @@ class _HttpClientAtUri:
         self,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Tuple[Any, HttpResponse]:
         """Perform a PUT request."""
@@ -139,7 +395,7 @@ class _HttpClientAtUri:
         self,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Tuple[Any, HttpResponse]:
         """Perform a PATCH request."""
@@ -162,7 +418,7 @@ class _AsyncHttpClientAtUri:
         method: str,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Tuple[Any, HttpResponse]:
         client = self._client._async_client
@@ -171,19 +427,19 @@ class _AsyncHttpClientAtUri:
         return _handle_response(response, method, uri), response
 
     def get(
-        self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
+        self, uri: str, *, params: Optional[Dict[str, Any]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a GET request."""
         return self._request("GET", self._base_uri + uri, params=params)
 
     def head(
-        self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
+        self, uri: str, *, params: Optional[Dict[str, Any]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a HEAD request."""
         return self._request("HEAD", self._base_uri + uri, params=params)
 
     def delete(
-        self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
+        self, uri: str, *, params: Optional[Dict[str, Any]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a DELETE request."""
         return self._request("DELETE", self._base_uri + uri, params=params)
@@ -192,7 +448,7 @@ class _AsyncHttpClientAtUri:
         self,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a POST request."""
@@ -202,7 +458,7 @@ class _AsyncHttpClientAtUri:
         self,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a PUT request."""
@@ -212,7 +468,7 @@ class _AsyncHttpClientAtUri:
         self,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a PATCH request."""
@@ -224,8 +480,8 @@ class _AsyncHttpClientAtUri:
 
 
 def _expand_uri_params(
-    uri: str, params: Optional[Dict[str, Optional[str]]]
-) -> Tuple[str, Optional[Dict[str, str]]]:
+    uri: str, params: Optional[Dict[str, Any]]
+) -> Tuple[str, Optional[Dict[str, Any]]]:
     """Expand any params in uri with a url-encoded version of the corresponding value in ``params``.
 
     Any matched params will be removed from params. Any unmatched params will be left
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of LruCache."""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, List, Optional, TypeVar
+
+TKey = TypeVar("TKey", bound=Hashable)
+TValue = TypeVar("TValue")
+
+
+class LruCache(Generic[TKey, TValue]):
+    """A thread-safe mapping that holds a limited number of entries, discarding the
+    least recently used entry when full.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: The maximum number of entries to hold.
+
+        Raises:
+            ValueError: if ``max_entries`` is less than one.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries cannot be 0 or negative")
+
+        self._max_entries = max_entries
+        self._entries = OrderedDict()  # type: OrderedDict[TKey, TValue]
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:  # noqa: D401
+        """The maximum number of entries held by the cache."""
+        return self._max_entries
+
+    def get(self, key: TKey) -> Optional[TValue]:
+        """Get the entry for a key, marking it as the most recently used entry.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value of the entry, or None if there is no entry for ``key``.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: TKey, value: TValue) -> None:
+        """Add or replace the entry for a key, evicting the least recently used
+        entry if the cache is full.
+
+        Args:
+            key: The key of the entry.
+            value: The value of the entry.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: TKey) -> Optional[TValue]:
+        """Remove the entry for a key.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value of the removed entry, or None if there was no entry for ``key``.
+        """
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def remove_if(self, predicate: Callable[[TKey, TValue], bool]) -> int:
+        """Remove every entry that matches a condition.
+
+        Args:
+            predicate: A function that returns True for each entry to remove.
+
+        Returns:
+            The number of entries removed.
+        """
+        with self._lock:
+            keys = [
+                key for key, value in self._entries.items() if predicate(key, value)
+            ]  # type: List[TKey]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+"""Helpers for following continuation tokens across pages of results."""
+
+import queue
+import threading
+import time
+from typing import Callable, Iterator, Optional, Sequence, TypeVar
+
+from nisystemlink.clients.core._uplink._json_model import JsonModel
+from nisystemlink.clients.core._uplink._with_paging import WithPaging
+
+TPage = TypeVar("TPage", bound=WithPaging)
+
+_POLL_INTERVAL_SECONDS = 0.1
+
+# The number of items per page whose size is measured to estimate the size of
+# every item.
+_SAMPLE_SIZE = 8
+
+
+def iterate_pages(
+    fetch_page: Callable[[Optional[str]], TPage],
+    continuation_token: Optional[str] = None,
+    prefetch: int = 0,
+) -> Iterator[TPage]:
+    """Iterate over every page of a paged query.
+
+    Args:
+        fetch_page: A function that retrieves the page for a continuation token.
+        continuation_token: The token of the first page to retrieve, or None to
+            start with the first page of results.
+        prefetch: The maximum number of pages to retrieve in the background ahead of
+            the page being processed by the caller. If 0, each page is only
+            requested once the caller has finished with the previous page.
+
+    Returns:
+        An iterator over the pages, in order.
+
+    Raises:
+        ValueError: if ``prefetch`` is negative.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch cannot be < 0")
+    if prefetch == 0:
+        return _iterate_pages(fetch_page, continuation_token)
+    return _iterate_pages_prefetched(fetch_page, continuation_token, prefetch)
+
+
+def _iterate_pages(
+    fetch_page: Callable[[Optional[str]], TPage], continuation_token: Optional[str]
+) -> Iterator[TPage]:
+    while True:
+        page = fetch_page(continuation_token)
+        yield page
+        continuation_token = page.continuation_token
+        if not continuation_token:
+            return
+
+
+def _iterate_pages_prefetched(
+    fetch_page: Callable[[Optional[str]], TPage],
+    continuation_token: Optional[str],
+    prefetch: int,
+) -> Iterator[TPage]:
+    # A background thread requests each page as soon as the previous one arrives,
+    # limited by a semaphore so that no more than ``prefetch`` pages are retrieved
+    # ahead of the caller. Results are passed back as (page, error) tuples, with
+    # (None, None) marking the end of the results.
+    results = queue.Queue()  # type: queue.Queue
+    slots = threading.Semaphore(prefetch)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        token = continuation_token
+        try:
+            while True:
+                while not slots.acquire(timeout=_POLL_INTERVAL_SECONDS):
+                    if stopped.is_set():
+                        return
+                if stopped.is_set():
+                    return
+                page = fetch_page(token)
+                results.put((page, None))
+                token = page.continuation_token
+                if not token:
+                    break
+        except Exception as ex:
+            results.put((None, ex))
+            return
+        results.put((None, None))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            page, error = results.get()
+            if error is not None:
+                raise error
+            if page is None:
+                return
+            slots.release()
+            yield page
+    finally:
+        stopped.set()
+
+
+class AdaptivePageSize:
+    """Chooses the number of items to request in each page of a paged query.
+
+    The page size doubles while pages take less than half of ``target_seconds``
+    to retrieve and halves when a page takes longer than ``target_seconds``. If
+    ``max_page_bytes`` is given, the page size is also limited so that a page's
+    items are estimated to fit in that many bytes, based on the size of the JSON of
+    a sample of the items retrieved so far.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        maximum: int,
+        target_seconds: float,
+        max_page_bytes: Optional[int] = None,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            initial: The number of items to request in the first page.
+            maximum: The largest number of items to request in a page.
+            target_seconds: How long retrieving a page should take.
+            max_page_bytes: The approximate maximum size of a page's items, in
+                bytes, or None to not limit the size of a page.
+
+        Raises:
+            ValueError: if ``initial``, ``maximum``, or ``max_page_bytes`` is less
+                than one, or ``target_seconds`` is not positive.
+        """
+        if initial < 1:
+            raise ValueError("initial cannot be 0 or negative")
+        if maximum < 1:
+            raise ValueError("maximum cannot be 0 or negative")
+        if target_seconds <= 0:
+            raise ValueError("target_seconds cannot be 0 or negative")
+        if max_page_bytes is not None and max_page_bytes < 1:
+            raise ValueError("max_page_bytes cannot be 0 or negative")
+
+        self._take = min(initial, maximum)
+        self._maximum = maximum
+        self._target_seconds = target_seconds
+        self._max_page_bytes = max_page_bytes
+        self._item_bytes = None  # type: Optional[float]
+
+    @property
+    def take(self) -> int:  # noqa: D401
+        """The number of items to request in the next page."""
+        return self._take
+
+    def update(self, items: Sequence[JsonModel], elapsed_seconds: float) -> None:
+        """Adjust the page size after retrieving a page.
+
+        Args:
+            items: The items in the page.
+            elapsed_seconds: How long the page took to retrieve.
+        """
+        take = self._take
+        if elapsed_seconds > self._target_seconds:
+            take //= 2
+        elif elapsed_seconds < self._target_seconds / 2 and len(items) >= take:
+            take *= 2
+
+        if items:
+            step = max(len(items) // _SAMPLE_SIZE, 1)
+            sample = items[::step][:_SAMPLE_SIZE]
+            item_bytes = sum(
+                len(item.json(by_alias=True, exclude_unset=True)) for item in sample
+            ) / len(sample)
+            # Average with earlier estimates, since the sample is small.
+            if self._item_bytes is not None:
+                item_bytes = (self._item_bytes + item_bytes) / 2
+            self._item_bytes = item_bytes
+        if self._max_page_bytes is not None and self._item_bytes:
+            take = min(take, int(self._max_page_bytes // self._item_bytes))
+
+        self._take = min(max(take, 1), self._maximum)
+
+
+def iterate_pages_adaptively(
+    fetch_page: Callable[[Optional[str], int], TPage],
+    get_items: Callable[[TPage], Sequence[JsonModel]],
+    page_size: AdaptivePageSize,
+    continuation_token: Optional[str] = None,
+) -> Iterator[TPage]:
+    """Iterate over every page of a paged query, choosing the size of each page
+    with ``page_size``.
+
+    Args:
+        fetch_page: A function that retrieves the page for a continuation token,
+            with the given maximum number of items.
+        get_items: A function that returns the items in a page.
+        page_size: Chooses the size of each page.
+        continuation_token: The token of the first page to retrieve, or None to
+            start with the first page of results.
+
+    Returns:
+        An iterator over the pages, in order.
+    """
+    while True:
+        start = time.monotonic()
+        page = fetch_page(continuation_token, page_size.take)
+        page_size.update(get_items(page), time.monotonic() - start)
+        yield page
+        continuation_token = page.continuation_token
+        if not continuation_token:
+            return
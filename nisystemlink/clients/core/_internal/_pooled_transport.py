@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of PooledTransport and AsyncPooledTransport."""
+
+from typing import Any, Iterable
+
+from httpx import AsyncHTTPTransport, HTTPTransport
+
+
+class _ConnectionCounter:
+    """Counts the connections a transport's pool opens and reports their state."""
+
+    def __init__(self, pool: Any) -> None:
+        self.created_connections = 0
+        self._pool = pool
+        create_connection = pool.create_connection
+
+        def _create_connection(origin: Any) -> Any:
+            self.created_connections += 1
+            return create_connection(origin)
+
+        pool.create_connection = _create_connection
+
+    @property
+    def open_connections(self) -> int:
+        return sum(1 for c in self._connections() if not c.is_closed())
+
+    @property
+    def idle_connections(self) -> int:
+        return sum(1 for c in self._connections() if c.is_idle() and not c.is_closed())
+
+    def _connections(self) -> Iterable[Any]:
+        # Copy the list, since other threads may add or remove connections.
+        return list(self._pool.connections)
+
+
+class PooledTransport(HTTPTransport):
+    """An ``httpx.HTTPTransport`` that reports on its pool of connections."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.counter = _ConnectionCounter(self._pool)
+
+
+class AsyncPooledTransport(AsyncHTTPTransport):
+    """An ``httpx.AsyncHTTPTransport`` that reports on its pool of connections."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.counter = _ConnectionCounter(self._pool)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of SharedConnections."""
+
+import threading
+import weakref
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from nisystemlink.clients import core
+
+_T = TypeVar("_T")
+
+
+class SharedConnections:
+    """The pools of connections shared by the clients created from one configuration.
+
+    Clients built on ``requests`` and those built on ``httpx`` cannot use each other's
+    connections, so each kind of client has a pool of its own, created when the
+    first client of that kind needs it. The pools are closed once every client that
+    acquired them has released them.
+    """
+
+    _registry = (
+        weakref.WeakKeyDictionary()
+    )  # type: weakref.WeakKeyDictionary[core.HttpConfiguration, SharedConnections]
+    # Reentrant, since garbage collection while the lock is held, such as while a
+    # pool is created, may release another client's connections on the same thread.
+    _lock = threading.RLock()
+
+    def __init__(self, configuration: core.HttpConfiguration) -> None:
+        self._configuration = weakref.ref(configuration)
+        self._references = 0
+        self._pools = {}  # type: Dict[str, Tuple[Any, Callable[[], None]]]
+
+    @classmethod
+    def acquire(cls, configuration: core.HttpConfiguration) -> "SharedConnections":
+        """Get the connections shared by the clients of ``configuration`` and add a
+        reference to them.
+
+        Each call must be matched by a call to :meth:`release`.
+        """
+        with cls._lock:
+            shared = cls._registry.get(configuration)
+            if shared is None:
+                shared = cls(configuration)
+                cls._registry[configuration] = shared
+            shared._references += 1
+            return shared
+
+    def release(self) -> None:
+        """Remove a reference, closing the pools when none remain."""
+        with self._lock:
+            self._references -= 1
+            if self._references > 0:
+                return
+            configuration = self._configuration()
+            if configuration is not None and self._registry.get(configuration) is self:
+                del self._registry[configuration]
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for _, close in pools:
+            close()
+
+    def pool(
+        self, name: str, create: Callable[[], _T], close: Callable[[_T], Any]
+    ) -> _T:
+        """Get the pool called ``name``, creating it if needed.
+
+        Args:
+            name: The name of the pool, which identifies the kind of client using it.
+            create: Creates the pool.
+            close: Closes the pool once no references remain.
+
+        Returns:
+            The pool.
+        """
+        with self._lock:
+            if name not in self._pools:
+                pool = create()
+                self._pools[name] = (pool, lambda: close(pool))
+            return self._pools[name][0]
@@ -1,16 +1,37 @@
 # mypy: disable-error-code = misc
 
+import weakref
 from json import loads
-from typing import Any, Callable, Dict, get_origin, Optional, Type, Union
-
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    get_origin,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import httpx
 from nisystemlink.clients import core
+from nisystemlink.clients.core._internal._http_client import _import_h2, _limits
+from nisystemlink.clients.core._internal._shared_connections import SharedConnections
 from pydantic import parse_obj_as
-from requests import JSONDecodeError, Response
+from requests import JSONDecodeError, Response, Session
+from requests.adapters import BaseAdapter, HTTPAdapter
 from uplink import commands, Consumer, converters, response_handler, utils
 
+from ._compression import CompressingAdapter
+from ._construct import construct_obj_as
+from ._httpx_adapter import HttpxAdapter
 from ._json_model import JsonModel
 
 
+_T = TypeVar("_T", bound="BaseClient")
+
+
 @response_handler
 def _handle_http_status(response: Response) -> Optional[Response]:
     """Checks an HTTP response's status code and raises an exception if necessary."""
@@ -40,7 +61,37 @@ def _handle_http_status(response: Response) -> Optional[Response]:
         raise core.ApiException(msg, http_status_code=response.status_code)
 
 
+def _adapter_kwargs(configuration: core.HttpConfiguration) -> Dict[str, Any]:
+    """Get the arguments for a transport adapter that pools connections as configured."""
+    kwargs = {}  # type: Dict[str, Any]
+    pool_size = configuration.connection_pool_size
+    max_connections = configuration.max_connections_per_host
+    if max_connections is not None:
+        # urllib3 only limits the number of connections when its pool blocks, and
+        # then the limit is the pool size.
+        pool_size = max_connections
+        kwargs["pool_block"] = True
+    if pool_size is not None:
+        kwargs["pool_maxsize"] = pool_size
+    return kwargs
+
+
+def _create_httpx_client(configuration: core.HttpConfiguration) -> httpx.Client:
+    """Create a client that sends requests over HTTP/2 where the server supports it."""
+    _import_h2()
+    return httpx.Client(
+        http2=True,
+        limits=_limits(configuration),
+        verify=str(configuration.cert_path) if configuration.cert_path else True,
+    )
+
+
 class _JsonModelConverter(converters.Factory):
+    def __init__(self, trusted_responses: bool = False) -> None:
+        self._parse = parse_obj_as  # type: Callable[[Type, Any], Any]
+        if trusted_responses:
+            self._parse = construct_obj_as
+
     def create_request_body_converter(
         self, _class: Type, _: commands.RequestDefinition
     ) -> Optional[Callable[[JsonModel], Dict]]:
@@ -55,13 +106,15 @@ class _JsonModelConverter(converters.Factory):
     def create_response_body_converter(
         self, _class: Type, _: commands.RequestDefinition
     ) -> Optional[Callable[[Response], Any]]:
+        parse = self._parse
+
         def decoder(response: Response) -> Any:
             try:
                 data = response.json()
             except AttributeError:
                 data = response
 
-            return parse_obj_as(_class, data)
+            return parse(_class, data)
 
         if get_origin(_class) is Union or utils.is_subclass(_class, JsonModel):
             return decoder
@@ -72,17 +125,125 @@ class _JsonModelConverter(converters.Factory):
 class BaseClient(Consumer):
     """Base class for SystemLink clients, built on top of `Uplink <https://github.com/prkumar/uplink>`_."""
 
-    def __init__(self, configuration: core.HttpConfiguration, base_path: str = ""):
+    def __init__(
+        self,
+        configuration: core.HttpConfiguration,
+        base_path: str = "",
+        trusted_responses: bool = False,
+        request_compression: Optional[str] = None,
+    ):
         """Initialize an instance.
 
+        Responses compressed with gzip or deflate are always accepted, and are
+        decompressed as they are read, including streamed responses.
+
         Args:
             configuration: Defines the web server to connect to and information about how to connect.
             base_path: The base path for all API calls.
+            trusted_responses: Whether to build response models without validating
+                the response data. Decoding large responses is much faster, but
+                a malformed response results in a malformed model instead of an
+                error.
+            request_compression: The compression to apply to request bodies of at
+                least 1 KiB, either ``"gzip"`` or ``"deflate"``, or None to send
+                bodies uncompressed. The server must support the compression.
+
+        Raises:
+            ValueError: if ``request_compression`` is not supported.
         """
+        session = Session()
+        if configuration.http2:
+            adapter = self.__create_httpx_adapter(
+                configuration, session, request_compression
+            )  # type: Optional[BaseAdapter]
+        else:
+            adapter = self.__create_adapter(configuration, session, request_compression)
+
+        if adapter is not None:
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
         super().__init__(
             base_url=configuration.server_uri + base_path,
-            converter=_JsonModelConverter(),
+            client=session,
+            converter=_JsonModelConverter(trusted_responses),
             hooks=[_handle_http_status],
         )
         if configuration.api_keys:
             self.session.headers.update(configuration.api_keys)
+        if not configuration.keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def __create_adapter(
+        self,
+        configuration: core.HttpConfiguration,
+        session: Session,
+        request_compression: Optional[str],
+    ) -> Optional[HTTPAdapter]:
+        adapter_kwargs = _adapter_kwargs(configuration)
+        if not configuration.share_connections:
+            self.__close = session.close  # type: Callable[[], Any]
+            if request_compression is not None:
+                return CompressingAdapter(request_compression, **adapter_kwargs)
+            if adapter_kwargs:
+                return HTTPAdapter(**adapter_kwargs)
+            return None
+
+        shared = SharedConnections.acquire(configuration)
+        self.__close = weakref.finalize(self, shared.release)
+        shared_adapter = shared.pool(
+            "requests", lambda: HTTPAdapter(**adapter_kwargs), HTTPAdapter.close
+        )
+        if request_compression is None:
+            return shared_adapter
+        # Compress requests with an adapter of the client's own, but send them over
+        # the shared pool's connections.
+        adapter = CompressingAdapter(request_compression, **adapter_kwargs)
+        adapter.poolmanager.clear()
+        adapter.poolmanager = shared_adapter.poolmanager
+        return adapter
+
+    def __create_httpx_adapter(
+        self,
+        configuration: core.HttpConfiguration,
+        session: Session,
+        request_compression: Optional[str],
+    ) -> HttpxAdapter:
+        _import_h2()
+        if configuration.share_connections:
+            shared = SharedConnections.acquire(configuration)
+            client = shared.pool(
+                "requests-http2",
+                lambda: _create_httpx_client(configuration),
+                httpx.Client.close,
+            )
+            self.__close = weakref.finalize(self, shared.release)
+        else:
+            client = _create_httpx_client(configuration)
+
+            def close() -> None:
+                session.close()
+                client.close()
+
+            self.__close = close
+        return HttpxAdapter(client, request_compression)
+
+    def close(self) -> None:
+        """Close the client's connections to the server.
+
+        If the configuration shares connections, this instead releases the client's
+        share of them, and they are closed once every client sharing them has been
+        closed or garbage collected.
+        """
+        self.__close()
+
+    def __enter__(self: _T) -> _T:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,75 @@
+"""Compression of HTTP request bodies."""
+
+import gzip
+import zlib
+from typing import Any, Callable, Dict
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+# zlib's default level, which is much faster than gzip's default of 9 while
+# compressing almost as well.
+_COMPRESSION_LEVEL = 6
+
+_COMPRESSORS = {
+    "gzip": lambda body: gzip.compress(body, compresslevel=_COMPRESSION_LEVEL),
+    "deflate": lambda body: zlib.compress(body, _COMPRESSION_LEVEL),
+}  # type: Dict[str, Callable[[bytes], bytes]]
+
+
+class CompressingAdapter(HTTPAdapter):
+    """A transport adapter that compresses request bodies before sending them and
+    sets the ``Content-Encoding`` header to match.
+
+    Bodies smaller than ``min_size`` bytes, bodies that are streamed from a file or
+    iterator, and bodies that already have a ``Content-Encoding`` are sent
+    unchanged.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["_encoding", "_min_size"]
+
+    def __init__(self, encoding: str, min_size: int = 1024, **kwargs: Any) -> None:
+        """Initialize an adapter.
+
+        Args:
+            encoding: The compression to apply, either ``"gzip"`` or ``"deflate"``.
+            min_size: The size, in bytes, of the smallest body to compress.
+            kwargs: Arguments for :class:`requests.adapters.HTTPAdapter`.
+
+        Raises:
+            ValueError: if ``encoding`` is not supported.
+        """
+        check_encoding(encoding)
+
+        self._encoding = encoding
+        self._min_size = min_size
+        super().__init__(**kwargs)
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        """Compress the request's body, if appropriate, and send the request."""
+        compress_request(request, self._encoding, self._min_size)
+        return super().send(request, *args, **kwargs)
+
+
+def check_encoding(encoding: str) -> None:
+    """Raise a ValueError if request bodies cannot be compressed with ``encoding``."""
+    if encoding not in _COMPRESSORS:
+        raise ValueError("Unsupported compression: '{}'".format(encoding))
+
+
+def compress_request(request: PreparedRequest, encoding: str, min_size: int) -> None:
+    """Compress a request's body with ``encoding`` and set its ``Content-Encoding``,
+    unless the body is smaller than ``min_size`` bytes, is streamed, or is already
+    encoded.
+    """
+    body = request.body
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if (
+        isinstance(body, bytes)
+        and len(body) >= min_size
+        and "Content-Encoding" not in request.headers
+    ):
+        request.body = _COMPRESSORS[encoding](body)
+        request.headers["Content-Encoding"] = encoding
+        request.headers["Content-Length"] = str(len(request.body))
@@ -0,0 +1,167 @@
+"""Construction of models from trusted JSON data without full validation."""
+
+import datetime
+import threading
+from enum import Enum
+from typing import Any, Callable, Dict, get_args, get_origin, List, Type, Union
+
+from pydantic import BaseModel, parse_obj_as
+from pydantic.datetime_parse import parse_datetime
+
+_Builder = Callable[[Any], Any]
+
+
+def construct_obj_as(type_: Type, obj: Any) -> Any:
+    """Convert JSON data to ``type_`` without validating it.
+
+    Models are built the same way as by ``construct()``, skipping pydantic's
+    validation of each field. Container types are converted element by element,
+    strings, numbers, and booleans are used as-is, and other leaf values, such as
+    datetimes and enums, are converted directly. Unions of several types are
+    still validated with ``parse_obj_as``, since validation is what determines
+    which of the types is used. The data must already match ``type_``, as is the
+    case for responses from a trusted server. Invalid data produces an invalid
+    model rather than an error.
+
+    Args:
+        type_: The type to convert to.
+        obj: The decoded JSON data.
+
+    Returns:
+        The converted data.
+    """
+    return _builder(type_)(obj)
+
+
+_builders = {}  # type: Dict[Any, _Builder]
+_builders_lock = threading.RLock()
+
+
+def _builder(type_: Any) -> _Builder:
+    builder = _builders.get(type_)
+    if builder is None:
+        with _builders_lock:
+            builder = _builders.get(type_)
+            if builder is None:
+                builder = _create_builder(type_)
+                _builders[type_] = builder
+    return builder
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+def _float(obj: Any) -> Any:
+    # JSON numbers without a fractional part are decoded as int.
+    return float(obj) if type(obj) is int else obj
+
+
+def _datetime(obj: Any) -> Any:
+    # The service returns ISO-8601 timestamps, which are much faster to convert
+    # with fromisoformat than with pydantic's more general parser. Older versions
+    # of Python don't accept a "Z" suffix or every fractional second precision.
+    if type(obj) is str:
+        try:
+            return datetime.datetime.fromisoformat(
+                obj[:-1] + "+00:00" if obj.endswith("Z") else obj
+            )
+        except ValueError:
+            pass
+    return parse_datetime(obj)
+
+
+def _create_builder(type_: Any) -> _Builder:
+    origin = get_origin(type_)
+    if origin is Union:
+        args = [arg for arg in get_args(type_) if arg is not type(None)]  # noqa: E721
+        if len(args) == 1:
+            return _create_optional_builder(_builder(args[0]))
+        return lambda obj: parse_obj_as(type_, obj)
+    if origin in (list, List):
+        (item_type,) = get_args(type_) or (Any,)
+        return _create_list_builder(_builder(item_type))
+    if origin in (dict, Dict):
+        _, value_type = get_args(type_) or (Any, Any)
+        return _create_dict_builder(_builder(value_type))
+    if origin is not None:
+        return lambda obj: parse_obj_as(type_, obj)
+
+    if type_ is Any or type_ in (str, int, bool):
+        return _identity
+    if type_ is float:
+        return _float
+    if type_ is datetime.datetime:
+        return _datetime
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        return _create_model_builder(type_)
+    if isinstance(type_, type) and issubclass(type_, Enum):
+        return type_
+    return lambda obj: parse_obj_as(type_, obj)
+
+
+def _create_optional_builder(builder: _Builder) -> _Builder:
+    if builder is _identity:
+        return _identity
+
+    return lambda obj: None if obj is None else builder(obj)
+
+
+def _create_list_builder(item_builder: _Builder) -> _Builder:
+    if item_builder is _identity:
+        return _identity
+
+    def build(obj: Any) -> Any:
+        return [item_builder(item) for item in obj]
+
+    return build
+
+
+def _create_dict_builder(value_builder: _Builder) -> _Builder:
+    if value_builder is _identity:
+        return _identity
+
+    def build(obj: Any) -> Any:
+        return {key: value_builder(value) for key, value in obj.items()}
+
+    return build
+
+
+def _create_model_builder(model: Type[BaseModel]) -> _Builder:
+    # The builders for the fields are created on first use, since models may
+    # refer to themselves.
+    fields = None  # type: Any
+    has_private_attributes = bool(model.__private_attributes__)
+
+    def build(obj: Any) -> Any:
+        nonlocal fields
+        if fields is None:
+            fields = [
+                (field.name, field.alias, _builder(field.annotation), field)
+                for field in model.__fields__.values()
+            ]
+
+        # Equivalent to model.construct(), which is noticeably slower for models
+        # with many fields since it makes several passes over the fields.
+        values = {}
+        fields_set = set()
+        for name, alias, field_builder, field in fields:
+            if alias in obj:
+                value = obj[alias]
+            elif name in obj:
+                value = obj[name]
+            else:
+                if not field.required:
+                    values[name] = field.get_default()
+                continue
+            values[name] = None if value is None else field_builder(value)
+            fields_set.add(name)
+
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        if has_private_attributes:
+            instance._init_private_attributes()
+        return instance
+
+    return build
@@ -0,0 +1,161 @@
+"""A requests transport adapter that sends requests with httpx."""
+
+from typing import Any, Iterator, Mapping, Optional, Tuple, Union
+
+import httpx
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.exceptions import (
+    ChunkedEncodingError,
+    ConnectionError,
+    ConnectTimeout,
+    ReadTimeout,
+)
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ._compression import check_encoding, compress_request
+
+# Headers that only apply to a single HTTP/1.1 connection, which HTTP/2 forbids.
+# httpx manages connections itself, and decodes the encodings it supports, so the
+# defaults that requests sends for these are left out. Whether connections are kept
+# alive is instead set by the limits of the client's pool.
+_DROPPED_HEADERS = frozenset(
+    ["connection", "keep-alive", "proxy-connection", "upgrade", "accept-encoding"]
+)
+
+_READ_SIZE = 64 * 1024
+
+
+class HttpxAdapter(BaseAdapter):
+    """A transport adapter that sends requests over an ``httpx.Client``, which can
+    multiplex many concurrent requests over one HTTP/2 connection.
+
+    Certificate verification, client certificates, and proxies are configured on the
+    ``httpx.Client`` rather than per request. Response bodies are decompressed by
+    httpx as they are read.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        request_compression: Optional[str] = None,
+        min_size: int = 1024,
+    ) -> None:
+        """Initialize an adapter.
+
+        Args:
+            client: The client to send requests with. The adapter does not close it.
+            request_compression: The compression to apply to request bodies of at
+                least ``min_size`` bytes, either ``"gzip"`` or ``"deflate"``, or None
+                to send bodies uncompressed.
+            min_size: The size, in bytes, of the smallest body to compress.
+
+        Raises:
+            ValueError: if ``request_compression`` is not supported.
+        """
+        if request_compression is not None:
+            check_encoding(request_compression)
+        super().__init__()
+        self._client = client
+        self._encoding = request_compression
+        self._min_size = min_size
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        """Send a request and return its response, reading its body lazily."""
+        if self._encoding is not None:
+            compress_request(request, self._encoding, self._min_size)
+
+        body = request.body  # type: Any
+        if hasattr(body, "read"):
+            body = iter(lambda: request.body.read(_READ_SIZE), b"")  # type: ignore
+        headers = [
+            (name, value)
+            for name, value in request.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        httpx_request = self._client.build_request(
+            request.method or "GET",
+            request.url or "",
+            headers=headers,
+            content=body,
+            timeout=_timeout(timeout),
+        )
+        try:
+            httpx_response = self._client.send(httpx_request, stream=True)
+        except httpx.ConnectTimeout as ex:
+            raise ConnectTimeout(ex, request=request) from ex
+        except httpx.TimeoutException as ex:
+            raise ReadTimeout(ex, request=request) from ex
+        except httpx.TransportError as ex:
+            raise ConnectionError(ex, request=request) from ex
+
+        response = Response()
+        response.status_code = httpx_response.status_code
+        response.reason = httpx_response.reason_phrase
+        response.headers = CaseInsensitiveDict(httpx_response.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = _ResponseStream(httpx_response, request)
+        response.url = request.url or ""
+        response.request = request
+        response.connection = self  # type: ignore
+        return response
+
+    def close(self) -> None:
+        """Do nothing, since the client is owned by the caller."""
+
+
+class _ResponseStream:
+    """A file-like view of an httpx response's decoded body, for ``Response.raw``."""
+
+    def __init__(self, response: httpx.Response, request: PreparedRequest) -> None:
+        self._response = response
+        self._request = request
+        self._chunks = response.iter_bytes()  # type: Iterator[bytes]
+        self._buffer = b""
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        try:
+            if amt is None:
+                data = self._buffer + b"".join(self._chunks)
+                self._buffer = b""
+            else:
+                parts = [self._buffer]
+                size = len(self._buffer)
+                while size < amt:
+                    chunk = next(self._chunks, None)
+                    if chunk is None:
+                        break
+                    parts.append(chunk)
+                    size += len(chunk)
+                data = b"".join(parts)
+                data, self._buffer = data[:amt], data[amt:]
+        except httpx.TimeoutException as ex:
+            self.close()
+            raise ReadTimeout(ex, request=self._request) from ex
+        except httpx.HTTPError as ex:
+            self.close()
+            raise ChunkedEncodingError(ex, request=self._request) from ex
+        if not data:
+            self.close()
+        return data
+
+    def close(self) -> None:
+        self._response.close()
+
+
+def _timeout(
+    timeout: Union[None, float, Tuple[Optional[float], Optional[float]]]
+) -> httpx.Timeout:
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(None, connect=connect, read=read)
+    return httpx.Timeout(timeout)
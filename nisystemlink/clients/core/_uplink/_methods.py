@@ -9,6 +9,7 @@ from uplink import (
     response_handler as uplink_response_handler,
     returns,
 )
+from uplink.decorators import MethodAnnotation
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -67,3 +68,19 @@ def response_handler(
         return uplink_response_handler(handler, requires_consumer)(func)  # type: ignore
 
     return decorator
+
+
+class _StreamResponse(MethodAnnotation):
+    def modify_request(self, request_builder: Any) -> None:
+        request_builder.info["stream"] = True
+
+
+def stream() -> Callable[[F], F]:
+    """Annotation for a request whose response body is read incrementally by the
+    response handler, rather than downloaded in full before the handler is called.
+    """
+
+    def decorator(func: F) -> F:
+        return _StreamResponse()(func)  # type: ignore
+
+    return decorator
@@ -1,3 +1,7 @@
+from ._async_data_frame_client import AsyncDataFrameClient
+from ._buffered_table_writer import BufferedTableWriter
 from ._data_frame_client import DataFrameClient
+from ._decimated_data_cache import DecimatedDataCache
+from ._table_data_spool import TableDataSpool
 
 # flake8: noqa
@@ -0,0 +1,380 @@
+"""Implementation of AsyncDataFrameClient."""
+
+from json import loads
+from types import TracebackType
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._internal._http_client import (
+    _expand_uri_params,
+    _handle_response,
+    HttpClient,
+    HttpResponse,
+)
+from nisystemlink.clients.core._uplink._json_model import JsonModel
+
+from . import models
+
+
+def _encode(model: JsonModel) -> Dict[str, Any]:
+    return loads(model.json(by_alias=True, exclude_unset=True))
+
+
+class AsyncDataFrameClient:
+    """An asyncio-based client for the SystemLink DataFrame service.
+
+    Provides the same operations as :class:`DataFrameClient`, returning the same
+    models, as coroutines. Requests are sent with ``httpx.AsyncClient``, so many
+    requests can be in progress at once on a single event loop.
+    """
+
+    def __init__(self, configuration: Optional[core.HttpConfiguration] = None):
+        """Initialize an instance.
+
+        Args:
+            configuration: Defines the web server to connect to and information about
+                how to connect. If not provided, the
+                :class:`HttpConfigurationManager <nisystemlink.clients.core.HttpConfigurationManager>`
+                is used to obtain the configuration.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service.
+        """
+        if configuration is None:
+            configuration = core.HttpConfigurationManager.get_configuration()
+
+        self._http_client = HttpClient(configuration)
+        self._api = self._http_client.at_uri("/nidataframe/v1").as_async
+
+    async def aclose(self) -> None:
+        """Close the connections used by the running event loop.
+
+        Requests made on an event loop share a pool of connections to the server,
+        which is kept until the loop is closed or this method is called. The client
+        can still be used afterwards, with new connections.
+        """
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncDataFrameClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def api_info(self) -> models.ApiInfo:
+        """Get information about available API operations.
+
+        Returns:
+            Information about available API operations.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service.
+        """
+        data, _ = await self._api.get("")
+        return models.ApiInfo.parse_obj(data)
+
+    async def list_tables(
+        self,
+        take: Optional[int] = None,
+        id: Optional[List[str]] = None,
+        order_by: Optional[models.OrderBy] = None,
+        order_by_descending: Optional[bool] = None,
+        continuation_token: Optional[str] = None,
+        workspace: Optional[List[str]] = None,
+    ) -> models.PagedTables:
+        """Lists available tables on the SystemLink DataFrame service.
+
+        Args:
+            take: Limits the returned list to the specified number of results. Defaults to 1000.
+            id: List of table IDs to filter by.
+            order_by: The sort order of the returned list of tables.
+            order_by_descending: Whether to sort descending instead of ascending. Defaults to false.
+            continuation_token: The token used to paginate results.
+            workspace: List of workspace IDs to filter by.
+
+        Returns:
+            The list of tables with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.get(
+            "/tables",
+            params={
+                "take": take,
+                "id": id,
+                "orderBy": order_by,
+                "orderByDescending": _encode_bool(order_by_descending),
+                "continuationToken": continuation_token,
+                "workspace": workspace,
+            },
+        )
+        return models.PagedTables.parse_obj(data)
+
+    async def create_table(self, table: models.CreateTableRequest) -> str:
+        """Create a new table with the provided metadata and column definitions.
+
+        Args:
+            table: The request to create the table.
+
+        Returns:
+            The ID of the newly created table.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post("/tables", data=_encode(table))
+        return data["id"]
+
+    async def query_tables(
+        self, query: models.QueryTablesRequest
+    ) -> models.PagedTables:
+        """Queries available tables on the SystemLink DataFrame service and returns their metadata.
+
+        Args:
+            query: The request to query tables.
+
+        Returns:
+            The list of tables with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post("/query-tables", data=_encode(query))
+        return models.PagedTables.parse_obj(data)
+
+    async def get_table_metadata(self, id: str) -> models.TableMetadata:
+        """Retrieves the metadata and column information for a single table identified by its ID.
+
+        Args:
+            id (str): Unique ID of a data table.
+
+        Returns:
+            The metadata for the table.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.get("/tables/{id}", params={"id": id})
+        return models.TableMetadata.parse_obj(data)
+
+    async def modify_table(self, id: str, update: models.ModifyTableRequest) -> None:
+        """Modify properties of a table or its columns.
+
+        Args:
+            id: Unique ID of a data table.
+            update: The metadata to update.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        await self._api.patch("/tables/{id}", params={"id": id}, data=_encode(update))
+
+    async def delete_table(self, id: str) -> None:
+        """Deletes a table.
+
+        Args:
+            id (str): Unique ID of a data table.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        await self._api.delete("/tables/{id}", params={"id": id})
+
+    async def delete_tables(
+        self, ids: List[str]
+    ) -> Optional[models.DeleteTablesPartialSuccess]:
+        """Deletes multiple tables.
+
+        Args:
+            ids (List[str]): List of unique IDs of data tables.
+
+        Returns:
+            A partial success if any tables failed to delete, or None if all
+            tables were deleted successfully.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post("/delete-tables", data={"ids": ids})
+        if data is None:
+            return None
+        return models.DeleteTablesPartialSuccess.parse_obj(data)
+
+    async def modify_tables(
+        self, updates: models.ModifyTablesRequest
+    ) -> Optional[models.ModifyTablesPartialSuccess]:
+        """Modify the properties associated with the tables identified by their IDs.
+
+        Args:
+            updates: The table modifications to apply.
+
+        Returns:
+            A partial success if any tables failed to be modified, or None if all
+            tables were modified successfully.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post("/modify-tables", data=_encode(updates))
+        if data is None:
+            return None
+        return models.ModifyTablesPartialSuccess.parse_obj(data)
+
+    async def get_table_data(
+        self,
+        id: str,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[List[str]] = None,
+        order_by_descending: Optional[bool] = None,
+        take: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+    ) -> models.PagedTableRows:
+        """Reads raw data from the table identified by its ID.
+
+        Args:
+            id: Unique ID of a data table.
+            columns: Columns to include in the response. Data will be returned in the same order as
+                the columns. If not specified, all columns are returned.
+            order_by: List of columns to sort by. Multiple columns may be specified to order rows
+                that have the same value for prior columns. The columns used for ordering do not
+                need to be included in the columns list, in which case they are not returned. If
+                not specified, then the order in which results are returned is undefined.
+            order_by_descending: Whether to sort descending instead of ascending. Defaults to false.
+            take: Limits the returned list to the specified number of results. Defaults to 500.
+            continuation_token: The token used to paginate results.
+
+        Returns:
+            The table data and total number of rows with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.get(
+            "/tables/{id}/data",
+            params={
+                "id": id,
+                "columns": columns,
+                "orderBy": order_by,
+                "orderByDescending": _encode_bool(order_by_descending),
+                "take": take,
+                "continuationToken": continuation_token,
+            },
+        )
+        return models.PagedTableRows.parse_obj(data)
+
+    async def append_table_data(
+        self, id: str, data: models.AppendTableDataRequest
+    ) -> None:
+        """Appends one or more rows of data to the table identified by its ID.
+
+        Args:
+            id: Unique ID of a data table.
+            data: The rows of data to append and any additional options.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        await self._api.post("/tables/{id}/data", params={"id": id}, data=_encode(data))
+
+    async def query_table_data(
+        self, id: str, query: models.QueryTableDataRequest
+    ) -> models.PagedTableRows:
+        """Reads rows of data that match a filter from the table identified by its ID.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data.
+
+        Returns:
+            The table data and total number of rows with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post(
+            "/tables/{id}/query-data", params={"id": id}, data=_encode(query)
+        )
+        return models.PagedTableRows.parse_obj(data)
+
+    async def query_decimated_data(
+        self, id: str, query: models.QueryDecimatedDataRequest
+    ) -> models.TableRows:
+        """Reads decimated rows of data from the table identified by its ID.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and decimation options to apply when reading data.
+
+        Returns:
+            The decimated table data.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post(
+            "/tables/{id}/query-decimated-data", params={"id": id}, data=_encode(query)
+        )
+        return models.TableRows.parse_obj(data)
+
+    async def export_table_data(
+        self, id: str, query: models.ExportTableDataRequest
+    ) -> AsyncIterator[bytes]:
+        """Exports rows of data that match a filter from the table identified by its ID.
+
+        The export is streamed from the server as the returned iterator is consumed.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering, sorting, and export format to apply when exporting data.
+
+        Returns:
+            An asynchronous iterator over chunks of the exported data.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        uri, _ = _expand_uri_params(
+            self._api.base_uri + "/tables/{id}/export-data", {"id": id}
+        )
+        client = self._http_client._async_client
+        request = client.build_request("POST", uri, json=_encode(query))
+        response = await client.send(request, stream=True)
+        if not 200 <= response.status_code < 300:
+            try:
+                await response.aread()
+                _handle_response(response, "POST", uri)
+            finally:
+                await response.aclose()
+
+        return _iterate_response(response)
+
+
+async def _iterate_response(response: HttpResponse) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in response.aiter_bytes():
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+def _encode_bool(value: Optional[bool]) -> Optional[str]:
+    return None if value is None else str(value).lower()
@@ -0,0 +1,335 @@
+"""Implementation of BufferedTableWriter."""
+
+import datetime
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import List, Optional, Sequence, Set, Type, TYPE_CHECKING
+
+from typing_extensions import Literal
+
+from . import models
+
+if TYPE_CHECKING:
+    from ._data_frame_client import DataFrameClient
+
+# Approximate JSON overhead for each value: two quotes and a separator.
+_VALUE_OVERHEAD_BYTES = 3
+
+
+class BufferedTableWriter:
+    """Appends rows of data to a table in batches instead of one request per append.
+
+    Rows are buffered until ``buffer_size`` rows or ``max_buffer_bytes`` bytes of
+    data have been buffered, or ``max_buffer_time`` has elapsed since the first row
+    was buffered, at which point they are sent automatically. Requests are built
+    and sent on background threads, with at most ``max_requests_in_flight`` requests
+    outstanding at a time. Appending blocks once that many requests are in flight.
+
+    If a background request fails, the error is raised by the next call to
+    :meth:`append_rows`, :meth:`append_frame`, :meth:`flush`, or :meth:`close`.
+
+    Note that :class:`BufferedTableWriter` objects support using the ``with``
+    statement to automatically :meth:`close` the writer on exit.
+    """
+
+    def __init__(
+        self,
+        client: "DataFrameClient",
+        id: str,
+        columns: Optional[List[str]] = None,
+        buffer_size: Optional[int] = None,
+        max_buffer_bytes: Optional[int] = None,
+        max_buffer_time: Optional[datetime.timedelta] = None,
+        max_requests_in_flight: int = 1,
+    ) -> None:
+        """Initialize the writer.
+
+        Clients do not typically create writers directly. Use
+        :meth:`DataFrameClient.create_writer` instead.
+
+        Args:
+            client: The client to use to append data.
+            id: Unique ID of the data table to append to.
+            columns: The names and order of the columns in each row, or None if each
+                row contains all of the table's columns in order.
+            buffer_size: The maximum number of rows to buffer before automatically
+                sending them to the server, or None for no limit.
+            max_buffer_bytes: The approximate maximum size of the buffered values, in
+                bytes, before automatically sending them to the server, or None for
+                no limit.
+            max_buffer_time: The amount of time after buffering a row before the
+                buffered rows are sent, or None to only send rows based on size.
+            max_requests_in_flight: The maximum number of append requests that may
+                be outstanding at once. Batches are only guaranteed to be appended
+                in order when this is 1.
+
+        Raises:
+            ValueError: if ``buffer_size``, ``max_buffer_bytes``, and
+                ``max_buffer_time`` are all None.
+            ValueError: if ``buffer_size``, ``max_buffer_bytes``, or
+                ``max_requests_in_flight`` is less than one.
+            ValueError: if ``max_buffer_time`` is less than one millisecond.
+        """
+        if buffer_size is None and max_buffer_bytes is None and max_buffer_time is None:
+            raise ValueError(
+                "must provide buffer_size, max_buffer_bytes, or max_buffer_time"
+            )
+        if buffer_size is not None and buffer_size < 1:
+            raise ValueError("buffer_size cannot be 0 or negative")
+        if max_buffer_bytes is not None and max_buffer_bytes < 1:
+            raise ValueError("max_buffer_bytes cannot be 0 or negative")
+        if max_buffer_time is not None and max_buffer_time.total_seconds() < 0.001:
+            raise ValueError("max_buffer_time must be at least 1 millisecond")
+        if max_requests_in_flight < 1:
+            raise ValueError("max_requests_in_flight cannot be 0 or negative")
+
+        self._client = client
+        self._id = id
+        self._columns = list(columns) if columns is not None else None
+        self._buffer_limit = buffer_size
+        self._byte_limit = max_buffer_bytes
+        self._max_buffer_time = max_buffer_time
+
+        self._lock = threading.Lock()
+        self._buffer = []  # type: List[List[Optional[str]]]
+        self._buffered_bytes = 0
+        self._timer = None  # type: Optional[threading.Timer]
+        self._closed = False
+        self._send_error = None  # type: Optional[BaseException]
+
+        self._in_flight = threading.BoundedSemaphore(max_requests_in_flight)
+        self._pending = set()  # type: Set[Future]
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_requests_in_flight,
+            thread_name_prefix="BufferedTableWriter",
+        )
+
+    @property
+    def id(self) -> str:  # noqa: D401
+        """The ID of the table being appended to."""
+        return self._id
+
+    @property
+    def columns(self) -> Optional[List[str]]:  # noqa: D401
+        """The names and order of the columns in each row, or None if each row
+        contains all of the table's columns in order.
+        """
+        return list(self._columns) if self._columns is not None else None
+
+    def append_rows(self, rows: Sequence[Sequence[Optional[str]]]) -> None:
+        """Buffer rows of data to append to the table.
+
+        Values must be encoded as described on :class:`.DataFrame`.
+
+        Args:
+            rows: The rows to append, each containing a value for every column in
+                :attr:`columns`.
+
+        Raises:
+            ReferenceError: if the writer has been closed.
+            ApiException: if a previous background request failed.
+        """
+        if self._closed:
+            raise ReferenceError("BufferedTableWriter")
+
+        self._raise_send_error()
+
+        for row in rows:
+            batch = None
+            with self._lock:
+                self._buffer.append(list(row))
+                self._buffered_bytes += sum(
+                    len(value) + _VALUE_OVERHEAD_BYTES
+                    for value in row
+                    if value is not None
+                )
+                if self._buffer_is_full_while_locked():
+                    batch = self._retrieve_buffered_rows_while_locked()
+                elif len(self._buffer) == 1:
+                    self._start_timer_while_locked()
+
+            if batch is not None:
+                self._send(batch)
+
+    def append_frame(self, frame: models.DataFrame) -> None:
+        """Buffer the rows of a data frame to append to the table.
+
+        Args:
+            frame: The rows to append. If the frame specifies its columns, they must
+                match :attr:`columns`.
+
+        Raises:
+            ValueError: if the frame's columns don't match :attr:`columns`.
+            ReferenceError: if the writer has been closed.
+            ApiException: if a previous background request failed.
+        """
+        if frame.columns is not None and frame.columns != self._columns:
+            raise ValueError("frame columns must match the writer's columns")
+
+        self.append_rows(frame.data)
+
+    def flush(self) -> None:
+        """Send all buffered rows and wait for every outstanding request to complete.
+
+        Raises:
+            ReferenceError: if the writer has been closed.
+            ApiException: if a background request failed.
+        """
+        if self._closed:
+            raise ReferenceError("BufferedTableWriter")
+
+        self._flush()
+
+    def close(self, end_of_data: bool = True) -> None:
+        """Send all buffered rows and close the writer.
+
+        Does nothing if the writer has already been closed.
+
+        Args:
+            end_of_data: Whether to mark the table as complete once the buffered rows
+                have been sent, so that no more rows may be appended.
+
+        Raises:
+            ApiException: if a background request or the final request fails.
+        """
+        if self._closed:
+            return
+
+        try:
+            self._flush()
+            if end_of_data:
+                self._client.append_table_data(
+                    self._id, models.AppendTableDataRequest(end_of_data=True)
+                )
+        finally:
+            self._closed = True
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "BufferedTableWriter":
+        if self._closed:
+            raise ReferenceError("BufferedTableWriter")
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Literal[False]:
+        # Don't mark the table as complete if the caller failed part-way through.
+        self.close(end_of_data=exc_type is None)
+        return False
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch = self._retrieve_buffered_rows_while_locked()
+
+        if batch is not None:
+            self._send(batch)
+
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.exception()
+
+        self._raise_send_error()
+
+    def _send(self, rows: List[List[Optional[str]]]) -> None:
+        self._in_flight.acquire()
+        try:
+            future = self._executor.submit(self._append, rows)
+        except BaseException:
+            self._in_flight.release()
+            raise
+
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._request_completed)
+
+    def _append(self, rows: List[List[Optional[str]]]) -> None:
+        frame = models.DataFrame(columns=self._columns, data=rows)
+        self._client.append_table_data(
+            self._id, models.AppendTableDataRequest(frame=frame)
+        )
+
+    def _request_completed(self, future: Future) -> None:
+        error = future.exception()
+        with self._lock:
+            self._pending.discard(future)
+            if error is not None and self._send_error is None:
+                self._send_error = error
+        self._in_flight.release()
+
+    def _raise_send_error(self) -> None:
+        with self._lock:
+            error = self._send_error
+            self._send_error = None
+
+        if error is not None:
+            raise error
+
+    def _buffer_is_full_while_locked(self) -> bool:
+        """Return whether the buffer has reached a size limit.
+
+        Must hold :attr:`_lock`.
+        """
+        return (
+            self._buffer_limit is not None and len(self._buffer) >= self._buffer_limit
+        ) or (self._byte_limit is not None and self._buffered_bytes >= self._byte_limit)
+
+    def _retrieve_buffered_rows_while_locked(
+        self,
+    ) -> Optional[List[List[Optional[str]]]]:
+        """Return the buffered rows, if any, and clear the buffer.
+
+        Must hold :attr:`_lock`.
+        """
+        self._stop_timer_while_locked()
+
+        if not self._buffer:
+            return None
+
+        rows = self._buffer
+        self._buffer = []
+        self._buffered_bytes = 0
+        return rows
+
+    def _start_timer_while_locked(self) -> None:
+        """Start the flush timer, if configured.
+
+        Must hold :attr:`_lock`.
+        """
+        if self._max_buffer_time is None:
+            return
+
+        timer = threading.Timer(
+            self._max_buffer_time.total_seconds(), self._timer_expired
+        )
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _stop_timer_while_locked(self) -> None:
+        """Stop the flush timer, if running.
+
+        Must hold :attr:`_lock`.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _timer_expired(self) -> None:
+        if self._closed:
+            return
+
+        with self._lock:
+            if self._timer is not threading.current_thread():
+                # The timer was canceled after it had already fired.
+                return
+
+            batch = self._retrieve_buffered_rows_while_locked()
+
+        if batch is not None:
+            self._send(batch)
@@ -0,0 +1,151 @@
+"""Deleting and modifying many tables with concurrent, chunked requests."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    TypeVar,
+    Union,
+)
+
+import requests
+from nisystemlink.clients import core
+
+from . import models
+
+if TYPE_CHECKING:
+    from ._data_frame_client import DataFrameClient
+
+TItem = TypeVar("TItem")
+TResult = TypeVar("TResult")
+
+
+def delete_tables_chunked(
+    client: "DataFrameClient", ids: List[str], chunk_size: int, max_workers: int
+) -> Optional[models.DeleteTablesPartialSuccess]:
+    """Delete tables in chunks of ``chunk_size`` IDs, ``max_workers`` chunks at a time.
+
+    See :meth:`DataFrameClient.delete_tables_chunked` for a description of the
+    arguments.
+    """
+
+    def delete_chunk(
+        chunk: List[str],
+    ) -> Tuple[List[str], List[str], Optional[core.ApiError]]:
+        try:
+            result = client.delete_tables(chunk)
+        except (core.ApiException, requests.RequestException) as ex:
+            return [], chunk, _to_api_error(ex)
+        if result is None:
+            return chunk, [], None
+        return result.deleted_table_ids, result.failed_table_ids, result.error
+
+    results = _run_chunked(ids, chunk_size, max_workers, delete_chunk)
+    errors = [error for _, _, error in results if error is not None]
+    if not errors:
+        return None
+    return models.DeleteTablesPartialSuccess(
+        deleted_table_ids=[id for deleted, _, _ in results for id in deleted],
+        failed_table_ids=[id for _, failed, _ in results for id in failed],
+        error=_merge_errors(errors),
+    )
+
+
+def modify_tables_chunked(
+    client: "DataFrameClient",
+    updates: models.ModifyTablesRequest,
+    chunk_size: int,
+    max_workers: int,
+) -> Optional[models.ModifyTablesPartialSuccess]:
+    """Modify tables in chunks of ``chunk_size`` modifications, ``max_workers``
+    chunks at a time.
+
+    See :meth:`DataFrameClient.modify_tables_chunked` for a description of the
+    arguments.
+    """
+    # Only pass replace if the caller set it, so the service's default applies
+    # otherwise.
+    options = {}  # type: Dict[str, Any]
+    if "replace" in updates.__fields_set__:
+        options["replace"] = updates.replace
+
+    def modify_chunk(
+        chunk: List[models.TableMetadataModification],
+    ) -> Tuple[
+        List[str], List[models.TableMetadataModification], Optional[core.ApiError]
+    ]:
+        try:
+            result = client.modify_tables(
+                models.ModifyTablesRequest(tables=chunk, **options)
+            )
+        except (core.ApiException, requests.RequestException) as ex:
+            return [], chunk, _to_api_error(ex)
+        if result is None:
+            return [table.id for table in chunk], [], None
+        return result.modified_table_ids, result.failed_modifications, result.error
+
+    results = _run_chunked(updates.tables, chunk_size, max_workers, modify_chunk)
+    errors = [error for _, _, error in results if error is not None]
+    if not errors:
+        return None
+    return models.ModifyTablesPartialSuccess(
+        modified_table_ids=[id for modified, _, _ in results for id in modified],
+        failed_modifications=[
+            modification for _, failed, _ in results for modification in failed
+        ],
+        error=_merge_errors(errors),
+    )
+
+
+def _run_chunked(
+    items: Sequence[TItem],
+    chunk_size: int,
+    max_workers: int,
+    run_chunk: Callable[[List[TItem]], TResult],
+) -> List[TResult]:
+    """Run ``run_chunk`` on each chunk of ``items`` concurrently, returning the
+    results in the order of the chunks.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size cannot be 0 or negative")
+    if max_workers < 1:
+        raise ValueError("max_workers cannot be 0 or negative")
+
+    chunks = [
+        list(items[start : start + chunk_size])
+        for start in range(0, len(items), chunk_size)
+    ]
+    if len(chunks) <= 1 or max_workers == 1:
+        return [run_chunk(chunk) for chunk in chunks]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(chunks)), thread_name_prefix="ChunkedRequest"
+    ) as executor:
+        return list(executor.map(run_chunk, chunks))
+
+
+def _to_api_error(
+    ex: Union[core.ApiException, requests.RequestException]
+) -> core.ApiError:
+    if isinstance(ex, requests.RequestException):
+        return core.ApiError(message=str(ex))
+    if ex.error is not None:
+        return ex.error
+    return core.ApiError(message=ex.message)
+
+
+def _merge_errors(errors: List[core.ApiError]) -> core.ApiError:
+    if len(errors) == 1:
+        return errors[0]
+    return core.ApiError(
+        name="Skyline.OneOrMoreErrorsOccurred",
+        message="One or more errors occurred. See the contained list for details "
+        "of each error.",
+        inner_errors=errors,
+    )
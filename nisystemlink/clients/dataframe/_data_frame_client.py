@@ -1,8 +1,30 @@
 """Implementation of DataFrameClient."""
 
-from typing import List, Optional
+import datetime
+import functools
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TYPE_CHECKING,
+    TypeVar,
+)
 
 from nisystemlink.clients import core
+from nisystemlink.clients.core._internal._lru_cache import LruCache
+from nisystemlink.clients.core._internal._paging import (
+    AdaptivePageSize,
+    iterate_pages,
+    iterate_pages_adaptively,
+)
 from nisystemlink.clients.core._uplink._base_client import BaseClient
 from nisystemlink.clients.core._uplink._methods import (
     delete,
@@ -10,16 +32,65 @@ from nisystemlink.clients.core._uplink._methods import (
     patch,
     post,
     response_handler,
+    stream,
 )
 from nisystemlink.clients.core.helpers import IteratorFileLike
 from requests.models import Response
 from uplink import Body, Field, Path, Query
 
 from . import models
+from ._buffered_table_writer import BufferedTableWriter
+from ._chunked_operations import delete_tables_chunked, modify_tables_chunked
+from ._partitioned_reader import read_partitioned
+from ._streaming_parser import PagedTableRowsParser
+from ._table_data_spool import TableDataSpool
+
+if TYPE_CHECKING:
+    import pandas
+
+    from . import columnar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_INITIAL_TABLES_TAKE = 100
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _CachedMetadata(NamedTuple):
+    metadata: models.TableMetadata
+    expires_at: float
+
+
+def _invalidates_metadata(get_ids: Callable[..., Iterable[str]]) -> Callable[[F], F]:
+    """Discard the cached metadata of the tables modified by a method once it
+    returns or raises, with ``get_ids`` returning their IDs given the method's
+    arguments.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(self: "DataFrameClient", *args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self._invalidate_metadata(get_ids(*args, **kwargs))
+
+        return cast(F, wrapper)
+
+    return decorator
 
 
 class DataFrameClient(BaseClient):
-    def __init__(self, configuration: Optional[core.HttpConfiguration] = None):
+    def __init__(
+        self,
+        configuration: Optional[core.HttpConfiguration] = None,
+        trusted_responses: bool = False,
+        metadata_cache_ttl: Optional[datetime.timedelta] = None,
+        metadata_cache_size: int = 1000,
+        request_compression: Optional[str] = None,
+    ):
         """Initialize an instance.
 
         Args:
@@ -27,14 +98,53 @@ class DataFrameClient(BaseClient):
                 how to connect. If not provided, the
                 :class:`HttpConfigurationManager <nisystemlink.clients.core.HttpConfigurationManager>`
                 is used to obtain the configuration.
+            trusted_responses: Whether to skip validating the DataFrame Service's
+                responses. Building the response models without validation is much
+                faster for large responses, such as pages of table rows, but a
+                malformed response results in a malformed model instead of an error.
+            metadata_cache_ttl: How long :meth:`get_table_metadata` may return a
+                table's metadata from a local cache before retrieving it from the
+                server again, or None to always retrieve it from the server. Cached
+                metadata is discarded when the table is modified or deleted through
+                this client, but changes made by other clients, including the
+                ``row_count`` and ``rows_modified_at`` of appended rows, may not be
+                seen until it expires.
+            metadata_cache_size: The maximum number of tables whose metadata is
+                cached. The least recently used table's metadata is discarded first.
+            request_compression: The compression to apply to large request bodies,
+                such as the rows sent by :meth:`append_table_data`, either
+                ``"gzip"`` or ``"deflate"``, or None to send bodies uncompressed.
+                Compressed responses, such as exports, are always accepted and
+                decompressed as they are read.
 
         Raises:
             ApiException: if unable to communicate with the DataFrame Service.
+            ValueError: if ``metadata_cache_ttl`` is negative,
+                ``metadata_cache_size`` is less than one, or
+                ``request_compression`` is not supported.
         """
+        if metadata_cache_ttl is not None and metadata_cache_ttl.total_seconds() < 0:
+            raise ValueError("metadata_cache_ttl cannot be negative")
+
         if configuration is None:
             configuration = core.HttpConfigurationManager.get_configuration()
 
-        super().__init__(configuration, "/nidataframe/v1/")
+        super().__init__(
+            configuration, "/nidataframe/v1/", trusted_responses, request_compression
+        )
+
+        self._metadata_cache_ttl = (
+            metadata_cache_ttl.total_seconds()
+            if metadata_cache_ttl is not None
+            else None
+        )
+        self._metadata_cache: LruCache[str, _CachedMetadata] = LruCache(
+            metadata_cache_size
+        )
+        # Incremented whenever cached metadata is discarded, so that metadata
+        # retrieved before the table was modified isn't added to the cache after.
+        self._metadata_generation = 0
+        self._metadata_lock = threading.Lock()
 
     @get("")
     def api_info(self) -> models.ApiInfo:
@@ -119,8 +229,176 @@ class DataFrameClient(BaseClient):
         """
         ...
 
+    def query_all_tables(
+        self,
+        query: models.QueryTablesRequest,
+        *,
+        max_take: int = 1000,
+        target_page_time: datetime.timedelta = datetime.timedelta(seconds=1),
+        max_page_bytes: Optional[int] = None,
+    ) -> Iterator[models.TableMetadata]:
+        """Queries available tables, following continuation tokens automatically and
+        returning the metadata of each table as it is needed.
+
+        The number of tables requested in each page adapts to how long pages take
+        to retrieve: it doubles while pages take less than half of
+        ``target_page_time`` and halves when a page takes longer. The DataFrame
+        Service does not support returning only some of the tables' fields, so
+        each page contains the tables' full metadata.
+
+        Args:
+            query: The request to query tables. ``take`` is the number of tables to
+                request in the first page, defaulting to 100. If
+                ``continuation_token`` is set, reading starts at that page.
+            max_take: The largest number of tables to request in a page.
+            target_page_time: How long retrieving a page should take.
+            max_page_bytes: The approximate maximum size of the tables in a page,
+                in bytes, as estimated from the size of their JSON, or None to not
+                limit the size of a page.
+
+        Returns:
+            An iterator over the metadata of the tables matching the query, in order.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if ``max_take``, ``max_page_bytes``, or the query's
+                ``take`` is less than one, or ``target_page_time`` is not positive.
+        """
+        take = _INITIAL_TABLES_TAKE if query.take is None else query.take
+        if take < 1:
+            raise ValueError("take cannot be 0 or negative")
+        page_size = AdaptivePageSize(
+            take,
+            max_take,
+            target_page_time.total_seconds(),
+            max_page_bytes,
+        )
+
+        def fetch_page(
+            continuation_token: Optional[str], take: int
+        ) -> models.PagedTables:
+            update = {"take": take}  # type: Dict[str, Any]
+            if continuation_token is not None:
+                update["continuation_token"] = continuation_token
+            return self.query_tables(query.copy(update=update))
+
+        return self._iterate_tables(fetch_page, page_size, query.continuation_token)
+
+    def list_all_tables(
+        self,
+        id: Optional[List[str]] = None,
+        order_by: Optional[models.OrderBy] = None,
+        order_by_descending: Optional[bool] = None,
+        workspace: Optional[List[str]] = None,
+        *,
+        take: Optional[int] = None,
+        max_take: int = 1000,
+        target_page_time: datetime.timedelta = datetime.timedelta(seconds=1),
+        max_page_bytes: Optional[int] = None,
+    ) -> Iterator[models.TableMetadata]:
+        """Lists available tables, following continuation tokens automatically and
+        returning the metadata of each table as it is needed.
+
+        The size of each page adapts the same way as in :meth:`query_all_tables`.
+
+        Args:
+            id: List of table IDs to filter by.
+            order_by: The sort order of the returned list of tables.
+            order_by_descending: Whether to sort descending instead of ascending.
+            workspace: List of workspace IDs to filter by.
+            take: The number of tables to request in the first page. Defaults to 100.
+            max_take: The largest number of tables to request in a page.
+            target_page_time: How long retrieving a page should take.
+            max_page_bytes: The approximate maximum size of the tables in a page,
+                in bytes, as estimated from the size of their JSON, or None to not
+                limit the size of a page.
+
+        Returns:
+            An iterator over the metadata of the tables, in order.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if ``take``, ``max_take``, or ``max_page_bytes`` is less
+                than one, or ``target_page_time`` is not positive.
+        """
+        if take is None:
+            take = _INITIAL_TABLES_TAKE
+        elif take < 1:
+            raise ValueError("take cannot be 0 or negative")
+        page_size = AdaptivePageSize(
+            take,
+            max_take,
+            target_page_time.total_seconds(),
+            max_page_bytes,
+        )
+
+        def fetch_page(
+            continuation_token: Optional[str], take: int
+        ) -> models.PagedTables:
+            return self.list_tables(
+                take=take,
+                id=id,
+                order_by=order_by,
+                order_by_descending=order_by_descending,
+                continuation_token=continuation_token,
+                workspace=workspace,
+            )
+
+        return self._iterate_tables(fetch_page, page_size, None)
+
+    def _iterate_tables(
+        self,
+        fetch_page: Callable[[Optional[str], int], models.PagedTables],
+        page_size: AdaptivePageSize,
+        continuation_token: Optional[str],
+    ) -> Iterator[models.TableMetadata]:
+        def get_tables(page: models.PagedTables) -> List[models.TableMetadata]:
+            return page.tables
+
+        pages = iterate_pages_adaptively(
+            fetch_page, get_tables, page_size, continuation_token
+        )
+        for page in pages:
+            yield from page.tables
+
+    def get_table_metadata(
+        self, id: str, *, refresh: bool = False
+    ) -> models.TableMetadata:
+        """Retrieves the metadata and column information for a single table identified by its ID.
+
+        If the client was created with a ``metadata_cache_ttl``, the metadata is
+        returned from the cache when it was retrieved within that time.
+
+        Args:
+            id (str): Unique ID of a data table.
+            refresh: Whether to retrieve the metadata from the server even if it is
+                cached, such as to get the table's current ``row_count``.
+
+        Returns:
+            The metadata for the table. Cached metadata is shared between callers
+            and should not be modified.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        if self._metadata_cache_ttl is None:
+            return self.__get_table_metadata(id)
+
+        if not refresh:
+            entry = self._metadata_cache.get(id)
+            if entry is not None and time.monotonic() < entry.expires_at:
+                return entry.metadata
+
+        generation = self._metadata_generation
+        metadata = self.__get_table_metadata(id)
+        self._cache_metadata([metadata], generation)
+        return metadata
+
     @get("tables/{id}")
-    def get_table_metadata(self, id: str) -> models.TableMetadata:
+    def __get_table_metadata(self, id: str) -> models.TableMetadata:
         """Retrieves the metadata and column information for a single table identified by its ID.
 
         Args:
@@ -135,10 +413,79 @@ class DataFrameClient(BaseClient):
         """
         ...
 
-    @patch("tables/{id}", args=[Path, Body])
+    def warm_metadata_cache(
+        self, query: models.QueryTablesRequest
+    ) -> models.PagedTables:
+        """Queries tables and adds the metadata of each table returned to the cache
+        used by :meth:`get_table_metadata`, so that a page of tables can be cached
+        with a single request.
+
+        If the client was created without a ``metadata_cache_ttl``, the tables are
+        returned without being cached.
+
+        Args:
+            query: The request to query tables.
+
+        Returns:
+            The list of tables with a continuation token, for warming the cache
+            with the following page.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        generation = self._metadata_generation
+        page = self.query_tables(query)
+        self._cache_metadata(page.tables, generation)
+        return page
+
+    def clear_metadata_cache(self, id: Optional[str] = None) -> None:
+        """Discard table metadata cached by :meth:`get_table_metadata`.
+
+        Args:
+            id: Unique ID of the data table whose metadata to discard, or None to
+                discard the metadata of every table.
+        """
+        with self._metadata_lock:
+            self._metadata_generation += 1
+            if id is None:
+                self._metadata_cache.clear()
+            else:
+                self._metadata_cache.pop(id)
+
+    def _cache_metadata(
+        self, tables: Iterable[models.TableMetadata], generation: int
+    ) -> None:
+        if self._metadata_cache_ttl is None:
+            return
+
+        expires_at = time.monotonic() + self._metadata_cache_ttl
+        with self._metadata_lock:
+            # Don't cache metadata retrieved before cached metadata was discarded,
+            # since it may not include the modifications that caused it.
+            if generation != self._metadata_generation:
+                return
+            for table in tables:
+                self._metadata_cache.put(table.id, _CachedMetadata(table, expires_at))
+
+    @_invalidates_metadata(lambda id, update: [id])
     def modify_table(self, id: str, update: models.ModifyTableRequest) -> None:
         """Modify properties of a table or its columns.
 
+        Args:
+            id: Unique ID of a data table.
+            update: The metadata to update.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        self.__modify_table(id, update)
+
+    @patch("tables/{id}", args=[Path, Body])
+    def __modify_table(self, id: str, update: models.ModifyTableRequest) -> None:
+        """Modify properties of a table or its columns.
+
         Args:
             id: Unique ID of a data table.
             update: The metadata to update.
@@ -149,10 +496,23 @@ class DataFrameClient(BaseClient):
         """
         ...
 
-    @delete("tables/{id}")
+    @_invalidates_metadata(lambda id: [id])
     def delete_table(self, id: str) -> None:
         """Deletes a table.
 
+        Args:
+            id (str): Unique ID of a data table.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        self.__delete_table(id)
+
+    @delete("tables/{id}")
+    def __delete_table(self, id: str) -> None:
+        """Deletes a table.
+
         Args:
             id (str): Unique ID of a data table.
 
@@ -162,12 +522,31 @@ class DataFrameClient(BaseClient):
         """
         ...
 
-    @post("delete-tables", args=[Field("ids")])
+    @_invalidates_metadata(lambda ids: ids)
     def delete_tables(
         self, ids: List[str]
     ) -> Optional[models.DeleteTablesPartialSuccess]:
         """Deletes multiple tables.
 
+        Args:
+            ids (List[str]): List of unique IDs of data tables.
+
+        Returns:
+            A partial success if any tables failed to delete, or None if all
+            tables were deleted successfully.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        return self.__delete_tables(ids)
+
+    @post("delete-tables", args=[Field("ids")])
+    def __delete_tables(
+        self, ids: List[str]
+    ) -> Optional[models.DeleteTablesPartialSuccess]:
+        """Deletes multiple tables.
+
         Args:
             ids (List[str]): List of unique IDs of data tables.
 
@@ -181,12 +560,31 @@ class DataFrameClient(BaseClient):
         """
         ...
 
-    @post("modify-tables")
+    @_invalidates_metadata(lambda updates: [table.id for table in updates.tables])
     def modify_tables(
         self, updates: models.ModifyTablesRequest
     ) -> Optional[models.ModifyTablesPartialSuccess]:
         """Modify the properties associated with the tables identified by their IDs.
 
+        Args:
+            updates: The table modifications to apply.
+
+        Returns:
+            A partial success if any tables failed to be modified, or None if all
+            tables were modified successfully.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        return self.__modify_tables(updates)
+
+    @post("modify-tables")
+    def __modify_tables(
+        self, updates: models.ModifyTablesRequest
+    ) -> Optional[models.ModifyTablesPartialSuccess]:
+        """Modify the properties associated with the tables identified by their IDs.
+
         Args:
             updates: The table modifications to apply.
 
@@ -200,6 +598,74 @@ class DataFrameClient(BaseClient):
         """
         ...
 
+    def delete_tables_chunked(
+        self, ids: List[str], chunk_size: int = 1000, max_workers: int = 4
+    ) -> Optional[models.DeleteTablesPartialSuccess]:
+        """Deletes multiple tables, splitting the IDs into chunks that are deleted
+        with concurrent requests.
+
+        A chunk whose request fails entirely, including because the DataFrame
+        Service couldn't be reached, is reported as failed in the result rather
+        than raising, so that the other chunks' results are not lost.
+
+        Args:
+            ids: List of unique IDs of data tables.
+            chunk_size: The maximum number of tables to delete in each request.
+            max_workers: The maximum number of requests in progress at once.
+
+        Returns:
+            A partial success combining the results of every chunk if any tables
+            failed to delete, or None if all tables were deleted successfully. The
+            tables of a chunk whose request failed are listed as failed, with the
+            request's error. If more than one chunk failed, the error contains each
+            chunk's error as an inner error.
+
+        Raises:
+            ValueError: if ``chunk_size`` or ``max_workers`` is less than one.
+        """
+        return delete_tables_chunked(self, ids, chunk_size, max_workers)
+
+    def modify_tables_chunked(
+        self,
+        updates: models.ModifyTablesRequest,
+        chunk_size: int = 1000,
+        max_workers: int = 4,
+    ) -> Optional[models.ModifyTablesPartialSuccess]:
+        """Modify the properties associated with the tables identified by their IDs,
+        splitting the modifications into chunks that are applied with concurrent
+        requests.
+
+        A chunk whose request fails entirely, including because the DataFrame
+        Service couldn't be reached, is reported as failed in the result rather
+        than raising, so that the other chunks' results are not lost.
+
+        Args:
+            updates: The table modifications to apply. ``replace`` applies to
+                every chunk.
+            chunk_size: The maximum number of tables to modify in each request.
+            max_workers: The maximum number of requests in progress at once.
+
+        Returns:
+            A partial success combining the results of every chunk if any tables
+            failed to be modified, or None if all tables were modified
+            successfully. The modifications of a chunk whose request failed are
+            listed as failed, with the request's error. If more than one chunk
+            failed, the error contains each chunk's error as an inner error.
+
+        Raises:
+            ValueError: if ``chunk_size`` or ``max_workers`` is less than one.
+        """
+        return modify_tables_chunked(self, updates, chunk_size, max_workers)
+
+    def _invalidate_metadata(self, ids: Iterable[str]) -> None:
+        if self._metadata_cache_ttl is None:
+            return
+
+        with self._metadata_lock:
+            self._metadata_generation += 1
+            for id in ids:
+                self._metadata_cache.pop(id)
+
     @get(
         "tables/{id}/data",
         args=[
@@ -257,6 +723,102 @@ class DataFrameClient(BaseClient):
         """
         ...
 
+    def create_writer(
+        self,
+        id: str,
+        columns: Optional[List[str]] = None,
+        *,
+        buffer_size: Optional[int] = None,
+        max_buffer_bytes: Optional[int] = None,
+        max_buffer_time: Optional[datetime.timedelta] = None,
+        max_requests_in_flight: int = 1,
+    ) -> BufferedTableWriter:
+        """Create a writer that buffers rows of data and appends them to the table
+        identified by its ID in batches.
+
+        Buffered rows are sent automatically once ``buffer_size`` rows or
+        ``max_buffer_bytes`` bytes have been buffered, or ``max_buffer_time`` has
+        passed since buffering a row. Closing the writer sends any remaining rows
+        and marks the table as complete with ``end_of_data``.
+
+        Args:
+            id: Unique ID of a data table.
+            columns: The names and order of the columns in each row, or None if each
+                row contains all of the table's columns in order.
+            buffer_size: The maximum number of rows to buffer before automatically
+                sending them to the server.
+            max_buffer_bytes: The approximate maximum size of the buffered values, in
+                bytes, before automatically sending them to the server.
+            max_buffer_time: The amount of time before buffered rows are sent.
+            max_requests_in_flight: The maximum number of append requests that may
+                be outstanding at once. Batches are only guaranteed to be appended
+                in order when this is 1.
+
+        Returns:
+            The created writer. Close the writer to send any remaining rows and free
+            resources.
+
+        Raises:
+            ValueError: if ``buffer_size``, ``max_buffer_bytes``, and
+                ``max_buffer_time`` are all None.
+            ValueError: if ``buffer_size``, ``max_buffer_bytes``, or
+                ``max_requests_in_flight`` is less than one.
+        """
+        return BufferedTableWriter(
+            self,
+            id,
+            columns,
+            buffer_size=buffer_size,
+            max_buffer_bytes=max_buffer_bytes,
+            max_buffer_time=max_buffer_time,
+            max_requests_in_flight=max_requests_in_flight,
+        )
+
+    def create_spool(
+        self,
+        path: str,
+        *,
+        max_segment_bytes: int = 16 * 1024 * 1024,
+        retry_delay: datetime.timedelta = datetime.timedelta(seconds=1),
+        max_retry_delay: datetime.timedelta = datetime.timedelta(minutes=1),
+        fsync: bool = False,
+    ) -> TableDataSpool:
+        """Create a spool that writes appended rows to local disk and sends them to
+        the service in the background, so appending never waits for the network.
+
+        Appends are sent in the order they were spooled, and failed appends are
+        retried until they succeed. Appends that have not been sent when the
+        process exits are sent by the next spool created for the same ``path``.
+
+        Args:
+            path: The directory holding the spool's files. It is created if it does
+                not exist.
+            max_segment_bytes: The size, in bytes, at which a segment file is
+                closed and a new one started.
+            retry_delay: The time to wait before sending a failed append again. The
+                delay doubles after each consecutive failure.
+            max_retry_delay: The longest time to wait between attempts.
+            fsync: Whether to flush each append to the storage device before
+                returning, so that spooled appends also survive the operating
+                system crashing or losing power.
+
+        Returns:
+            The created spool, which has started sending any appends already in
+            ``path``. Close the spool to stop sending appends and free resources.
+
+        Raises:
+            ValueError: if ``max_segment_bytes`` is less than one.
+            ValueError: if ``retry_delay`` or ``max_retry_delay`` is negative.
+        """
+        return TableDataSpool(
+            self,
+            path,
+            max_segment_bytes=max_segment_bytes,
+            retry_delay=retry_delay,
+            max_retry_delay=max_retry_delay,
+            fsync=fsync,
+        )
+
     @post("tables/{id}/query-data", args=[Path, Body])
     def query_table_data(
         self, id: str, query: models.QueryTableDataRequest
@@ -276,6 +838,423 @@ class DataFrameClient(BaseClient):
         """
         ...
 
+    def query_table_data_streamed(
+        self, id: str, query: models.QueryTableDataRequest
+    ) -> models.PagedTableRows:
+        """Reads rows of data that match a filter from the table identified by its ID,
+        parsing the rows as the response is received.
+
+        Returns the same result as :meth:`query_table_data`, but rows are decoded
+        one at a time while the response is downloaded instead of after the whole
+        response has been read, which reduces the memory needed for large pages.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data.
+
+        Returns:
+            The table data and total number of rows with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if the response is not a valid page of table data.
+        """
+        parser = PagedTableRowsParser()
+        response = self.__query_table_data_response(id, query)
+        with response:
+            for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+        return parser.close()
+
+    def query_table_data_compact(
+        self, id: str, query: models.QueryTableDataRequest
+    ) -> models.CompactPagedTableRows:
+        """Reads rows of data that match a filter from the table identified by its ID,
+        storing the rows in a :class:`CompactDataFrame
+        <nisystemlink.clients.dataframe.models.CompactDataFrame>`.
+
+        The rows are parsed as the response is received and added to the compact
+        frame one at a time, so a list of every row is never built.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data.
+
+        Returns:
+            The table data and total number of rows with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if the response is not a valid page of table data.
+        """
+        parser = PagedTableRowsParser(collect_rows=False)
+        rows = models.CompactRows()
+        response = self.__query_table_data_response(id, query)
+        with response:
+            for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                rows.extend(parser.feed(chunk))
+        page = parser.close()
+        return models.CompactPagedTableRows(
+            frame=models.CompactDataFrame(columns=page.frame.columns, data=rows),
+            total_row_count=page.total_row_count,
+            continuation_token=page.continuation_token,
+        )
+
+    def iter_table_data_rows(
+        self, id: str, query: models.QueryTableDataRequest
+    ) -> Iterator[List[Optional[str]]]:
+        """Reads every row of data that matches a filter from the table identified by
+        its ID, following continuation tokens automatically.
+
+        Each row is returned as soon as it has been received, before the rest of
+        its page has been downloaded.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data. ``take``
+                limits the size of each page. If ``query.continuation_token`` is
+                set, reading starts at that page.
+
+        Returns:
+            An iterator over the rows of table data, in order.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if a response is not a valid page of table data.
+        """
+        page_query = query
+        while True:
+            parser = PagedTableRowsParser(collect_rows=False)
+            response = self.__query_table_data_response(id, page_query)
+            with response:
+                for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                    yield from parser.feed(chunk)
+            continuation_token = parser.close().continuation_token
+            if not continuation_token:
+                return
+            page_query = query.copy(update={"continuation_token": continuation_token})
+
+    @stream()
+    @post("tables/{id}/query-data", args=[Path, Body])
+    def __query_table_data_response(
+        self, id: str, query: models.QueryTableDataRequest
+    ) -> Response:
+        """Sends a query for rows of data, returning the response before its body
+        has been read.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data.
+
+        Returns:
+            The response, whose body is read as it is received.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        ...
+
+    def query_table_data_pages(
+        self, id: str, query: models.QueryTableDataRequest, prefetch: int = 1
+    ) -> Iterator[models.PagedTableRows]:
+        """Reads every page of rows that match a filter from the table identified by
+        its ID, following continuation tokens automatically.
+
+        While the caller processes a page, up to ``prefetch`` subsequent pages are
+        requested on a background thread. Each page is requested as soon as the
+        previous page arrives, so network latency overlaps with the caller's work.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data. If
+                ``query.continuation_token`` is set, reading starts at that page.
+            prefetch: The maximum number of pages to request ahead of the page being
+                processed. If 0, each page is only requested once the caller asks
+                for it.
+
+        Returns:
+            An iterator over the pages of table data, in order.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if ``prefetch`` is negative.
+        """
+
+        def fetch_page(continuation_token: Optional[str]) -> models.PagedTableRows:
+            if continuation_token == query.continuation_token:
+                return self.query_table_data(id, query)
+            return self.query_table_data(
+                id, query.copy(update={"continuation_token": continuation_token})
+            )
+
+        return iterate_pages(fetch_page, query.continuation_token, prefetch)
+
+    def query_table_data_partitioned(
+        self,
+        id: str,
+        query: models.QueryTableDataRequest,
+        partitions: int = 4,
+        partition_column: Optional[str] = None,
+        *,
+        max_workers: Optional[int] = None,
+        max_buffered_pages: int = 4,
+    ) -> Iterator[models.DataFrame]:
+        """Reads rows of data that match a filter from the table identified by its ID,
+        splitting the query into ranges of a column's values that are read
+        concurrently.
+
+        The smallest and largest values of ``partition_column`` matching the query
+        are requested first, and the range between them is divided into
+        ``partitions`` ranges of equal width. Each range is read with its own chain
+        of requests on a worker thread, filtered with ``GREATER_THAN_EQUALS`` and
+        ``LESS_THAN`` filters. Pages are returned in order of the partition column,
+        so later ranges are read ahead while earlier ones are returned.
+
+        Rows where a floating-point ``partition_column`` is ``NaN`` are not
+        returned.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering to apply when reading data. ``take`` limits the
+                size of each page. If the query is ordered, it must first be ordered
+                by ``partition_column`` ascending. The query cannot specify a
+                ``continuation_token``.
+            partitions: The number of ranges to divide the query into.
+            partition_column: The numeric or timestamp column to partition the rows
+                by. It cannot be a nullable column. Defaults to the table's index
+                column.
+            max_workers: The maximum number of ranges to read at once. Defaults to
+                ``partitions``.
+            max_buffered_pages: The maximum number of pages read ahead for each
+                range before they are returned.
+
+        Returns:
+            An iterator over the pages of table data, in order of the partition
+            column.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if ``partitions``, ``max_workers``, or
+                ``max_buffered_pages`` is less than one.
+            ValueError: if ``partition_column`` is not a non-nullable numeric or
+                timestamp column, or the query is ordered by another column.
+            ValueError: if ``partition_column`` is None and the table has no index
+                column.
+        """
+        return read_partitioned(
+            self,
+            id,
+            query,
+            partitions,
+            partition_column,
+            max_workers,
+            max_buffered_pages,
+        )
+
+    def get_table_data_columnar(
+        self,
+        id: str,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[List[str]] = None,
+        order_by_descending: Optional[bool] = None,
+        take: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+        table_columns: Optional[List[models.Column]] = None,
+    ) -> "columnar.ColumnarTableRows":
+        """Reads raw data from the table identified by its ID, decoding each column
+        into a typed NumPy array.
+
+        Requires the ``numpy`` extra. See :meth:`get_table_data` for a description of
+        the query parameters.
+
+        Args:
+            id: Unique ID of a data table.
+            columns: Columns to include in the response.
+            order_by: List of columns to sort by.
+            order_by_descending: Whether to sort descending instead of ascending.
+            take: Limits the returned list to the specified number of results.
+            continuation_token: The token used to paginate results.
+            table_columns: The table's column definitions, used to determine the
+                type of each column. If not specified, the table's metadata is
+                retrieved from the server.
+
+        Returns:
+            The decoded table data and total number of rows with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if a value cannot be converted to its column's data type.
+        """
+        rows = self.get_table_data(
+            id,
+            columns=columns,
+            order_by=order_by,
+            order_by_descending=order_by_descending,
+            take=take,
+            continuation_token=continuation_token,
+        )
+        return self._decode_table_rows(id, rows, table_columns)
+
+    def query_table_data_columnar(
+        self,
+        id: str,
+        query: models.QueryTableDataRequest,
+        table_columns: Optional[List[models.Column]] = None,
+    ) -> "columnar.ColumnarTableRows":
+        """Reads rows of data that match a filter from the table identified by its ID,
+        decoding each column into a typed NumPy array.
+
+        Requires the ``numpy`` extra.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data.
+            table_columns: The table's column definitions, used to determine the
+                type of each column. If not specified, the table's metadata is
+                retrieved from the server.
+
+        Returns:
+            The decoded table data and total number of rows with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if a value cannot be converted to its column's data type.
+        """
+        rows = self.query_table_data(id, query)
+        return self._decode_table_rows(id, rows, table_columns)
+
+    def _decode_table_rows(
+        self,
+        id: str,
+        rows: models.PagedTableRows,
+        table_columns: Optional[List[models.Column]],
+    ) -> "columnar.ColumnarTableRows":
+        from . import columnar
+
+        if table_columns is None:
+            table_columns = self.get_table_metadata(id).columns
+
+        return columnar.ColumnarTableRows(
+            columnar.decode_frame(rows.frame, table_columns),
+            rows.total_row_count,
+            rows.continuation_token,
+        )
+
+    def read_table(
+        self,
+        id: str,
+        query: Optional[models.QueryTableDataRequest] = None,
+        table_columns: Optional[List[models.Column]] = None,
+    ) -> "pandas.DataFrame":
+        """Reads every row of data that matches a filter from the table identified by
+        its ID into a pandas DataFrame.
+
+        Requires the ``pandas`` extra. Each page is decoded into typed NumPy arrays
+        as it arrives, and the arrays are handed to pandas without converting each
+        value to a Python object. See :func:`columnar.to_pandas
+        <nisystemlink.clients.dataframe.columnar.to_pandas>` for the resulting data
+        types.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data, or None to
+                read every row. ``take`` limits the size of each page.
+            table_columns: The table's column definitions, used to determine the
+                type of each column. If not specified, the table's metadata is
+                retrieved from the server.
+
+        Returns:
+            A DataFrame with a column for each column read.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if a value cannot be converted to its column's data type.
+        """
+        from . import columnar
+
+        if query is None:
+            query = models.QueryTableDataRequest()
+        if table_columns is None:
+            table_columns = self.get_table_metadata(id).columns
+
+        frames = [
+            columnar.decode_frame(page.frame, table_columns)
+            for page in self.query_table_data_pages(id, query)
+        ]
+        return columnar.to_pandas(columnar.ColumnarFrame.concat(frames))
+
+    def append_dataframe(
+        self,
+        id: str,
+        data: "pandas.DataFrame",
+        *,
+        rows_per_request: int = 10000,
+        end_of_data: Optional[bool] = None,
+        table_columns: Optional[List[models.Column]] = None,
+    ) -> None:
+        """Appends the rows of a pandas DataFrame to the table identified by its ID.
+
+        Requires the ``pandas`` extra. Each column is formatted with array
+        operations instead of one row at a time. ``FLOAT32`` and ``FLOAT64`` values
+        are written with enough digits to convert back to exactly the same value,
+        and ``TIMESTAMP`` values in UTC with millisecond precision. See
+        :func:`columnar.from_pandas
+        <nisystemlink.clients.dataframe.columnar.from_pandas>` for how missing
+        values are handled.
+
+        Args:
+            id: Unique ID of a data table.
+            data: The rows to append. Its column names must be the names of table
+                columns. Table columns that are not included receive null values.
+            rows_per_request: The maximum number of rows to send in each request.
+            end_of_data: Whether the table should expect any additional rows to be
+                appended in future requests. Sent with the last request.
+            table_columns: The table's column definitions, used to determine the
+                type of each column. If not specified, the table's metadata is
+                retrieved from the server.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if ``rows_per_request`` is less than one.
+            ValueError: if ``data`` contains a column that is not in the table, or a
+                value cannot be converted to its column's data type.
+        """
+        from . import columnar
+        import numpy as np
+
+        if rows_per_request < 1:
+            raise ValueError("rows_per_request cannot be 0 or negative")
+        if table_columns is None:
+            table_columns = self.get_table_metadata(id).columns
+
+        frame = columnar.from_pandas(data, table_columns)
+        starts = range(0, len(frame), rows_per_request)
+        if not starts:
+            if end_of_data is not None:
+                self.append_table_data(
+                    id, models.AppendTableDataRequest(end_of_data=end_of_data)
+                )
+            return
+
+        for start in starts:
+            end = min(start + rows_per_request, len(frame))
+            request = models.AppendTableDataRequest(
+                frame=columnar.encode_frame(frame.take(np.arange(start, end)))
+            )
+            if end == len(frame) and end_of_data is not None:
+                request.end_of_data = end_of_data
+            self.append_table_data(id, request)
+
     @post("tables/{id}/query-decimated-data", args=[Path, Body])
     def query_decimated_data(
         self, id: str, query: models.QueryDecimatedDataRequest
@@ -298,6 +1277,7 @@ class DataFrameClient(BaseClient):
     def _iter_content_filelike_wrapper(response: Response) -> IteratorFileLike:
         return IteratorFileLike(response.iter_content(chunk_size=4096))
 
+    @stream()
     @response_handler(_iter_content_filelike_wrapper)
     @post("tables/{id}/export-data", args=[Path, Body])
     def export_table_data(
@@ -310,10 +1290,52 @@ class DataFrameClient(BaseClient):
             query: The filtering, sorting, and export format to apply when exporting data.
 
         Returns:
-            A file-like object for reading the exported data.
+            A file-like object for reading the exported data. The data is streamed
+            from the server as it is read.
 
         Raises:
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
         ...
+
+    def export_table_data_batches(
+        self,
+        id: str,
+        query: models.ExportTableDataRequest,
+        batch_size: int = 10000,
+        table_columns: Optional[List[models.Column]] = None,
+    ) -> Iterator["columnar.ColumnarFrame"]:
+        """Exports rows of data that match a filter from the table identified by its ID,
+        decoding the exported CSV data into batches of typed NumPy columns.
+
+        Requires the ``numpy`` extra. The export is parsed incrementally as it is
+        streamed from the server, so memory use depends on ``batch_size`` rather
+        than on the number of rows exported.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering, sorting, and export format to apply when exporting data.
+            batch_size: The maximum number of rows in each batch.
+            table_columns: The table's column definitions, used to determine the
+                type of each column. If not specified, the table's metadata is
+                retrieved from the server.
+
+        Returns:
+            An iterator over the batches of exported rows, in order.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+            ValueError: if ``batch_size`` is less than one.
+            ValueError: if a value cannot be converted to its column's data type.
+        """
+        from . import columnar
+
+        if batch_size < 1:
+            raise ValueError("batch_size cannot be 0 or negative")
+        if table_columns is None:
+            table_columns = self.get_table_metadata(id).columns
+
+        data = self.export_table_data(id, query)
+        return columnar.read_csv_batches(data, table_columns, batch_size)
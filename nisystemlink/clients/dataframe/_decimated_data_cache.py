@@ -0,0 +1,137 @@
+"""Implementation of DecimatedDataCache."""
+
+import datetime
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from nisystemlink.clients.core._internal._lru_cache import LruCache
+
+from . import models
+
+if TYPE_CHECKING:
+    from ._data_frame_client import DataFrameClient
+
+
+class _CacheEntry(NamedTuple):
+    rows: models.TableRows
+    rows_modified_at: datetime.datetime
+
+
+class _TableState(NamedTuple):
+    rows_modified_at: datetime.datetime
+    checked_at: float
+
+
+class DecimatedDataCache:
+    """Caches the results of :meth:`DataFrameClient.query_decimated_data` so that
+    repeating a query does not repeat the server's decimation work.
+
+    Results are keyed by the table ID and the full query, including its columns,
+    filters, ordering, and decimation options. Once ``max_entries`` results are
+    cached, the least recently used result is discarded to make room for new
+    results. Before a cached result is returned, the table's ``rows_modified_at``
+    is compared to its value when the result was cached, and all of the table's
+    cached results are discarded if the table's rows have since been modified.
+
+    Cached results are shared between callers and should not be modified.
+    """
+
+    def __init__(
+        self,
+        client: "DataFrameClient",
+        max_entries: int = 128,
+        metadata_max_age: Optional[datetime.timedelta] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            client: The client to use to query data and table metadata.
+            max_entries: The maximum number of query results to cache.
+            metadata_max_age: How long a table's ``rows_modified_at`` may be reused
+                before it is retrieved again to check whether cached results are
+                out of date, or None to retrieve the table's metadata for every
+                query. Until it is retrieved again, results may be returned that
+                don't include the table's most recent changes.
+
+        Raises:
+            ValueError: if ``max_entries`` is less than one.
+            ValueError: if ``metadata_max_age`` is negative.
+        """
+        if metadata_max_age is not None and metadata_max_age.total_seconds() < 0:
+            raise ValueError("metadata_max_age cannot be negative")
+
+        self._client = client
+        self._metadata_max_age = (
+            metadata_max_age.total_seconds() if metadata_max_age is not None else None
+        )
+        self._entries: LruCache[Tuple[str, str], _CacheEntry] = LruCache(max_entries)
+        self._tables = {}  # type: Dict[str, _TableState]
+        self._lock = threading.Lock()
+
+    def query_decimated_data(
+        self, id: str, query: models.QueryDecimatedDataRequest
+    ) -> models.TableRows:
+        """Reads decimated rows of data from the table identified by its ID, using a
+        cached result if the same query has already been made and the table's rows
+        have not been modified since.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and decimation options to apply when reading data.
+
+        Returns:
+            The decimated table data.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        rows_modified_at = self._get_rows_modified_at(id)
+        key = (id, query.json(by_alias=True, exclude_unset=True, sort_keys=True))
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.rows_modified_at == rows_modified_at:
+            return entry.rows
+
+        rows = self._client.query_decimated_data(id, query)
+        self._entries.put(key, _CacheEntry(rows, rows_modified_at))
+        return rows
+
+    def invalidate(self, id: Optional[str] = None) -> None:
+        """Discard cached results.
+
+        Args:
+            id: Unique ID of the data table whose results to discard, or None to
+                discard the results for every table.
+        """
+        with self._lock:
+            if id is None:
+                self._tables.clear()
+                self._entries.clear()
+            else:
+                self._tables.pop(id, None)
+                self._entries.remove_if(lambda key, _: key[0] == id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_rows_modified_at(self, id: str) -> datetime.datetime:
+        with self._lock:
+            state = self._tables.get(id)
+        if (
+            state is not None
+            and self._metadata_max_age is not None
+            and time.monotonic() - state.checked_at <= self._metadata_max_age
+        ):
+            return state.rows_modified_at
+
+        rows_modified_at = self._client.get_table_metadata(
+            id, refresh=True
+        ).rows_modified_at
+        with self._lock:
+            previous = self._tables.get(id)
+            self._tables[id] = _TableState(rows_modified_at, time.monotonic())
+            if previous is not None and previous.rows_modified_at != rows_modified_at:
+                self._entries.remove_if(lambda key, _: key[0] == id)
+        return rows_modified_at
@@ -0,0 +1,253 @@
+"""Reading table data as concurrently fetched, range-partitioned queries."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from nisystemlink.clients.core._internal._timestamp_utilities import (
+    TimestampUtilities,
+)
+
+from . import models
+
+if TYPE_CHECKING:
+    from ._data_frame_client import DataFrameClient
+
+_POLL_INTERVAL_SECONDS = 0.1
+
+_PARTITION_TYPES = (
+    models.DataType.Int32,
+    models.DataType.Int64,
+    models.DataType.Float32,
+    models.DataType.Float64,
+    models.DataType.Timestamp,
+)
+
+
+def read_partitioned(
+    client: "DataFrameClient",
+    id: str,
+    query: models.QueryTableDataRequest,
+    partitions: int,
+    partition_column: Optional[str],
+    max_workers: Optional[int],
+    max_buffered_pages: int,
+) -> Iterator[models.DataFrame]:
+    """Split a query into ranges of a column's values and read them concurrently.
+
+    See :meth:`DataFrameClient.query_table_data_partitioned` for a description of
+    the arguments.
+    """
+    if partitions < 1:
+        raise ValueError("partitions cannot be 0 or negative")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers cannot be 0 or negative")
+    if max_buffered_pages < 1:
+        raise ValueError("max_buffered_pages cannot be 0 or negative")
+    if query.continuation_token is not None:
+        raise ValueError("query cannot have a continuation_token")
+
+    column = _get_partition_column(client, id, partition_column)
+    if query.order_by and (
+        query.order_by[0].column != column.name or query.order_by[0].descending
+    ):
+        raise ValueError(
+            "query must be ordered by '{}' ascending, if ordered".format(column.name)
+        )
+
+    bounds = _get_bounds(client, id, query, column)
+    if bounds is None:
+        return iter([])
+
+    queries = [
+        query.copy(
+            update={
+                "filters": (query.filters or []) + filters,
+                "order_by": query.order_by
+                or [models.ColumnOrderBy(column=column.name)],
+            }
+        )
+        for filters in _partition_filters(column, bounds, partitions)
+    ]
+    return _read_queries(
+        client, id, queries, max_workers or len(queries), max_buffered_pages
+    )
+
+
+def _get_partition_column(
+    client: "DataFrameClient", id: str, name: Optional[str]
+) -> models.Column:
+    columns = client.get_table_metadata(id).columns
+    if name is None:
+        index = next(
+            (c for c in columns if c.column_type == models.ColumnType.Index), None
+        )
+        if index is None:
+            raise ValueError("Table '{}' has no index column".format(id))
+        column = index
+    else:
+        matches = [c for c in columns if c.name == name]
+        if not matches:
+            raise ValueError("Unknown column: '{}'".format(name))
+        column = matches[0]
+
+    if column.data_type not in _PARTITION_TYPES:
+        raise ValueError(
+            "Column '{}' must be a numeric or timestamp column".format(column.name)
+        )
+    if column.column_type == models.ColumnType.Nullable:
+        raise ValueError("Column '{}' cannot be nullable".format(column.name))
+    return column
+
+
+def _get_bounds(
+    client: "DataFrameClient",
+    id: str,
+    query: models.QueryTableDataRequest,
+    column: models.Column,
+) -> Optional[Tuple[Any, Any]]:
+    """Return the smallest and largest values of the column matching the query."""
+    filters = list(query.filters or [])
+    if column.data_type in (models.DataType.Float32, models.DataType.Float64):
+        filters.append(
+            models.ColumnFilter(
+                column=column.name,
+                operation=models.FilterOperation.NotEquals,
+                value="NaN",
+            )
+        )
+
+    values = []
+    for descending in (False, True):
+        rows = client.query_table_data(
+            id,
+            models.QueryTableDataRequest(
+                columns=[column.name],
+                filters=filters,
+                order_by=[
+                    models.ColumnOrderBy(column=column.name, descending=descending)
+                ],
+                take=1,
+            ),
+        )
+        if not rows.frame.data:
+            return None
+        values.append(_parse_value(column.data_type, rows.frame.data[0][0]))
+    return values[0], values[1]
+
+
+def _partition_filters(
+    column: models.Column, bounds: Tuple[Any, Any], partitions: int
+) -> List[List[models.ColumnFilter]]:
+    """Create the filters for each of the disjoint ranges covering every value."""
+    low, high = bounds
+    if column.data_type in (models.DataType.Int32, models.DataType.Int64):
+        edges = [
+            low + (high + 1 - low) * index // partitions
+            for index in range(1, partitions)
+        ]
+    else:
+        edges = [
+            low + (high - low) * index / partitions for index in range(1, partitions)
+        ]
+    # Remove empty ranges, such as when there are fewer values than partitions.
+    edges = sorted({edge for edge in edges if low < edge <= high})
+
+    result = []
+    for index in range(len(edges) + 1):
+        filters = []
+        # The first and last ranges are unbounded so that no rows are missed.
+        if index > 0:
+            filters.append(
+                _filter(
+                    column, models.FilterOperation.GreaterThanEquals, edges[index - 1]
+                )
+            )
+        if index < len(edges):
+            filters.append(
+                _filter(column, models.FilterOperation.LessThan, edges[index])
+            )
+        result.append(filters)
+    return result
+
+
+def _filter(
+    column: models.Column, operation: models.FilterOperation, value: Any
+) -> models.ColumnFilter:
+    return models.ColumnFilter(
+        column=column.name,
+        operation=operation,
+        value=_format_value(column.data_type, value),
+    )
+
+
+def _parse_value(data_type: models.DataType, value: Optional[str]) -> Any:
+    if value is None:
+        raise ValueError("Partition column contains null values")
+    if data_type == models.DataType.Timestamp:
+        return TimestampUtilities.str_to_datetime(value)
+    if data_type in (models.DataType.Int32, models.DataType.Int64):
+        return int(value)
+    return float(value)
+
+
+def _format_value(data_type: models.DataType, value: Any) -> str:
+    if data_type == models.DataType.Timestamp:
+        return TimestampUtilities.datetime_to_str(value)
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _read_queries(
+    client: "DataFrameClient",
+    id: str,
+    queries: List[models.QueryTableDataRequest],
+    max_workers: int,
+    max_buffered_pages: int,
+) -> Iterator[models.DataFrame]:
+    # Each partition is read on a worker thread into its own bounded queue. The
+    # queues are drained in partition order, so later partitions read ahead until
+    # their queue is full. Results are (frame, error) tuples, with (None, None)
+    # marking the end of a partition.
+    results: List[queue.Queue] = [queue.Queue(max_buffered_pages) for _ in queries]
+    stopped = threading.Event()
+
+    def put(partition: queue.Queue, item: Tuple[Any, Any]) -> bool:
+        while not stopped.is_set():
+            try:
+                partition.put(item, timeout=_POLL_INTERVAL_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read(query: models.QueryTableDataRequest, partition: queue.Queue) -> None:
+        if stopped.is_set():
+            return
+        try:
+            for page in client.query_table_data_pages(id, query, prefetch=0):
+                if not put(partition, (page.frame, None)):
+                    return
+        except Exception as ex:
+            put(partition, (None, ex))
+            return
+        put(partition, (None, None))
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="PartitionedReader"
+    )
+    try:
+        for query, partition in zip(queries, results):
+            executor.submit(read, query, partition)
+
+        for partition in results:
+            while True:
+                frame, error = partition.get()
+                if error is not None:
+                    raise error
+                if frame is None:
+                    break
+                yield frame
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False)
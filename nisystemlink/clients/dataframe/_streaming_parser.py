@@ -0,0 +1,211 @@
+"""Incremental parsing of query-data responses."""
+
+import codecs
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import models
+
+_WHITESPACE = " \t\n\r"
+
+Row = List[Optional[str]]
+
+# Parser states.
+_START = 0
+_OBJECT_KEY = 1
+_DATA = 2
+_DONE = 3
+
+
+class PagedTableRowsParser:
+    """Parses the JSON of a :class:`PagedTableRows
+    <nisystemlink.clients.dataframe.models.PagedTableRows>` response incrementally,
+    returning the rows of ``frame.data`` as soon as each row has been received.
+
+    The rows are decoded one at a time straight from the response text, without
+    building the full JSON document first.
+    """
+
+    def __init__(self, collect_rows: bool = True, encoding: str = "utf-8") -> None:
+        """Initialize a parser.
+
+        Args:
+            collect_rows: Whether to keep the rows in the result returned by
+                :meth:`close`. If False, the result's ``frame.data`` is empty and
+                the rows are only available from :meth:`feed`.
+            encoding: The character encoding of the response.
+        """
+        self._collect_rows = collect_rows
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._final = False
+        self._state = _START
+        # The objects being parsed, outermost first, as (name, fields) pairs.
+        self._objects = []  # type: List[Tuple[Optional[str], Dict[str, Any]]]
+        self._result = {}  # type: Dict[str, Any]
+        self._rows = []  # type: List[Row]
+
+    def feed(self, data: bytes) -> List[Row]:
+        """Parse the next part of the response.
+
+        Args:
+            data: The next bytes of the response.
+
+        Returns:
+            The rows completed by ``data``, in order.
+
+        Raises:
+            ValueError: if the response is not valid JSON or has an unexpected
+                structure.
+        """
+        return self._consume(self._decoder.decode(data))
+
+    def close(self) -> models.PagedTableRows:
+        """Finish parsing the response.
+
+        Returns:
+            The parsed response.
+
+        Raises:
+            ValueError: if the response is incomplete or invalid.
+        """
+        self._final = True
+        self._consume(self._decoder.decode(b"", final=True))
+        if self._state != _DONE:
+            raise ValueError("Incomplete response")
+
+        result = dict(self._result)
+        frame = dict(result.get("frame") or {})
+        frame["data"] = []
+        result["frame"] = frame
+        rows = models.PagedTableRows.parse_obj(result)
+        rows.frame.data = self._rows
+        return rows
+
+    def _consume(self, text: str) -> List[Row]:
+        self._buffer += text
+        rows = []  # type: List[Row]
+        position = self._parse(rows)
+        self._buffer = self._buffer[position:]
+        if self._collect_rows:
+            self._rows.extend(rows)
+        return rows
+
+    def _parse(self, rows: List[Row]) -> int:
+        """Parse as much of the buffer as possible, returning the position of the
+        first character that was not consumed.
+        """
+        buffer = self._buffer
+        position = 0
+        while True:
+            position = _skip_whitespace(buffer, position)
+            if position == len(buffer):
+                return position
+
+            if self._state == _START:
+                if buffer[position] != "{":
+                    raise ValueError("Expected a JSON object")
+                self._objects.append((None, self._result))
+                self._state = _OBJECT_KEY
+                position += 1
+
+            elif self._state == _OBJECT_KEY:
+                name, fields = self._objects[-1]
+                char = buffer[position]
+                if char == "}":
+                    self._objects.pop()
+                    self._state = _OBJECT_KEY if self._objects else _DONE
+                    position += 1
+                    continue
+                if char == ",":
+                    position += 1
+                    continue
+
+                member = self._parse_member_name(buffer, position)
+                if member is None:
+                    return position
+                key, value_position = member
+                if name is None and key == "frame" and buffer[value_position] == "{":
+                    frame = {}  # type: Dict[str, Any]
+                    fields[key] = frame
+                    self._objects.append((key, frame))
+                    position = value_position + 1
+                elif (
+                    name == "frame" and key == "data" and buffer[value_position] == "["
+                ):
+                    self._state = _DATA
+                    position = value_position + 1
+                else:
+                    value = self._parse_value(buffer, value_position)
+                    if value is None:
+                        return position
+                    fields[key], position = value
+
+            elif self._state == _DATA:
+                char = buffer[position]
+                if char == "]":
+                    self._state = _OBJECT_KEY
+                    position += 1
+                    continue
+                if char == ",":
+                    position += 1
+                    continue
+
+                row = self._parse_value(buffer, position)
+                if row is None:
+                    return position
+                value, position = row
+                if not isinstance(value, list) or not all(
+                    cell is None or isinstance(cell, str) for cell in value
+                ):
+                    raise ValueError("Each row must be a list of strings or nulls")
+                rows.append(value)
+
+            else:
+                raise ValueError("Unexpected data after the end of the response")
+
+    def _parse_member_name(
+        self, buffer: str, position: int
+    ) -> Optional[Tuple[str, int]]:
+        """Parse an object member's name and the colon after it, returning the name
+        and the position of the value, or None if more data is needed.
+        """
+        name = self._parse_value(buffer, position)
+        if name is None:
+            return None
+        key, position = name
+        if not isinstance(key, str):
+            raise ValueError("Expected an object member name")
+        position = _skip_whitespace(buffer, position)
+        if position == len(buffer):
+            return None
+        if buffer[position] != ":":
+            raise ValueError("Expected ':' after an object member name")
+        position = _skip_whitespace(buffer, position + 1)
+        if position == len(buffer):
+            return None
+        return key, position
+
+    def _parse_value(self, buffer: str, position: int) -> Optional[Tuple[Any, int]]:
+        """Parse a complete JSON value, returning it and the position after it, or
+        None if more data is needed.
+        """
+        try:
+            value, end = self._json.raw_decode(buffer, position)
+        except json.JSONDecodeError as ex:
+            # The value may be incomplete, which is only an error if the rest of
+            # it never arrives.
+            if not self._final:
+                return None
+            raise ValueError("Invalid JSON: {}".format(ex)) from ex
+        # A number or literal could continue in the next part of the response.
+        if not self._final and end == len(buffer) and buffer[position] not in '"[{':
+            return None
+        return value, end
+
+
+def _skip_whitespace(buffer: str, position: int) -> int:
+    while position < len(buffer) and buffer[position] in _WHITESPACE:
+        position += 1
+    return position
@@ -0,0 +1,500 @@
+"""Implementation of TableDataSpool."""
+
+import datetime
+import json
+import os
+import re
+import threading
+from types import TracebackType
+from typing import Any, Dict, IO, List, Optional, Sequence, Tuple, Type, TYPE_CHECKING
+
+import requests
+from nisystemlink.clients import core
+from typing_extensions import Literal
+
+from . import models
+
+if TYPE_CHECKING:
+    from ._data_frame_client import DataFrameClient
+
+_SEGMENT_PATTERN = re.compile(r"^segment-(\d+)\.jsonl$")
+_CHECKPOINT = "checkpoint.json"
+_REJECTED = "rejected.jsonl"
+
+# Status codes of failed requests that may succeed if they are sent again. An
+# authentication failure, such as from an expired API key, is retried rather than
+# rejected, so that the appends are sent once the credentials are fixed. A
+# permission error is rejected, since it would block the appends to every table.
+_RETRYABLE_STATUS_CODES = {401, 408, 429}
+
+
+class TableDataSpool:
+    """Appends rows of data to tables by way of a write-ahead log on local disk.
+
+    Each append is written to the end of a local segment file and the call returns
+    immediately, without waiting for the DataFrame Service. A background thread
+    sends the spooled appends to the service in the order they were spooled,
+    retrying with an increasing delay while the service is unreachable or
+    returns an error that may be temporary, so appends to each table are applied
+    in order.
+
+    The spool's directory holds the segment files and a checkpoint of how much of
+    them has been sent. Creating a spool for a directory that still holds appends
+    from a previous process resumes sending them. An append that was sent but not
+    yet checkpointed when the process stopped is sent again, so an append may be
+    applied more than once, but is never lost once :meth:`append_rows` or
+    :meth:`append_frame` returns. Only one spool may use a directory at a time.
+
+    Appends that the service rejects with an error that won't succeed when retried,
+    such as a value that doesn't match its column's data type or a table that has
+    been deleted, are moved to ``rejected.jsonl`` in the spool's directory along
+    with the error, and the appends after them continue to be sent. Appends that
+    fail authentication are retried, and remain in the spool until they are sent,
+    while appends refused for lack of permission are rejected.
+
+    If sending stops because of an unexpected error, such as an append that can't
+    be read back from disk, the error is reported by :attr:`last_error` and raised
+    by :meth:`flush` and :meth:`close`. The appends that haven't been sent remain
+    in the spool's directory.
+
+    Note that :class:`TableDataSpool` objects support using the ``with`` statement
+    to automatically :meth:`close` the spool on exit.
+    """
+
+    def __init__(
+        self,
+        client: "DataFrameClient",
+        path: str,
+        max_segment_bytes: int = 16 * 1024 * 1024,
+        retry_delay: datetime.timedelta = datetime.timedelta(seconds=1),
+        max_retry_delay: datetime.timedelta = datetime.timedelta(minutes=1),
+        fsync: bool = False,
+    ) -> None:
+        """Initialize the spool and start sending any appends already in it.
+
+        Clients do not typically create spools directly. Use
+        :meth:`DataFrameClient.create_spool` instead.
+
+        Args:
+            client: The client to use to append data.
+            path: The directory holding the spool's files. It is created if it does
+                not exist.
+            max_segment_bytes: The size, in bytes, at which a segment file is
+                closed and a new one started. Segment files are deleted once
+                all of their appends have been sent.
+            retry_delay: The time to wait before sending a failed append again. The
+                delay doubles after each consecutive failure.
+            max_retry_delay: The longest time to wait between attempts.
+            fsync: Whether to flush each append to the storage device before
+                returning, so that spooled appends also survive the operating
+                system crashing or losing power. If False, they survive the
+                process exiting or crashing.
+
+        Raises:
+            ValueError: if ``max_segment_bytes`` is less than one.
+            ValueError: if ``retry_delay`` or ``max_retry_delay`` is negative.
+        """
+        if max_segment_bytes < 1:
+            raise ValueError("max_segment_bytes cannot be 0 or negative")
+        if retry_delay.total_seconds() < 0 or max_retry_delay.total_seconds() < 0:
+            raise ValueError("retry delays cannot be negative")
+
+        self._client = client
+        self._path = path
+        self._max_segment_bytes = max_segment_bytes
+        self._retry_delay = retry_delay.total_seconds()
+        self._max_retry_delay = max_retry_delay.total_seconds()
+        self._fsync = fsync
+
+        os.makedirs(path, exist_ok=True)
+        read_segment, read_offset = self._read_checkpoint()
+        segments = []
+        for segment in self._list_segments():
+            if segment < read_segment:
+                # The segment was sent, but the process stopped before deleting it.
+                os.remove(self._segment_path(segment))
+            else:
+                segments.append(segment)
+
+        # Appends are never added to a segment left by a previous process, whose
+        # last line may have been only partly written.
+        self._write_segment = max(segments + [read_segment]) + 1
+        self._write_file = None  # type: Optional[IO[bytes]]
+        self._write_size = 0
+
+        if read_segment not in segments:
+            read_segment = segments[0] if segments else self._write_segment
+            read_offset = 0
+        self._read_segment = read_segment
+        self._read_offset = read_offset
+        self._read_file = None  # type: Optional[IO[bytes]]
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._last_error = None  # type: Optional[BaseException]
+        self._failure = None  # type: Optional[Exception]
+        self._closing = threading.Event()
+        self._closed = False
+
+        self._sender = threading.Thread(
+            target=self._send_spooled, name="TableDataSpool", daemon=True
+        )
+        self._sender.start()
+
+    @property
+    def path(self) -> str:  # noqa: D401
+        """The directory holding the spool's files."""
+        return self._path
+
+    @property
+    def last_error(self) -> Optional[BaseException]:  # noqa: D401
+        """The error from the most recent failed attempt to send an append, or None
+        if the most recent attempt succeeded. If sending has stopped because of an
+        unexpected error, this is that error.
+        """
+        with self._lock:
+            return self._last_error
+
+    def append_rows(
+        self,
+        id: str,
+        rows: Sequence[Sequence[Optional[str]]],
+        columns: Optional[List[str]] = None,
+        end_of_data: Optional[bool] = None,
+    ) -> None:
+        """Spool rows of data to append to a table.
+
+        Values must be encoded as described on :class:`.DataFrame`.
+
+        Args:
+            id: Unique ID of a data table.
+            rows: The rows to append, each containing a value for every column in
+                ``columns``.
+            columns: The names and order of the columns in each row, or None if
+                each row contains all of the table's columns in order.
+            end_of_data: Whether the table should expect any additional rows to be
+                appended in future requests.
+
+        Raises:
+            ReferenceError: if the spool has been closed.
+            OSError: if the append cannot be written to disk.
+        """
+        fields = {}  # type: Dict[str, Any]
+        if rows or end_of_data is None:
+            fields["frame"] = models.DataFrame(
+                columns=columns, data=[list(row) for row in rows]
+            )
+        if end_of_data is not None:
+            fields["end_of_data"] = end_of_data
+        self.append(id, models.AppendTableDataRequest(**fields))
+
+    def append_frame(self, id: str, frame: models.DataFrame) -> None:
+        """Spool the rows of a data frame to append to a table.
+
+        Args:
+            id: Unique ID of a data table.
+            frame: The rows to append.
+
+        Raises:
+            ReferenceError: if the spool has been closed.
+            OSError: if the append cannot be written to disk.
+        """
+        self.append(id, models.AppendTableDataRequest(frame=frame))
+
+    def append(self, id: str, data: models.AppendTableDataRequest) -> None:
+        """Spool a request to append rows of data to a table.
+
+        Args:
+            id: Unique ID of a data table.
+            data: The rows of data to append and any additional options, as passed
+                to :meth:`DataFrameClient.append_table_data`.
+
+        Raises:
+            ReferenceError: if the spool has been closed.
+            OSError: if the append cannot be written to disk.
+        """
+        line = '{{"id": {}, "request": {}}}\n'.format(
+            json.dumps(id), data.json(by_alias=True, exclude_unset=True)
+        ).encode("utf-8")
+
+        with self._lock:
+            if self._closed:
+                raise ReferenceError("TableDataSpool")
+
+            if self._write_file is not None and (
+                self._write_size + len(line) > self._max_segment_bytes
+            ):
+                self._write_file.close()
+                self._write_file = None
+                self._write_segment += 1
+            if self._write_file is None:
+                self._write_file = open(self._segment_path(self._write_segment), "ab")
+                self._write_size = 0
+
+            self._write_file.write(line)
+            self._write_file.flush()
+            if self._fsync:
+                os.fsync(self._write_file.fileno())
+            self._write_size += len(line)
+            self._changed.notify_all()
+
+    def flush(self, timeout: Optional[datetime.timedelta] = None) -> bool:
+        """Wait for every append spooled so far to be sent.
+
+        Args:
+            timeout: The longest time to wait, or None to wait until they are sent.
+
+        Returns:
+            Whether every append spooled before the call has been sent.
+
+        Raises:
+            ReferenceError: if the spool has been closed.
+            Exception: the error that stopped the spool from sending appends, if
+                the appends spooled before the call have not all been sent.
+        """
+        with self._lock:
+            if self._closed:
+                raise ReferenceError("TableDataSpool")
+
+            if self._wait_for_sent_while_locked(timeout):
+                return True
+            if self._failure is not None:
+                raise self._failure
+            return False
+
+    def close(self, timeout: Optional[datetime.timedelta] = None) -> None:
+        """Stop sending appends and close the spool's files.
+
+        Appends that have not been sent remain in the spool's directory and are
+        sent by the next spool created for it. Does nothing if the spool has
+        already been closed.
+
+        Args:
+            timeout: The longest time to wait for the spooled appends to be sent
+                before stopping, or None to stop without waiting. The append being
+                sent when the spool stops is always allowed to complete.
+
+        Raises:
+            Exception: the error that stopped the spool from sending appends, after
+                the spool's files are closed.
+        """
+        with self._lock:
+            if self._closed:
+                return
+
+            if timeout is not None:
+                self._wait_for_sent_while_locked(timeout)
+            self._closed = True
+            self._closing.set()
+            self._changed.notify_all()
+        self._sender.join()
+
+        with self._lock:
+            if self._write_file is not None:
+                self._write_file.close()
+                self._write_file = None
+            if self._failure is not None:
+                raise self._failure
+
+    def __enter__(self) -> "TableDataSpool":
+        if self._closed:
+            raise ReferenceError("TableDataSpool")
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Literal[False]:
+        self.close()
+        return False
+
+    def _send_spooled(self) -> None:
+        """Send spooled appends in order until the spool is closed."""
+        try:
+            while True:
+                record = self._next_record()
+                if record is None:
+                    return
+                line, end = record
+                if not self._send_with_retries(line):
+                    return
+                with self._lock:
+                    self._read_offset = end
+                    self._changed.notify_all()
+                self._write_checkpoint()
+        except Exception as ex:
+            # The append being sent stays in the spool, rather than being skipped.
+            with self._lock:
+                self._last_error = ex
+                self._failure = ex
+                self._changed.notify_all()
+        finally:
+            if self._read_file is not None:
+                self._read_file.close()
+                self._read_file = None
+
+    def _next_record(self) -> Optional[Tuple[bytes, int]]:
+        """Wait for the next spooled append, returning its line and the offset of
+        the line after it, or None if the spool is closing.
+
+        Only the sender thread changes the read position, so the segment files are
+        read without holding :attr:`_lock`, which appends need.
+        """
+        while True:
+            with self._lock:
+                if self._closing.is_set():
+                    return None
+                written = (self._write_segment, self._write_size)
+
+            path = self._segment_path(self._read_segment)
+            if self._read_file is None and os.path.exists(path):
+                self._read_file = open(path, "rb")
+
+            if self._read_file is not None:
+                self._read_file.seek(self._read_offset)
+                line = self._read_file.readline()
+                if line.endswith(b"\n"):
+                    return line, self._read_offset + len(line)
+                if self._read_segment < written[0] and line:
+                    # A partly written line at the end of a segment left by a
+                    # previous process was never acknowledged to the caller.
+                    with self._lock:
+                        self._read_offset += len(line)
+                    continue
+
+            if self._read_segment < written[0]:
+                self._finish_segment(written[0])
+                continue
+
+            with self._lock:
+                # Wait unless an append was spooled since the segment was read.
+                if not self._closing.is_set() and written == (
+                    self._write_segment,
+                    self._write_size,
+                ):
+                    self._changed.wait()
+
+    def _wait_for_sent_while_locked(
+        self, timeout: Optional[datetime.timedelta]
+    ) -> bool:
+        """Wait for every append spooled so far to be sent, returning whether they
+        were sent before the timeout elapsed, the spool closed, or sending stopped.
+
+        Must hold :attr:`_lock`.
+        """
+        target = (self._write_segment, self._write_size)
+        return self._changed.wait_for(
+            lambda: self._sent_while_locked(target)
+            or self._closed
+            or self._failure is not None,
+            timeout.total_seconds() if timeout is not None else None,
+        ) and self._sent_while_locked(target)
+
+    def _sent_while_locked(self, position: Tuple[int, int]) -> bool:
+        """Return whether every append before a position in the segments has been
+        sent.
+
+        Must hold :attr:`_lock`.
+        """
+        return (self._read_segment, self._read_offset) >= position
+
+    def _next_segment(self, write_segment: int) -> int:
+        """Return the number of the oldest segment file after the one being read,
+        or ``write_segment`` if there is none.
+        """
+        later = [
+            segment for segment in self._list_segments() if segment > self._read_segment
+        ]
+        return min(later) if later else write_segment
+
+    def _finish_segment(self, write_segment: int) -> None:
+        """Delete the segment that has been completely sent and start reading the
+        next one.
+        """
+        next_segment = self._next_segment(write_segment)
+        if self._read_file is not None:
+            self._read_file.close()
+            self._read_file = None
+        finished = self._read_segment
+        with self._lock:
+            self._read_segment, self._read_offset = next_segment, 0
+            self._changed.notify_all()
+        self._write_checkpoint()
+        try:
+            os.remove(self._segment_path(finished))
+        except FileNotFoundError:
+            pass
+
+    def _send_with_retries(self, line: bytes) -> bool:
+        """Send a spooled append, retrying until it succeeds or is rejected, and
+        return False if the spool closed first.
+        """
+        record = json.loads(line)
+        id = record["id"]
+        request = models.AppendTableDataRequest.parse_obj(record["request"])
+
+        delay = self._retry_delay
+        while True:
+            try:
+                self._client.append_table_data(id, request)
+            except (core.ApiException, requests.RequestException) as ex:
+                with self._lock:
+                    self._last_error = ex
+                if not _is_retryable(ex):
+                    self._reject(record, ex)
+                    return True
+            else:
+                with self._lock:
+                    self._last_error = None
+                return True
+
+            if self._closing.wait(delay):
+                return False
+            delay = min(max(delay * 2, 0.001), self._max_retry_delay)
+
+    def _reject(self, record: Dict[str, Any], error: BaseException) -> None:
+        record["error"] = str(error)
+        with open(os.path.join(self._path, _REJECTED), "ab") as file:
+            file.write((json.dumps(record) + "\n").encode("utf-8"))
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self._path, "segment-{:012d}.jsonl".format(segment))
+
+    def _list_segments(self) -> List[int]:
+        segments = []
+        for name in os.listdir(self._path):
+            match = _SEGMENT_PATTERN.match(name)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    def _read_checkpoint(self) -> Tuple[int, int]:
+        try:
+            with open(os.path.join(self._path, _CHECKPOINT), encoding="utf-8") as file:
+                checkpoint = json.load(file)
+        except FileNotFoundError:
+            return 0, 0
+        return checkpoint["segment"], checkpoint["offset"]
+
+    def _write_checkpoint(self) -> None:
+        path = os.path.join(self._path, _CHECKPOINT)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"segment": self._read_segment, "offset": self._read_offset}, file
+            )
+            if self._fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Return whether a failed append may succeed if it is sent again."""
+    if not isinstance(error, core.ApiException):
+        return True
+    status = error.http_status_code
+    return status is None or status >= 500 or status in _RETRYABLE_STATUS_CODES
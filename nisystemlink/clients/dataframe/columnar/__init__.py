@@ -0,0 +1,28 @@
+"""Typed, column-oriented access to DataFrame table data.
+
+This package requires NumPy, which is installed with the ``numpy`` extra:
+``pip install "nisystemlink-clients[numpy]"``. :func:`to_pandas` and
+:func:`from_pandas` also require pandas, which is installed with the ``pandas``
+extra.
+"""
+
+try:
+    import numpy
+except ImportError as ex:
+    raise ImportError(
+        "nisystemlink.clients.dataframe.columnar requires NumPy. Install it with "
+        'pip install "nisystemlink-clients[numpy]".'
+    ) from ex
+
+from ._typed_column import NUMPY_DTYPES, TypedColumn
+from ._columnar_frame import ColumnarFrame
+from ._columnar_table_rows import ColumnarTableRows
+from ._decoding import decode_column, decode_frame
+from ._encoding import encode_column, encode_frame
+from ._csv_reader import read_csv_batches
+from ._decimation import decimate, DecimationPyramid
+from ._filtering import evaluate_filters, filter_frame, query_frame, sort_frame
+from ._table_mirror import TableMirror
+from ._pandas import from_pandas, to_pandas
+
+# flake8: noqa
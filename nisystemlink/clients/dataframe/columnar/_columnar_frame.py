@@ -0,0 +1,113 @@
+"""Implementation of ColumnarFrame."""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from ._typed_column import TypedColumn
+
+
+class ColumnarFrame:
+    """Rows of table data stored column-wise as typed NumPy arrays.
+
+    Columns are kept in the order they were provided and can be looked up by
+    name with ``frame["column"]``.
+    """
+
+    def __init__(self, columns: Sequence[TypedColumn]) -> None:
+        """Initialize a frame.
+
+        Args:
+            columns: The columns of the frame. All columns must have the same length
+                and unique names.
+
+        Raises:
+            ValueError: if the columns do not all have the same length.
+            ValueError: if two columns have the same name.
+        """
+        self._columns = {}  # type: Dict[str, TypedColumn]
+        length = None  # type: Optional[int]
+        for column in columns:
+            if column.name in self._columns:
+                raise ValueError("Duplicate column name: '{}'".format(column.name))
+            if length is not None and len(column) != length:
+                raise ValueError("All columns must have the same length")
+            length = len(column)
+            self._columns[column.name] = column
+        self._length = length or 0
+
+    @classmethod
+    def concat(cls, frames: Sequence["ColumnarFrame"]) -> "ColumnarFrame":
+        """Combine frames with the same columns into a single frame.
+
+        Args:
+            frames: The frames to combine, in order.
+
+        Returns:
+            A frame containing the rows of every frame in ``frames``.
+
+        Raises:
+            ValueError: if the frames do not all have the same columns.
+        """
+        if not frames:
+            return cls([])
+
+        first = frames[0]
+        for frame in frames[1:]:
+            if frame.column_names != first.column_names:
+                raise ValueError("All frames must have the same columns")
+
+        return cls(
+            [
+                TypedColumn(
+                    column.name,
+                    column.data_type,
+                    np.concatenate([frame[column.name].values for frame in frames]),
+                    np.concatenate([frame[column.name].mask for frame in frames]),
+                )
+                for column in first
+            ]
+        )
+
+    @property
+    def column_names(self) -> List[str]:  # noqa: D401
+        """The names of the columns, in order."""
+        return list(self._columns)
+
+    def take(self, indices: np.ndarray) -> "ColumnarFrame":
+        """Create a frame containing the rows at the given positions.
+
+        Args:
+            indices: The positions of the rows to include, or a boolean array
+                selecting the rows to include.
+
+        Returns:
+            The new frame.
+        """
+        return ColumnarFrame([column.take(indices) for column in self])
+
+    def to_rows(self) -> List[List[Any]]:
+        """Convert the frame to rows of Python objects, with None for null values.
+
+        Returns:
+            A list containing a list of values for each row.
+        """
+        columns = [column.to_list() for column in self]
+        return [list(row) for row in zip(*columns)]
+
+    def __getitem__(self, name: str) -> TypedColumn:
+        return self._columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __iter__(self) -> Iterator[TypedColumn]:
+        return iter(self._columns.values())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return "ColumnarFrame(columns={!r}, length={})".format(
+            self.column_names, self._length
+        )
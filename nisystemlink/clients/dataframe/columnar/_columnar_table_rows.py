@@ -0,0 +1,34 @@
+"""Implementation of ColumnarTableRows."""
+
+from typing import Optional
+
+from ._columnar_frame import ColumnarFrame
+
+
+class ColumnarTableRows:
+    """Contains the result of a query for rows of data, decoded into typed columns."""
+
+    def __init__(
+        self,
+        frame: ColumnarFrame,
+        total_row_count: int,
+        continuation_token: Optional[str] = None,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            frame: The decoded rows of data.
+            total_row_count: The total number of rows matched by the query across
+                all pages of results.
+            continuation_token: A token to pass to a subsequent query to read the
+                next page of results, or None if there are no more results.
+        """
+        self.frame = frame
+        """The decoded rows of data."""
+
+        self.total_row_count = total_row_count
+        """The total number of rows matched by the query across all pages of results."""
+
+        self.continuation_token = continuation_token
+        """A token to pass to a subsequent query to read the next page of results, or
+        None if there are no more results."""
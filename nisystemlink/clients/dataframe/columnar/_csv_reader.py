@@ -0,0 +1,138 @@
+"""Incremental decoding of exported CSV table data into typed record batches."""
+
+import codecs
+import csv
+import io
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
+from nisystemlink.clients.dataframe.models import Column, DataType
+from typing_extensions import Protocol
+
+from ._columnar_frame import ColumnarFrame
+from ._decoding import decode_column
+
+_DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _Readable(Protocol):
+    def read(self, size: int = ...) -> bytes:
+        """Read at most ``size`` bytes, returning an empty result at the end."""
+
+
+def read_csv_batches(
+    source: _Readable,
+    table_columns: Sequence[Column],
+    batch_size: int = 10000,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8-sig",
+) -> Iterator[ColumnarFrame]:
+    """Incrementally parse CSV table data into batches of typed columns.
+
+    The data is read from ``source`` ``chunk_size`` bytes at a time, so memory use
+    is bounded by the batch size rather than by the size of the data. The first
+    row must be a header containing the column names, as returned by
+    :meth:`DataFrameClient.export_table_data
+    <nisystemlink.clients.dataframe.DataFrameClient.export_table_data>`.
+
+    Empty values are decoded as null, except in ``STRING`` columns, where they are
+    decoded as empty strings.
+
+    Args:
+        source: A binary file-like object to read the CSV data from.
+        table_columns: The definitions of the table's columns, used to determine
+            the data type of each column named in the header.
+        batch_size: The maximum number of rows in each batch.
+        chunk_size: The number of bytes to read from ``source`` at a time.
+        encoding: The text encoding of the data. The default accepts UTF-8 data
+            with or without a byte order mark.
+
+    Returns:
+        An iterator over the batches of rows, in order. Each batch contains
+        ``batch_size`` rows, except for the last batch, which may contain fewer.
+
+    Raises:
+        ValueError: if ``batch_size`` or ``chunk_size`` is less than one.
+        ValueError: if the header contains a column that is not in
+            ``table_columns``.
+        ValueError: if a row does not have a value for every column, or a value
+            cannot be converted to its column's data type.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size cannot be 0 or negative")
+    if chunk_size < 1:
+        raise ValueError("chunk_size cannot be 0 or negative")
+
+    return _read_csv_batches(source, table_columns, batch_size, chunk_size, encoding)
+
+
+def _read_csv_batches(
+    source: _Readable,
+    table_columns: Sequence[Column],
+    batch_size: int,
+    chunk_size: int,
+    encoding: str,
+) -> Iterator[ColumnarFrame]:
+    reader = csv.reader(_iterate_lines(source, chunk_size, encoding))
+    names = next(reader, None)
+    if names is None:
+        return
+
+    data_types = {
+        column.name: column.data_type for column in table_columns
+    }  # type: Dict[str, DataType]
+    for name in names:
+        if name not in data_types:
+            raise ValueError("Unknown column: '{}'".format(name))
+    types = [data_types[name] for name in names]
+
+    batch = []  # type: List[List[str]]
+    for row in reader:
+        if len(row) != len(names):
+            if not row:
+                # Ignore blank lines, such as a trailing line break.
+                continue
+            raise ValueError(
+                "Expected {} values in row but found {}".format(len(names), len(row))
+            )
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield _decode_batch(names, types, batch)
+            batch = []
+
+    if batch:
+        yield _decode_batch(names, types, batch)
+
+
+def _decode_batch(
+    names: List[str], types: List[DataType], rows: List[List[str]]
+) -> ColumnarFrame:
+    cells = np.empty((len(rows), len(names)), dtype=object)
+    cells[:] = rows
+
+    columns = []
+    for index, (name, data_type) in enumerate(zip(names, types)):
+        values = cells[:, index]
+        if data_type != DataType.String:
+            values[values == ""] = None
+        columns.append(decode_column(name, data_type, values))
+    return ColumnarFrame(columns)
+
+
+def _iterate_lines(source: _Readable, chunk_size: int, encoding: str) -> Iterator[str]:
+    """Read lines of text, including their line endings, from a binary source."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    partial = ""
+    while True:
+        chunk = source.read(chunk_size)
+        text = partial + decoder.decode(chunk, final=not chunk)
+        if chunk:
+            # The text after the last line break may continue in the next chunk.
+            end = text.rfind("\n") + 1
+            partial = text[end:]
+            text = text[:end]
+        # Only split on "\n", since other line boundaries recognized by
+        # str.splitlines may appear unquoted within CSV values.
+        yield from io.StringIO(text, newline="\n")
+        if not chunk:
+            return
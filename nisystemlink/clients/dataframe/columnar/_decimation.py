@@ -0,0 +1,328 @@
+"""Client-side decimation of typed table data."""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from nisystemlink.clients.dataframe.models import (
+    DataType,
+    DecimationMethod,
+    DecimationOptions,
+)
+
+from ._columnar_frame import ColumnarFrame
+from ._typed_column import TypedColumn
+
+_DEFAULT_INTERVALS = 1000
+
+_NUMERIC_TYPES = (
+    DataType.Float32,
+    DataType.Float64,
+    DataType.Int32,
+    DataType.Int64,
+    DataType.Timestamp,
+)
+
+
+def decimate(
+    frame: ColumnarFrame,
+    options: Optional[DecimationOptions] = None,
+    index_column: Optional[str] = None,
+) -> ColumnarFrame:
+    """Decimate rows of data locally, the same way as
+    :meth:`DataFrameClient.query_decimated_data
+    <nisystemlink.clients.dataframe.DataFrameClient.query_decimated_data>`.
+
+    The rows are ordered by ``x_column``, excluding rows where it is null or
+    ``NaN``. For :class:`DecimationMethod.MaxMin
+    <nisystemlink.clients.dataframe.models.DecimationMethod>` and
+    ``EntryExit``, the range of ``x_column`` values is divided into ``intervals``
+    intervals of equal width, and each interval contributes the rows holding the
+    minimum and maximum of each of the ``y_columns``, plus its first and last row
+    for ``EntryExit``. For ``Lossy``, ``intervals`` rows are sampled uniformly.
+    Rows are returned in ``x_column`` order, without duplicates.
+
+    Args:
+        frame: The rows to decimate.
+        options: The decimation options. If not specified, the service's defaults
+            are used: ``Lossy`` decimation into 1000 intervals over the index column.
+        index_column: The name of the table's index column, used when
+            ``options`` does not specify an ``x_column``.
+
+    Returns:
+        The decimated rows, with the same columns as ``frame``.
+
+    Raises:
+        ValueError: if neither ``x_column`` nor ``index_column`` is specified.
+        ValueError: if ``intervals`` is less than one.
+        ValueError: if an x or y column is not a numeric or timestamp column.
+        ValueError: if the method is ``MaxMin`` and there are no y columns.
+        KeyError: if an x or y column is not in ``frame``.
+    """
+    x_name, y_names, method, intervals = _resolve_options(frame, options, index_column)
+    frame, x = _sort_by_x(frame, x_name)
+    if len(x) == 0:
+        return frame
+
+    ys = [_axis_values(frame[name]) for name in y_names]
+    indices = _decimate_indices(x, ys, method, intervals, (x[0], x[-1]))
+    return frame.take(indices)
+
+
+class DecimationPyramid:
+    """Decimated copies of downloaded rows at several resolutions, for quickly
+    decimating any range of the rows, such as when zooming a plot.
+
+    Level 0 holds every row, ordered by ``x_column``. Each following level
+    decimates the whole x range into ``factor`` times fewer intervals than the
+    level before it, down to ``intervals`` intervals. Since the intervals of each
+    level evenly divide those of the next, the ``MaxMin`` and ``EntryExit``
+    levels are exact: every level contains the same rows as decimating all of the
+    rows directly.
+
+    :meth:`query` decimates a range of x values starting from the coarsest level
+    whose intervals are no wider than the requested intervals, so its cost
+    depends on the number of intervals requested rather than on the number of
+    rows. Within an interval that is not aligned with the level's intervals, the
+    extrema found are those of the level's intervals that overlap it.
+    """
+
+    def __init__(
+        self,
+        frame: ColumnarFrame,
+        options: Optional[DecimationOptions] = None,
+        index_column: Optional[str] = None,
+        factor: int = 4,
+    ) -> None:
+        """Build the pyramid.
+
+        Args:
+            frame: The rows to decimate.
+            options: The decimation options. ``intervals`` is the number of
+                intervals in the coarsest level and the default for :meth:`query`.
+            index_column: The name of the table's index column, used when
+                ``options`` does not specify an ``x_column``.
+            factor: The ratio between the number of intervals of consecutive levels.
+
+        Raises:
+            ValueError: if neither ``x_column`` nor ``index_column`` is specified.
+            ValueError: if ``intervals`` is less than one or ``factor`` is less
+                than two.
+            ValueError: if an x or y column is not a numeric or timestamp column.
+            ValueError: if the method is ``MaxMin`` and there are no y columns.
+            KeyError: if an x or y column is not in ``frame``.
+        """
+        if factor < 2:
+            raise ValueError("factor must be at least 2")
+
+        x_name, y_names, method, intervals = _resolve_options(
+            frame, options, index_column
+        )
+        frame, x = _sort_by_x(frame, x_name)
+
+        self._x_name = x_name
+        self._y_names = y_names
+        self._method = method
+        self._intervals = intervals
+        self._x_type = frame[x_name].data_type
+        self._range = (x[0], x[-1]) if len(x) else (0.0, 0.0)
+
+        # Each level is (interval count, frame, x values), from finest to coarsest.
+        # Level 0 has no interval count since it holds every row.
+        self._levels: List[Tuple[Optional[int], ColumnarFrame, np.ndarray]] = [
+            (None, frame, x)
+        ]
+        level_intervals = []  # type: List[int]
+        count = intervals
+        while _rows_per_interval(method, len(y_names)) * count < len(x):
+            level_intervals.append(count)
+            count *= factor
+        for count in reversed(level_intervals):
+            _, finer, finer_x = self._levels[-1]
+            source = frame if method == DecimationMethod.Lossy else finer
+            source_x = x if method == DecimationMethod.Lossy else finer_x
+            ys = [_axis_values(source[name]) for name in y_names]
+            indices = _decimate_indices(source_x, ys, method, count, self._range)
+            self._levels.append((count, source.take(indices), source_x[indices]))
+
+    @property
+    def levels(self) -> List[ColumnarFrame]:  # noqa: D401
+        """The rows of each level, from every row to the coarsest level."""
+        return [frame for _, frame, _ in self._levels]
+
+    def query(
+        self,
+        x_min: Any = None,
+        x_max: Any = None,
+        intervals: Optional[int] = None,
+    ) -> ColumnarFrame:
+        """Decimate the rows with x values in a range.
+
+        Args:
+            x_min: The smallest x value to include, or None to start at the first
+                row. Timestamps may be given as ``datetime`` or ``numpy.datetime64``.
+            x_max: The largest x value to include, or None to end at the last row.
+            intervals: The number of intervals to decimate the range into. Defaults
+                to the ``intervals`` the pyramid was built with.
+
+        Returns:
+            The decimated rows, in ``x_column`` order.
+
+        Raises:
+            ValueError: if ``intervals`` is less than one.
+        """
+        if intervals is None:
+            intervals = self._intervals
+        if intervals < 1:
+            raise ValueError("intervals cannot be 0 or negative")
+
+        low = self._range[0] if x_min is None else _to_axis(self._x_type, x_min)
+        high = self._range[1] if x_max is None else _to_axis(self._x_type, x_max)
+        full_width = self._range[1] - self._range[0]
+        query_width = high - low
+
+        level = self._levels[0]
+        for candidate in self._levels[1:]:
+            count = candidate[0]
+            assert count is not None
+            # Use the level if its intervals are no wider than the requested ones.
+            if full_width * intervals > query_width * count:
+                break
+            level = candidate
+
+        _, frame, x = level
+        start = np.searchsorted(x, low, side="left")
+        stop = np.searchsorted(x, high, side="right")
+        if stop <= start:
+            return frame.take(np.arange(0))
+
+        frame = frame.take(np.arange(start, stop))
+        x = x[start:stop]
+        ys = [_axis_values(frame[name]) for name in self._y_names]
+        indices = _decimate_indices(x, ys, self._method, intervals, (low, high))
+        return frame.take(indices)
+
+
+def _resolve_options(
+    frame: ColumnarFrame,
+    options: Optional[DecimationOptions],
+    index_column: Optional[str],
+) -> Tuple[str, List[str], DecimationMethod, int]:
+    options = options or DecimationOptions()
+    x_name = options.x_column or index_column
+    if x_name is None:
+        raise ValueError("x_column or index_column must be specified")
+    intervals = (
+        options.intervals if options.intervals is not None else _DEFAULT_INTERVALS
+    )
+    if intervals < 1:
+        raise ValueError("intervals cannot be 0 or negative")
+    method = options.method or DecimationMethod.Lossy
+
+    if options.y_columns is not None:
+        y_names = list(options.y_columns)
+    elif method == DecimationMethod.Lossy:
+        y_names = []
+    else:
+        y_names = [
+            column.name
+            for column in frame
+            if column.name != x_name and column.data_type in _NUMERIC_TYPES
+        ]
+
+    if method == DecimationMethod.MaxMin and not y_names:
+        raise ValueError("MaxMin decimation requires at least one y column")
+
+    for name in [x_name] + y_names:
+        _check_numeric(frame[name])
+    return x_name, y_names, method, intervals
+
+
+def _check_numeric(column: TypedColumn) -> None:
+    if column.data_type not in _NUMERIC_TYPES:
+        raise ValueError(
+            "Column '{}' must be a numeric or timestamp column".format(column.name)
+        )
+
+
+def _axis_values(column: TypedColumn) -> np.ndarray:
+    """Return the column's values as float64, with NaN in place of null values.
+
+    Timestamps are converted to milliseconds since the epoch.
+    """
+    if column.data_type == DataType.Timestamp:
+        invalid = column.mask | np.isnat(column.values)
+        values = column.values.astype(np.int64).astype(np.float64)
+    else:
+        values = column.values.astype(np.float64)
+        invalid = column.mask
+    return np.where(invalid, np.nan, values)
+
+
+def _to_axis(data_type: DataType, value: Any) -> float:
+    if data_type == DataType.Timestamp:
+        if getattr(value, "tzinfo", None) is not None:
+            value = value.replace(tzinfo=None) - value.utcoffset()
+        return float(np.datetime64(value, "ms").astype(np.int64))
+    return float(value)
+
+
+def _sort_by_x(frame: ColumnarFrame, x_name: str) -> Tuple[ColumnarFrame, np.ndarray]:
+    x = _axis_values(frame[x_name])
+    indices = np.flatnonzero(~np.isnan(x))
+    indices = indices[np.argsort(x[indices], kind="stable")]
+    return frame.take(indices), x[indices]
+
+
+def _rows_per_interval(method: DecimationMethod, y_count: int) -> int:
+    if method == DecimationMethod.Lossy:
+        return 1
+    if method == DecimationMethod.MaxMin:
+        return 2 * y_count
+    return 2 * y_count + 2
+
+
+def _decimate_indices(
+    x: np.ndarray,
+    ys: Sequence[np.ndarray],
+    method: DecimationMethod,
+    intervals: int,
+    x_range: Tuple[float, float],
+) -> np.ndarray:
+    """Return the sorted positions of the rows to keep from rows sorted by x."""
+    count = len(x)
+    if method == DecimationMethod.Lossy:
+        if count <= intervals:
+            return np.arange(count)
+        return np.unique(
+            np.round(np.linspace(0, count - 1, intervals)).astype(np.int64)
+        )
+
+    low, high = x_range
+    if high > low:
+        bins = np.floor((x - low) / (high - low) * intervals).astype(np.int64)
+        np.clip(bins, 0, intervals - 1, out=bins)
+    else:
+        bins = np.zeros(count, dtype=np.int64)
+
+    is_start = np.ones(count, dtype=np.bool_)
+    is_start[1:] = bins[1:] != bins[:-1]
+    starts = np.flatnonzero(is_start)
+    segment = np.cumsum(is_start) - 1
+    lengths = np.diff(np.append(starts, count))
+
+    selected = []  # type: List[np.ndarray]
+    if method == DecimationMethod.EntryExit:
+        selected.append(starts)
+        selected.append(np.append(starts[1:], count) - 1)
+
+    for y in ys:
+        valid = ~np.isnan(y)
+        for reduce, fill in ((np.minimum, np.inf), (np.maximum, -np.inf)):
+            values = np.where(valid, y, fill)
+            extrema = np.repeat(reduce.reduceat(values, starts), lengths)
+            hits = np.flatnonzero(valid & (values == extrema))
+            # Keep the first row holding the extreme value in each interval.
+            _, first = np.unique(segment[hits], return_index=True)
+            selected.append(hits[first])
+
+    return np.unique(np.concatenate(selected))
@@ -0,0 +1,146 @@
+"""Functions for decoding string-encoded table data into typed columns."""
+
+import warnings
+from datetime import timezone
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+from nisystemlink.clients.dataframe.models import Column, DataFrame, DataType
+from pydantic.datetime_parse import parse_datetime
+
+from ._columnar_frame import ColumnarFrame
+from ._typed_column import NUMPY_DTYPES, TypedColumn
+
+
+# Placeholder strings substituted for nulls so that a column can be converted in a
+# single vectorized cast. The resulting values are hidden by the column's mask.
+_NULL_PLACEHOLDERS = {
+    DataType.Bool: "false",
+    DataType.Float32: "NaN",
+    DataType.Float64: "NaN",
+    DataType.Int32: "0",
+    DataType.Int64: "0",
+    DataType.Timestamp: "NaT",
+}
+
+
+def decode_column(
+    name: str,
+    data_type: DataType,
+    values: Union[Sequence[Optional[str]], np.ndarray],
+) -> TypedColumn:
+    """Decode the string-encoded values of a column into a :class:`TypedColumn`.
+
+    The values must use the encoding described on
+    :class:`DataFrame <nisystemlink.clients.dataframe.models.DataFrame>`.
+
+    Args:
+        name: The name of the column.
+        data_type: The data type of the column.
+        values: The encoded values of the column, with None for null values.
+
+    Returns:
+        The decoded column.
+
+    Raises:
+        ValueError: if a value cannot be converted to ``data_type``.
+    """
+    if isinstance(values, np.ndarray) and values.dtype == object:
+        cells = values
+    else:
+        cells = np.empty(len(values), dtype=object)
+        cells[:] = values
+    # Compare against None element-wise rather than by identity.
+    mask = cells == None  # noqa: E711
+    has_nulls = bool(mask.any())
+
+    if data_type == DataType.String:
+        return TypedColumn(name, data_type, cells, mask if has_nulls else None)
+
+    if has_nulls:
+        cells = np.where(mask, _NULL_PLACEHOLDERS[data_type], cells)
+    text = cells.astype(str)
+
+    if data_type == DataType.Bool:
+        decoded = _decode_bools(text)
+    elif data_type == DataType.Timestamp:
+        decoded = _decode_timestamps(text)
+    else:
+        decoded = text.astype(NUMPY_DTYPES[data_type])
+
+    return TypedColumn(name, data_type, decoded, mask if has_nulls else None)
+
+
+def decode_frame(frame: DataFrame, table_columns: Sequence[Column]) -> ColumnarFrame:
+    """Decode a :class:`DataFrame <nisystemlink.clients.dataframe.models.DataFrame>`
+    into a :class:`ColumnarFrame`.
+
+    Args:
+        frame: The data frame to decode.
+        table_columns: The definitions of the table's columns, used to determine
+            the data type of each column in ``frame``. If ``frame`` does not specify
+            its columns, it is assumed to contain all of these columns in order.
+
+    Returns:
+        The decoded frame.
+
+    Raises:
+        ValueError: if ``frame`` contains a column that is not in ``table_columns``.
+        ValueError: if a value cannot be converted to its column's data type.
+    """
+    data_types = {
+        column.name: column.data_type for column in table_columns
+    }  # type: Dict[str, DataType]
+    names = (
+        frame.columns
+        if frame.columns is not None
+        else [column.name for column in table_columns]
+    )
+    for name in names:
+        if name not in data_types:
+            raise ValueError("Unknown column: '{}'".format(name))
+
+    cells = np.empty((len(frame.data), len(names)), dtype=object)
+    if frame.data:
+        cells[:] = frame.data
+
+    return ColumnarFrame(
+        [
+            decode_column(name, data_types[name], cells[:, index])
+            for index, name in enumerate(names)
+        ]
+    )
+
+
+def _decode_bools(text: np.ndarray) -> np.ndarray:
+    """Convert case-insensitive ``"true"`` and ``"false"`` strings into a bool array."""
+    lowered = np.char.lower(text)
+    decoded = lowered == "true"
+    invalid = ~decoded & (lowered != "false")
+    if invalid.any():
+        raise ValueError("Invalid bool value: '{}'".format(text[np.argmax(invalid)]))
+    return decoded
+
+
+def _decode_timestamps(text: np.ndarray) -> np.ndarray:
+    """Convert ISO-8601 timestamp strings into a ``datetime64[ms]`` array in UTC."""
+    # The service returns UTC timestamps with a "Z" suffix, which NumPy can parse
+    # directly once the suffix is removed. NumPy warns about explicit offsets, in
+    # which case the values are parsed individually instead.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            return np.char.rstrip(text, "Z").astype("datetime64[ms]")
+    except (ValueError, UserWarning, DeprecationWarning):
+        pass
+
+    decoded = np.empty(len(text), dtype="datetime64[ms]")
+    for index, value in enumerate(text.tolist()):
+        if value == "NaT":
+            decoded[index] = np.datetime64("NaT")
+            continue
+        timestamp = parse_datetime(value)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        decoded[index] = np.datetime64(timestamp, "ms")
+    return decoded
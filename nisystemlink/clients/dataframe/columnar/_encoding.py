@@ -0,0 +1,96 @@
+"""Functions for encoding typed columns into string-encoded table data."""
+
+from typing import Optional, Sequence
+
+import numpy as np
+from nisystemlink.clients.dataframe.models import DataFrame, DataType
+
+from ._columnar_frame import ColumnarFrame
+from ._typed_column import TypedColumn
+
+
+def encode_column(column: TypedColumn) -> np.ndarray:
+    """Encode the values of a :class:`TypedColumn` as strings.
+
+    The values use the encoding described on
+    :class:`DataFrame <nisystemlink.clients.dataframe.models.DataFrame>`.
+    ``FLOAT32`` and ``FLOAT64`` values are written with the fewest digits that
+    convert back to exactly the same value, and ``TIMESTAMP`` values are written
+    in UTC with millisecond precision, such as ``"2022-08-19T16:17:30.123Z"``.
+
+    Args:
+        column: The column to encode.
+
+    Returns:
+        An object array holding the encoded value of each row, with None for null
+        values. ``NaT`` timestamps are also encoded as None.
+    """
+    values = column.values
+    mask = column.mask
+    data_type = column.data_type
+
+    if data_type == DataType.String:
+        encoded = values
+    elif data_type == DataType.Bool:
+        encoded = np.where(values, "true", "false")
+    elif data_type == DataType.Timestamp:
+        mask = mask | np.isnat(values)
+        encoded = np.char.add(np.datetime_as_string(values, unit="ms"), "Z")
+    elif data_type == DataType.Float64:
+        # NumPy's vectorized conversions, such as astype(str) and np.char.mod,
+        # write the same shortest round-trip strings but are slower than Python's
+        # repr of each value. See benchmarks/encode_columns.py.
+        encoded = _encode_special_floats(
+            values,
+            np.array([repr(value) for value in values.tolist()], dtype=object),
+        )
+    elif data_type == DataType.Float32:
+        encoded = _encode_special_floats(values, values.astype(str))
+    else:
+        encoded = values.astype(str)
+
+    cells = encoded.astype(object, copy=False)
+    if mask.any():
+        if cells is values:
+            cells = cells.copy()
+        cells[mask] = None
+    return cells
+
+
+def encode_frame(
+    frame: ColumnarFrame, columns: Optional[Sequence[str]] = None
+) -> DataFrame:
+    """Encode a :class:`ColumnarFrame` into a :class:`DataFrame
+    <nisystemlink.clients.dataframe.models.DataFrame>` for appending rows.
+
+    See :func:`encode_column` for how the values are encoded.
+
+    Args:
+        frame: The frame to encode.
+        columns: The names of the columns to include, in order, or None to
+            include every column of ``frame``.
+
+    Returns:
+        The encoded data frame.
+
+    Raises:
+        KeyError: if a column in ``columns`` is not in ``frame``.
+    """
+    names = list(columns) if columns is not None else frame.column_names
+    cells = np.empty((len(frame), len(names)), dtype=object)
+    for index, name in enumerate(names):
+        cells[:, index] = encode_column(frame[name])
+    # Every value is already a string or None, so validating each row is skipped.
+    return DataFrame.construct(columns=names, data=cells.tolist())
+
+
+def _encode_special_floats(values: np.ndarray, text: np.ndarray) -> np.ndarray:
+    """Replace the text of non-finite values with the service's spelling."""
+    finite = np.isfinite(values)
+    if finite.all():
+        return text
+    text = text.astype(object)
+    text[np.isnan(values)] = "NaN"
+    text[np.isposinf(values)] = "Infinity"
+    text[np.isneginf(values)] = "-Infinity"
+    return text
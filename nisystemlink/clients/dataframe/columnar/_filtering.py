@@ -0,0 +1,218 @@
+"""Client-side filtering and ordering of typed table data."""
+
+from typing import Any, Optional, Sequence
+
+import numpy as np
+from nisystemlink.clients.dataframe.models import (
+    ColumnFilter,
+    ColumnOrderBy,
+    DataType,
+    FilterOperation,
+    QueryTableDataRequest,
+)
+
+from ._columnar_frame import ColumnarFrame
+from ._decoding import decode_column
+from ._typed_column import TypedColumn
+
+_COMPARISONS = {
+    FilterOperation.Equals: np.equal,
+    FilterOperation.NotEquals: np.not_equal,
+    FilterOperation.LessThan: np.less,
+    FilterOperation.LessThanEquals: np.less_equal,
+    FilterOperation.GreaterThan: np.greater,
+    FilterOperation.GreaterThanEquals: np.greater_equal,
+}
+
+_FLOAT_TYPES = (DataType.Float32, DataType.Float64)
+
+
+def evaluate_filters(
+    frame: ColumnarFrame, filters: Optional[Sequence[ColumnFilter]]
+) -> np.ndarray:
+    """Determine which rows match every filter, the same way as the DataFrame
+    Service evaluates the ``filters`` of a query.
+
+    A null value only matches an ``EQUALS`` filter whose value is None. A
+    ``NOT_EQUALS`` filter whose value is None matches every non-null value, and
+    any other filter never matches a null value. ``NaN`` values only match
+    ``NOT_EQUALS`` filters, and a ``NOT_EQUALS`` filter whose value is ``NaN``
+    matches every non-null value except ``NaN``. ``CONTAINS`` and ``NOT_CONTAINS``
+    compare strings case-sensitively.
+
+    Args:
+        frame: The rows to filter.
+        filters: The filters to apply, or None to match every row.
+
+    Returns:
+        A boolean array that is ``True`` for each row matching every filter.
+
+    Raises:
+        ValueError: if a filter's operation is not supported for its column's data
+            type or value, as described on :class:`ColumnFilter
+            <nisystemlink.clients.dataframe.models.ColumnFilter>`.
+        ValueError: if a filter's value cannot be converted to its column's data
+            type.
+        KeyError: if a filter's column is not in ``frame``.
+    """
+    matches = np.ones(len(frame), dtype=np.bool_)
+    for column_filter in filters or []:
+        matches &= _evaluate_filter(frame[column_filter.column], column_filter)
+    return matches
+
+
+def filter_frame(
+    frame: ColumnarFrame, filters: Optional[Sequence[ColumnFilter]]
+) -> ColumnarFrame:
+    """Select the rows that match every filter, keeping their order.
+
+    See :func:`evaluate_filters` for how the filters are evaluated.
+
+    Args:
+        frame: The rows to filter.
+        filters: The filters to apply, or None to select every row.
+
+    Returns:
+        The matching rows.
+
+    Raises:
+        ValueError: if a filter is not valid for its column.
+        KeyError: if a filter's column is not in ``frame``.
+    """
+    if not filters:
+        return frame
+    return frame.take(np.flatnonzero(evaluate_filters(frame, filters)))
+
+
+def sort_frame(
+    frame: ColumnarFrame, order_by: Optional[Sequence[ColumnOrderBy]]
+) -> ColumnarFrame:
+    """Order rows by the values of one or more columns.
+
+    Rows with the same values for the first column are ordered by the next
+    column, and so on, and rows with the same values for every column keep their
+    order. Null values are ordered after all other values, and ``NaN`` values
+    after all other non-null values, so they come last when ascending and first
+    when descending.
+
+    Args:
+        frame: The rows to order.
+        order_by: The columns to order by, or None to keep the rows' order.
+
+    Returns:
+        The ordered rows.
+
+    Raises:
+        KeyError: if an ``order_by`` column is not in ``frame``.
+    """
+    if not order_by:
+        return frame
+
+    # np.lexsort sorts by the last key first, so the keys are given in reverse.
+    keys = []
+    for column_order in reversed(order_by):
+        ranks = _ranks(frame[column_order.column])
+        keys.append(-ranks if column_order.descending else ranks)
+    return frame.take(np.lexsort(keys))
+
+
+def query_frame(frame: ColumnarFrame, query: QueryTableDataRequest) -> ColumnarFrame:
+    """Apply a query's ``filters``, ``order_by``, ``columns``, and ``take`` to rows
+    that have already been read, the same way as
+    :meth:`DataFrameClient.query_table_data
+    <nisystemlink.clients.dataframe.DataFrameClient.query_table_data>`.
+
+    ``continuation_token`` is ignored, and all of the matching rows are returned
+    if ``take`` is not specified.
+
+    Args:
+        frame: The rows to query.
+        query: The filtering and sorting to apply.
+
+    Returns:
+        The matching rows, with the query's columns.
+
+    Raises:
+        ValueError: if a filter is not valid for its column.
+        KeyError: if a column in the query is not in ``frame``.
+    """
+    frame = sort_frame(filter_frame(frame, query.filters), query.order_by)
+    if query.take is not None:
+        frame = frame.take(np.arange(min(query.take, len(frame))))
+    if query.columns is not None:
+        frame = ColumnarFrame([frame[name] for name in query.columns])
+    return frame
+
+
+def _evaluate_filter(column: TypedColumn, column_filter: ColumnFilter) -> np.ndarray:
+    operation = column_filter.operation
+    value = column_filter.value
+    is_string = column.data_type == DataType.String
+
+    if operation in (FilterOperation.Contains, FilterOperation.NotContains):
+        if not is_string:
+            raise ValueError(
+                "Column '{}' does not support {}".format(column.name, operation.value)
+            )
+        if value is None:
+            raise ValueError("A null value can only be used with EQUALS or NOT_EQUALS")
+        found = np.char.find(column.values.astype(str), value) >= 0
+        if operation == FilterOperation.NotContains:
+            found = ~found
+        return found & ~column.mask
+
+    if value is None:
+        if operation == FilterOperation.Equals:
+            return column.mask.copy()
+        if operation == FilterOperation.NotEquals:
+            return ~column.mask
+        raise ValueError("A null value can only be used with EQUALS or NOT_EQUALS")
+
+    if is_string and operation not in (
+        FilterOperation.Equals,
+        FilterOperation.NotEquals,
+    ):
+        raise ValueError(
+            "Column '{}' does not support {}".format(column.name, operation.value)
+        )
+
+    target = _parse_value(column, value)
+    if column.data_type in _FLOAT_TYPES and np.isnan(target):
+        if operation != FilterOperation.NotEquals:
+            raise ValueError("A NaN value can only be used with NOT_EQUALS")
+        return np.logical_not(column.mask | np.isnan(column.values))
+
+    # NaN compares unequal to every value, so NaN values only match NOT_EQUALS.
+    return _COMPARISONS[operation](column.values, target) & ~column.mask
+
+
+def _parse_value(column: TypedColumn, value: str) -> Any:
+    if column.data_type == DataType.Bool and value.lower() not in ("true", "false"):
+        raise ValueError(
+            "Value '{}' cannot be converted to {}".format(value, column.data_type.value)
+        )
+    try:
+        return decode_column(column.name, column.data_type, [value]).values[0]
+    except ValueError as ex:
+        raise ValueError(
+            "Value '{}' cannot be converted to {}".format(value, column.data_type.value)
+        ) from ex
+
+
+def _ranks(column: TypedColumn) -> np.ndarray:
+    """Return an integer for each row that orders the rows by the column's value,
+    with ``NaN`` values after all other values and null values after ``NaN``.
+    """
+    valid = np.logical_not(column.mask)
+    if column.data_type in _FLOAT_TYPES:
+        is_nan = valid & np.isnan(column.values)
+        valid &= ~is_nan
+    else:
+        is_nan = np.zeros(len(column), dtype=np.bool_)
+
+    ranks = np.empty(len(column), dtype=np.int64)
+    unique, inverse = np.unique(column.values[valid], return_inverse=True)
+    ranks[valid] = inverse
+    ranks[is_nan] = len(unique)
+    ranks[column.mask] = len(unique) + 1
+    return ranks
@@ -0,0 +1,143 @@
+"""Conversion between typed columns and pandas DataFrames.
+
+These functions require pandas, which is installed with the ``pandas`` extra.
+"""
+
+from typing import Any, Dict, Sequence, TYPE_CHECKING
+
+import numpy as np
+from nisystemlink.clients.dataframe.models import Column, DataType
+
+from ._columnar_frame import ColumnarFrame
+from ._typed_column import NUMPY_DTYPES, TypedColumn
+
+if TYPE_CHECKING:
+    import pandas
+
+
+def to_pandas(frame: ColumnarFrame) -> "pandas.DataFrame":
+    """Convert a :class:`ColumnarFrame` into a pandas DataFrame.
+
+    Requires the ``pandas`` extra. The columns' arrays are used without copying
+    them where possible. Columns that contain null values use pandas' nullable
+    data types, so a null value (``pandas.NA``) stays distinct from ``NaN``.
+    ``TIMESTAMP`` columns are converted to UTC timestamps, with ``NaT`` for null
+    values, and ``STRING`` columns hold Python strings, with None for null values.
+
+    Args:
+        frame: The frame to convert.
+
+    Returns:
+        A pandas DataFrame with a column for each column of ``frame``.
+    """
+    pandas = _import_pandas()
+    return pandas.DataFrame(
+        {column.name: _to_pandas_array(pandas, column) for column in frame},
+        copy=False,
+    )
+
+
+def from_pandas(
+    data: "pandas.DataFrame", table_columns: Sequence[Column]
+) -> ColumnarFrame:
+    """Convert a pandas DataFrame into a :class:`ColumnarFrame`.
+
+    Requires the ``pandas`` extra. Missing values (``pandas.NA``, None, and
+    ``NaT``) become null values. ``NaN`` values in ``FLOAT32`` and ``FLOAT64``
+    columns are kept as ``NaN`` unless the column uses a pandas nullable data
+    type, in which case only its missing values are null. Timestamps without a
+    time zone are assumed to be UTC.
+
+    Args:
+        data: The DataFrame to convert. Its column names must be the names of
+            table columns.
+        table_columns: The definitions of the table's columns, used to determine
+            the data type of each column in ``data``.
+
+    Returns:
+        The converted frame, with the columns of ``data`` in order.
+
+    Raises:
+        ValueError: if ``data`` contains a column that is not in ``table_columns``.
+        ValueError: if a value cannot be converted to its column's data type.
+    """
+    pandas = _import_pandas()
+    data_types = {
+        column.name: column.data_type for column in table_columns
+    }  # type: Dict[str, DataType]
+    columns = []
+    for name in data.columns:
+        if name not in data_types:
+            raise ValueError("Unknown column: '{}'".format(name))
+        columns.append(_from_pandas_series(pandas, name, data_types[name], data[name]))
+    return ColumnarFrame(columns)
+
+
+def _import_pandas() -> Any:
+    try:
+        import pandas
+    except ImportError as ex:
+        raise ImportError(
+            "Converting table data to and from pandas requires pandas. Install it "
+            'with pip install "nisystemlink-clients[pandas]".'
+        ) from ex
+    return pandas
+
+
+def _to_pandas_array(pandas: Any, column: TypedColumn) -> Any:
+    values = column.values
+    data_type = column.data_type
+
+    if data_type == DataType.Timestamp:
+        if column.has_nulls:
+            values = np.where(column.mask, np.datetime64("NaT", "ms"), values)
+        return pandas.DatetimeIndex(values).tz_localize("UTC")
+
+    if data_type == DataType.String:
+        if column.has_nulls:
+            values = values.copy()
+            values[column.mask] = None
+        return values
+
+    if not column.has_nulls:
+        return values
+    if data_type == DataType.Bool:
+        return pandas.arrays.BooleanArray(values, column.mask)
+    if data_type in (DataType.Float32, DataType.Float64):
+        return pandas.arrays.FloatingArray(values, column.mask)
+    return pandas.arrays.IntegerArray(values, column.mask)
+
+
+def _from_pandas_series(
+    pandas: Any, name: str, data_type: DataType, series: Any
+) -> TypedColumn:
+    if data_type == DataType.Timestamp:
+        timestamps = pandas.to_datetime(series, utc=True)
+        mask = timestamps.isna().to_numpy()
+        values = timestamps.dt.tz_localize(None).to_numpy(dtype="datetime64[ms]")
+        return TypedColumn(name, data_type, values, mask)
+
+    if data_type == DataType.String:
+        mask = series.isna().to_numpy()
+        values = series.to_numpy(dtype=object)
+        if mask.any():
+            values = values.copy()
+            values[mask] = None
+        return TypedColumn(name, data_type, values, mask)
+
+    if isinstance(series.dtype, pandas.api.extensions.ExtensionDtype):
+        mask = series.isna().to_numpy()
+        # The placeholder for missing values is hidden by the mask.
+        values = series.to_numpy(dtype=NUMPY_DTYPES[data_type], na_value=0)
+        return TypedColumn(name, data_type, values, mask)
+
+    if data_type in (DataType.Float32, DataType.Float64):
+        return TypedColumn(name, data_type, series.to_numpy(), None)
+
+    mask = series.isna().to_numpy()
+    if mask.any():
+        raise ValueError(
+            "Column '{}' contains missing values but does not use a nullable "
+            "data type".format(name)
+        )
+    return TypedColumn(name, data_type, series.to_numpy(), None)
@@ -0,0 +1,341 @@
+"""Implementation of TableMirror."""
+
+import datetime
+import json
+import os
+from typing import Any, BinaryIO, Dict, List, Optional, TYPE_CHECKING
+
+import numpy as np
+from nisystemlink.clients.dataframe.models import (
+    ColumnFilter,
+    ColumnOrderBy,
+    ColumnType,
+    DataType,
+    FilterOperation,
+    QueryTableDataRequest,
+    TableMetadata,
+)
+
+from ._columnar_frame import ColumnarFrame
+from ._decoding import decode_frame
+from ._typed_column import NUMPY_DTYPES, TypedColumn
+
+if TYPE_CHECKING:
+    from nisystemlink.clients.dataframe import DataFrameClient
+
+_MANIFEST = "manifest.json"
+_FORMAT_VERSION = 1
+
+
+class TableMirror:
+    """A local copy of a table's rows, stored column by column in files that are
+    memory-mapped when opened.
+
+    :meth:`sync` downloads the table the first time it is called. Later calls
+    only download the rows appended since the previous sync, as detected from the
+    table's ``row_count`` and ``rows_modified_at``, and the rows are appended to
+    the existing files. If the table changes in any other way, such as its
+    columns changing or rows being removed, the whole table is downloaded again.
+
+    Each column's values are stored in a raw binary file of the column's NumPy
+    dtype, with a separate file holding its null mask, so :meth:`open` maps the
+    files into memory without reading or copying them. ``STRING`` columns are
+    stored as UTF-8 data with an array of offsets and are decoded when opened. A
+    ``manifest.json`` file records the columns, the number of rows, and the
+    table's state as of the last sync. It is replaced only after the column files
+    are written, so an interrupted incremental sync leaves the previously
+    mirrored rows intact.
+    """
+
+    def __init__(
+        self,
+        client: "DataFrameClient",
+        id: str,
+        path: str,
+        page_size: Optional[int] = None,
+    ) -> None:
+        """Initialize the mirror.
+
+        Args:
+            client: The client to use to read the table.
+            id: Unique ID of the data table to mirror.
+            path: The directory holding the mirror's files. It is created by
+                :meth:`sync` if it does not exist.
+            page_size: The number of rows to request at a time, or None to use
+                the service's default.
+        """
+        self._client = client
+        self._id = id
+        self._path = path
+        self._page_size = page_size
+
+    @property
+    def id(self) -> str:  # noqa: D401
+        """The ID of the mirrored table."""
+        return self._id
+
+    @property
+    def path(self) -> str:  # noqa: D401
+        """The directory holding the mirror's files."""
+        return self._path
+
+    @property
+    def row_count(self) -> int:  # noqa: D401
+        """The number of rows in the mirror, or 0 if it has not been synced."""
+        manifest = self._read_manifest()
+        return manifest["rowCount"] if manifest is not None else 0
+
+    @property
+    def rows_modified_at(self) -> Optional[datetime.datetime]:  # noqa: D401
+        """The table's ``rows_modified_at`` as of the last sync, or None if the
+        mirror has not been synced.
+        """
+        manifest = self._read_manifest()
+        if manifest is None:
+            return None
+        return datetime.datetime.fromisoformat(manifest["rowsModifiedAt"])
+
+    def sync(self) -> int:
+        """Bring the mirror up to date with the table.
+
+        Returns:
+            The number of rows written to the mirror.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service.
+            ValueError: if the table has no index column.
+            ValueError: if a value cannot be converted to its column's data type.
+        """
+        metadata = self._client.get_table_metadata(self._id, refresh=True)
+        manifest = self._read_manifest()
+        if manifest is None or not self._can_append(manifest, metadata):
+            return self._download(metadata, None)
+
+        if (
+            manifest["rowCount"] == metadata.row_count
+            and manifest["rowsModifiedAt"] == metadata.rows_modified_at.isoformat()
+        ):
+            return 0
+
+        previous_count = manifest["rowCount"]
+        written = self._download(metadata, manifest)
+        if previous_count + written < metadata.row_count:
+            # Rows were added before the last mirrored row, so the appended rows
+            # can't be identified by their index.
+            return self._download(metadata, None)
+        return written
+
+    def open(self) -> ColumnarFrame:
+        """Open the mirrored rows.
+
+        Returns:
+            A frame whose numeric, boolean, and timestamp columns are read-only,
+            memory-mapped views of the mirror's files.
+
+        Raises:
+            FileNotFoundError: if the mirror has not been synced.
+        """
+        manifest = self._read_manifest()
+        if manifest is None:
+            raise FileNotFoundError(os.path.join(self._path, _MANIFEST))
+
+        count = manifest["rowCount"]
+        columns = []
+        for index, column in enumerate(manifest["columns"]):
+            data_type = DataType(column["dataType"])
+            mask = self._map(index, "mask", np.dtype(np.bool_), count)
+            if data_type == DataType.String:
+                values = self._read_strings(index, count, column["stringBytes"])
+            else:
+                values = self._map(index, "values", NUMPY_DTYPES[data_type], count)
+            columns.append(TypedColumn(column["name"], data_type, values, mask))
+        return ColumnarFrame(columns)
+
+    def _can_append(self, manifest: Dict[str, Any], metadata: TableMetadata) -> bool:
+        columns = [
+            {"name": column.name, "dataType": column.data_type.value}
+            for column in metadata.columns
+        ]
+        return (
+            manifest.get("formatVersion") == _FORMAT_VERSION
+            and [
+                {"name": c["name"], "dataType": c["dataType"]}
+                for c in manifest["columns"]
+            ]
+            == columns
+            and manifest["rowCount"] <= metadata.row_count
+            and manifest["lastIndex"] is not None
+        )
+
+    def _download(
+        self, metadata: TableMetadata, manifest: Optional[Dict[str, Any]]
+    ) -> int:
+        """Download rows into the mirror, appending to an existing ``manifest``'s
+        rows or replacing them if ``manifest`` is None.
+        """
+        index_column = next(
+            (
+                column
+                for column in metadata.columns
+                if column.column_type == ColumnType.Index
+            ),
+            None,
+        )
+        if index_column is None:
+            raise ValueError("Table '{}' has no index column".format(self._id))
+        if manifest is None:
+            manifest = {
+                "formatVersion": _FORMAT_VERSION,
+                "id": self._id,
+                "columns": [
+                    {
+                        "name": column.name,
+                        "dataType": column.data_type.value,
+                        "stringBytes": 0,
+                    }
+                    for column in metadata.columns
+                ],
+                "rowCount": 0,
+                "lastIndex": None,
+            }
+            filters = None  # type: Optional[List[ColumnFilter]]
+            # Remove the manifest before replacing the files it describes, so an
+            # interrupted download isn't mistaken for a complete mirror.
+            self._remove_manifest()
+        else:
+            filters = [
+                ColumnFilter(
+                    column=index_column.name,
+                    operation=FilterOperation.GreaterThan,
+                    value=manifest["lastIndex"],
+                )
+            ]
+
+        os.makedirs(self._path, exist_ok=True)
+        names = [column.name for column in metadata.columns]
+        writers = [
+            _ColumnWriter(self, index, column.data_type, manifest)
+            for index, column in enumerate(metadata.columns)
+        ]
+        written = 0
+        try:
+            query = QueryTableDataRequest(
+                columns=names,
+                filters=filters,
+                order_by=[ColumnOrderBy(column=index_column.name)],
+                take=self._page_size,
+            )
+            for page in self._client.query_table_data_pages(self._id, query):
+                if not page.frame.data:
+                    continue
+                frame = decode_frame(page.frame, metadata.columns)
+                for column, writer in zip(frame, writers):
+                    writer.write(column)
+                written += len(frame)
+                manifest["lastIndex"] = page.frame.data[-1][
+                    names.index(index_column.name)
+                ]
+        finally:
+            for writer in writers:
+                writer.close()
+
+        for writer, entry in zip(writers, manifest["columns"]):
+            entry["stringBytes"] = writer.string_bytes
+        manifest["rowCount"] += written
+        manifest["rowsModifiedAt"] = metadata.rows_modified_at.isoformat()
+        self._write_manifest(manifest)
+        return written
+
+    def _file_path(self, index: int, kind: str) -> str:
+        """Return the path of one of the files holding the column at ``index``."""
+        return os.path.join(self._path, "column{}.{}".format(index, kind))
+
+    def _map(self, index: int, kind: str, dtype: np.dtype, count: int) -> np.ndarray:
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(
+            self._file_path(index, kind), dtype=dtype, mode="r", shape=(count,)
+        )
+
+    def _read_strings(self, index: int, count: int, size: int) -> np.ndarray:
+        offsets = self._map(index, "offsets", np.dtype(np.int64), count)
+        with open(self._file_path(index, "data"), "rb") as file:
+            data = file.read(size)
+        values = np.empty(count, dtype=object)
+        start = 0
+        for row, end in enumerate(offsets.tolist()):
+            values[row] = data[start:end].decode("utf-8")
+            start = end
+        return values
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self._path, _MANIFEST), encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def _remove_manifest(self) -> None:
+        try:
+            os.remove(os.path.join(self._path, _MANIFEST))
+        except FileNotFoundError:
+            pass
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        path = os.path.join(self._path, _MANIFEST)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file)
+        os.replace(temporary_path, path)
+
+
+class _ColumnWriter:
+    """Appends a column's values to its files."""
+
+    def __init__(
+        self,
+        mirror: TableMirror,
+        index: int,
+        data_type: DataType,
+        manifest: Dict[str, Any],
+    ) -> None:
+        count = manifest["rowCount"]
+        self.data_type = data_type
+        self.string_bytes = manifest["columns"][index]["stringBytes"]
+
+        if data_type == DataType.String:
+            sizes = {
+                "offsets": count * np.dtype(np.int64).itemsize,
+                "data": self.string_bytes,
+            }
+        else:
+            sizes = {"values": count * NUMPY_DTYPES[data_type].itemsize}
+        sizes["mask"] = count
+
+        # Discard anything written after the rows recorded in the manifest, such
+        # as by an interrupted sync.
+        self.files = {}  # type: Dict[str, BinaryIO]
+        for kind, size in sizes.items():
+            file = open(mirror._file_path(index, kind), "ab")
+            file.truncate(size)
+            self.files[kind] = file
+
+    def write(self, column: TypedColumn) -> None:
+        self.files["mask"].write(column.mask.tobytes())
+        if self.data_type != DataType.String:
+            self.files["values"].write(column.values.tobytes())
+            return
+
+        encoded = [
+            b"" if masked else value.encode("utf-8")
+            for value, masked in zip(column.values.tolist(), column.mask.tolist())
+        ]
+        lengths = np.array([len(value) for value in encoded], dtype=np.int64)
+        offsets = self.string_bytes + np.cumsum(lengths)
+        self.files["offsets"].write(offsets.tobytes())
+        self.files["data"].write(b"".join(encoded))
+        self.string_bytes += int(lengths.sum())
+
+    def close(self) -> None:
+        for file in self.files.values():
+            file.close()
@@ -0,0 +1,119 @@
+"""Implementation of TypedColumn."""
+
+from typing import Any, List, Optional
+
+import numpy as np
+from nisystemlink.clients.dataframe.models import DataType
+
+
+NUMPY_DTYPES = {
+    DataType.Bool: np.dtype(np.bool_),
+    DataType.Float32: np.dtype(np.float32),
+    DataType.Float64: np.dtype(np.float64),
+    DataType.Int32: np.dtype(np.int32),
+    DataType.Int64: np.dtype(np.int64),
+    DataType.String: np.dtype(object),
+    DataType.Timestamp: np.dtype("datetime64[ms]"),
+}
+"""The NumPy dtype used to hold the values of each :class:`DataType`."""
+
+
+class TypedColumn:
+    """The values of a single table column decoded into a NumPy array.
+
+    Null values are tracked separately in :attr:`mask`. The entries of
+    :attr:`values` at positions where the mask is set are unspecified (zero,
+    ``NaN``, ``NaT``, ``False``, or ``None`` depending on the data type) and
+    should not be used.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        data_type: DataType,
+        values: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+    ) -> None:
+        """Initialize a column.
+
+        Args:
+            name: The name of the column.
+            data_type: The data type of the column.
+            values: The decoded values of the column. Converted to the NumPy dtype
+                for ``data_type`` if necessary.
+            mask: A boolean array that is ``True`` for each null value, or None if
+                the column does not contain any nulls.
+
+        Raises:
+            ValueError: if ``mask`` is not the same length as ``values``.
+        """
+        values = np.asarray(values, dtype=NUMPY_DTYPES[data_type])
+        if mask is None:
+            mask = np.zeros(len(values), dtype=np.bool_)
+        else:
+            mask = np.asarray(mask, dtype=np.bool_)
+            if len(mask) != len(values):
+                raise ValueError("mask must be the same length as values")
+
+        self._name = name
+        self._data_type = data_type
+        self._values = values
+        self._mask = mask
+
+    @property
+    def name(self) -> str:  # noqa: D401
+        """The name of the column."""
+        return self._name
+
+    @property
+    def data_type(self) -> DataType:  # noqa: D401
+        """The data type of the column."""
+        return self._data_type
+
+    @property
+    def values(self) -> np.ndarray:  # noqa: D401
+        """The values of the column, using the NumPy dtype for :attr:`data_type`."""
+        return self._values
+
+    @property
+    def mask(self) -> np.ndarray:  # noqa: D401
+        """A boolean array that is ``True`` at each position holding a null value."""
+        return self._mask
+
+    @property
+    def has_nulls(self) -> bool:
+        """Whether any value in the column is null."""
+        return bool(self._mask.any())
+
+    def to_list(self) -> List[Any]:
+        """Convert the column to a list of Python objects, with None for null values.
+
+        Returns:
+            The values of the column.
+        """
+        result = self._values.tolist()
+        for index in np.flatnonzero(self._mask):
+            result[index] = None
+        return result
+
+    def take(self, indices: np.ndarray) -> "TypedColumn":
+        """Create a column containing the rows at the given positions.
+
+        Args:
+            indices: The positions of the rows to include, or a boolean array
+                selecting the rows to include.
+
+        Returns:
+            The new column.
+        """
+        return TypedColumn(
+            self._name, self._data_type, self._values[indices], self._mask[indices]
+        )
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return "TypedColumn(name={!r}, data_type={}, length={})".format(
+            self._name, self._data_type.value, len(self)
+        )
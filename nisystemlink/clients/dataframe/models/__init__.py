@@ -5,6 +5,8 @@ from ._column import Column
 from ._column_filter import FilterOperation, ColumnFilter
 from ._column_order_by import ColumnOrderBy
 from ._column_type import ColumnType
+from ._compact_data_frame import CompactDataFrame, CompactPagedTableRows
+from ._compact_rows import CompactRows
 from ._data_frame import DataFrame
 from ._data_type import DataType
 from ._delete_tables_partial_success import DeleteTablesPartialSuccess
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Optional, Union
 
 from nisystemlink.clients.core._uplink._json_model import JsonModel
 
+from ._compact_data_frame import CompactDataFrame
 from ._data_frame import DataFrame
 
 
@@ -10,7 +11,7 @@ class AppendTableDataRequest(JsonModel):
     required unless ``endOfData`` is true.
     """
 
-    frame: Optional[DataFrame] = None
+    frame: Optional[Union[DataFrame, CompactDataFrame]] = None
     """The data frame containing the rows to append."""
 
     end_of_data: Optional[bool] = None
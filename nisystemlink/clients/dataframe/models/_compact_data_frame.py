@@ -0,0 +1,55 @@
+from typing import Any, Dict, List, Optional
+
+from nisystemlink.clients.core._uplink._json_model import JsonModel
+from nisystemlink.clients.core._uplink._with_paging import WithPaging
+
+from ._compact_rows import CompactRows
+from ._data_frame import DataFrame
+
+
+class CompactDataFrame(JsonModel):
+    """A :class:`DataFrame` whose rows are stored column by column in contiguous
+    buffers, using much less memory than a list per row.
+
+    It is serialized to the same JSON as a :class:`DataFrame` with the same rows,
+    so it can be used as the ``frame`` of an :class:`AppendTableDataRequest`.
+    """
+
+    class Config:
+        json_encoders = {CompactRows: CompactRows.to_list}
+
+    columns: Optional[List[str]] = None
+    """The names and order of the columns included in the data frame."""
+
+    data: CompactRows
+    """The data for each row with the order specified in the columns property.
+    Must contain a value for each column in the columns property."""
+
+    def dict(self, **kwargs: Any) -> Dict[str, Any]:
+        """Generate a dictionary representation of the model, with the rows in the
+        same format as :attr:`DataFrame.data`.
+        """
+        result = super().dict(**kwargs)
+        if isinstance(result.get("data"), CompactRows):
+            result["data"] = result["data"].to_list()
+        return result
+
+    def to_data_frame(self) -> DataFrame:
+        """Decode the rows into a :class:`DataFrame`.
+
+        Returns:
+            A data frame with the same columns and rows.
+        """
+        return DataFrame(columns=self.columns, data=self.data.to_list())
+
+
+class CompactPagedTableRows(WithPaging):
+    """Contains the result of a query for rows of data, with the rows stored in a
+    :class:`CompactDataFrame`.
+    """
+
+    frame: CompactDataFrame
+    """The data frame containing the rows of data."""
+
+    total_row_count: int
+    """The total number of rows matched by the query across all pages of results."""
@@ -0,0 +1,212 @@
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    overload,
+    Sequence,
+    Union,
+)
+
+Row = List[Optional[str]]
+
+
+class _CompactColumn:
+    """The values of one column, stored as UTF-8 data with the offset of the end
+    of each value and a flag for each null value.
+    """
+
+    __slots__ = ("offsets", "data", "nulls")
+
+    def __init__(self) -> None:
+        self.offsets = array("q")
+        self.data = bytearray()
+        self.nulls = bytearray()
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.nulls.append(1)
+        elif isinstance(value, str):
+            self.data += value.encode("utf-8")
+            self.nulls.append(0)
+        else:
+            raise ValueError("Each row must be a list of strings or nulls")
+        self.offsets.append(len(self.data))
+
+    def truncate(self, count: int) -> None:
+        del self.offsets[count:]
+        del self.nulls[count:]
+        del self.data[self.offsets[-1] if count else 0 :]
+
+    def get(self, index: int) -> Optional[str]:
+        if self.nulls[index]:
+            return None
+        start = self.offsets[index - 1] if index else 0
+        return self.data[start : self.offsets[index]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            len(self.offsets) * self.offsets.itemsize + len(self.data) + len(self.nulls)
+        )
+
+
+class CompactRows(Sequence[Row]):
+    """Rows of a :class:`DataFrame <nisystemlink.clients.dataframe.models.DataFrame>`
+    stored column by column in contiguous buffers.
+
+    Each column's values are kept as a single block of UTF-8 data with an array
+    of offsets and a flag for each null value, instead of a list per row and a
+    string per value, so a large frame needs a small fraction of the memory.
+    Rows are decoded into lists when they are accessed.
+
+    Every row must have the same number of values.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Optional[str]]] = ()) -> None:
+        """Initialize the rows.
+
+        Args:
+            rows: The initial rows.
+
+        Raises:
+            ValueError: if the rows have different numbers of values, or a value
+                is not a string or None.
+        """
+        self._columns = None  # type: Optional[List[_CompactColumn]]
+        self._count = 0
+        self.extend(rows)
+
+    @property
+    def column_count(self) -> Optional[int]:  # noqa: D401
+        """The number of values in each row, or None if there are no rows."""
+        return len(self._columns) if self._columns is not None else None
+
+    @property
+    def nbytes(self) -> int:  # noqa: D401
+        """The number of bytes used by the buffers holding the values."""
+        return sum(column.nbytes for column in self._columns or [])
+
+    def append(self, row: Sequence[Optional[str]]) -> None:
+        """Add a row after the existing rows.
+
+        Args:
+            row: The row's values.
+
+        Raises:
+            ValueError: if the row has a different number of values than the
+                existing rows, or a value is not a string or None.
+        """
+        if self._columns is None:
+            self._columns = [_CompactColumn() for _ in row]
+        elif len(row) != len(self._columns):
+            raise ValueError(
+                "Each row must have {} values, not {}".format(
+                    len(self._columns), len(row)
+                )
+            )
+
+        try:
+            for column, value in zip(self._columns, row):
+                column.append(value)
+        except ValueError:
+            # Leave the columns the same length if part of the row was added.
+            for column in self._columns:
+                column.truncate(self._count)
+            if not self._count:
+                self._columns = None
+            raise
+        self._count += 1
+
+    def extend(self, rows: Iterable[Sequence[Optional[str]]]) -> None:
+        """Add rows after the existing rows.
+
+        Args:
+            rows: The rows to add.
+
+        Raises:
+            ValueError: if a row has a different number of values than the
+                existing rows, or a value is not a string or None. The rows
+                before it are still added.
+        """
+        for row in rows:
+            self.append(row)
+
+    def column(self, index: int) -> List[Optional[str]]:
+        """Get every value of one column.
+
+        Args:
+            index: The index of the column in each row.
+
+        Returns:
+            The column's values, in row order.
+
+        Raises:
+            IndexError: if there is no column at ``index``.
+        """
+        if self._columns is None:
+            raise IndexError("column index out of range")
+        column = self._columns[index]
+        return [column.get(row) for row in range(self._count)]
+
+    def to_list(self) -> List[Row]:
+        """Decode every row.
+
+        Returns:
+            A list of the rows, in the format of :attr:`DataFrame.data
+            <nisystemlink.clients.dataframe.models.DataFrame.data>`.
+        """
+        if not self._columns:
+            return [[] for _ in range(self._count)]
+        columns = [self.column(index) for index in range(len(self._columns))]
+        return [list(row) for row in zip(*columns)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> Row: ...  # noqa: E704
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Row]: ...  # noqa: E704
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Row, List[Row]]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("row index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Row]:
+        for index in range(self._count):
+            yield self._row(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactRows):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "CompactRows({!r})".format(self.to_list())
+
+    def _row(self, index: int) -> Row:
+        return [column.get(index) for column in self._columns or []]
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], "CompactRows"]]:
+        yield cls._validate
+
+    @classmethod
+    def _validate(cls, value: Any) -> "CompactRows":
+        if isinstance(value, CompactRows):
+            return value
+        if isinstance(value, (list, tuple)):
+            return cls(value)
+        raise TypeError("value is not a list of rows")
@@ -11,7 +11,11 @@ from . import models
 
 
 class SpecClient(BaseClient):
-    def __init__(self, configuration: Optional[core.HttpConfiguration] = None):
+    def __init__(
+        self,
+        configuration: Optional[core.HttpConfiguration] = None,
+        trusted_responses: bool = False,
+    ):
         """Initialize an instance.
 
         Args:
@@ -19,6 +23,10 @@ class SpecClient(BaseClient):
                 how to connect. If not provided, the
                 :class:`HttpConfigurationManager <nisystemlink.clients.core.HttpConfigurationManager>`
                 is used to obtain the configuration.
+            trusted_responses: Whether to skip validating the Spec Service's
+                responses. Building the response models without validation is much
+                faster for large responses, such as pages of table rows, but a
+                malformed response results in a malformed model instead of an error.
 
         Raises:
             ApiException: if unable to communicate with the Spec Service.
@@ -26,7 +34,11 @@ class SpecClient(BaseClient):
         if configuration is None:
             configuration = core.HttpConfigurationManager.get_configuration()
 
-        super().__init__(configuration, base_path="/nispec/v1/")
+        super().__init__(
+            configuration,
+            base_path="/nispec/v1/",
+            trusted_responses=trusted_responses,
+        )
 
     @get("")
     def api_info(self) -> models.V1Operations:
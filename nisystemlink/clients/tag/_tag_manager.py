@@ -4,6 +4,7 @@
 
 import asyncio
 import datetime
+from types import TracebackType
 from typing import (
     Any,
     Awaitable,
@@ -13,6 +14,7 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
+    Type,
     Union,
 )
 
@@ -715,6 +717,50 @@ class TagManager(tbase.ITagReader):
             self._http_client, SystemTimeStamper(), buffer_size, timer
         )
 
+    @property
+    def connection_pool_stats(self) -> core.ConnectionPoolStats:
+        """A snapshot of the HTTP clients and connections the manager holds."""
+        return self._http_client.pool_stats()
+
+    def close(self) -> None:
+        """Close the connections of all threads.
+
+        Each thread that makes requests keeps its own pool of connections to the
+        server. Once enough of these are kept, those of threads that have ended are
+        closed when another thread needs a pool. This method closes them all.
+        Connections used by event loops are released without being closed cleanly;
+        call :meth:`close_async` on each loop first to close those.
+
+        The manager can still be used afterwards, with new connections. If the
+        configuration shares connections, this instead releases the manager's share
+        of them, and they are closed once every client sharing them has been closed
+        or garbage collected; the manager can't be used afterwards.
+        """
+        self._http_client.close()
+
+    def __enter__(self) -> "TagManager":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    async def close_async(self) -> None:
+        """Asynchronously close the connections used by the running event loop.
+
+        Asynchronous requests made on an event loop share a pool of connections to
+        the server, which is kept until the loop is closed or this method is called.
+        The manager can still be used afterwards, with new connections.
+
+        Returns:
+            A task representing the asynchronous operation.
+        """
+        await self._http_client.aclose()
+
     def _read(
         self, path: str, include_timestamp: bool, include_aggregates: bool
     ) -> Optional[SerializedTagWithAggregates]:
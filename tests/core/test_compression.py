@@ -0,0 +1,109 @@
+import gzip
+import json
+import zlib
+
+import pytest  # type: ignore
+import responses
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.core._uplink._compression import CompressingAdapter
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    DataFrame,
+    ExportFormat,
+    ExportTableDataRequest,
+)
+from requests import PreparedRequest
+
+
+def _client(request_compression=None) -> DataFrameClient:
+    return DataFrameClient(
+        HttpConfiguration("http://localhost", "api-key"),
+        request_compression=request_compression,
+    )
+
+
+def _append_request(rows: int) -> AppendTableDataRequest:
+    return AppendTableDataRequest(
+        frame=DataFrame(columns=["index"], data=[[str(i)] for i in range(rows)])
+    )
+
+
+class TestRequestCompression:
+    @pytest.mark.parametrize(
+        "encoding, decompress",
+        [("gzip", gzip.decompress), ("deflate", zlib.decompress)],
+    )
+    @responses.activate
+    def test__compression__append_table_data__sends_compressed_body(
+        self, encoding, decompress
+    ):
+        client = _client(encoding)
+        responses.add(responses.POST, f"{client.session.base_url}tables/table-id/data")
+
+        client.append_table_data("table-id", _append_request(1000))
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Encoding"] == encoding
+        assert int(request.headers["Content-Length"]) == len(request.body)
+        body = json.loads(decompress(request.body))
+        assert body["frame"]["data"][999] == ["999"]
+
+    @responses.activate
+    def test__small_body__append_table_data__sends_uncompressed_body(self):
+        client = _client("gzip")
+        responses.add(responses.POST, f"{client.session.base_url}tables/table-id/data")
+
+        client.append_table_data("table-id", _append_request(1))
+
+        request = responses.calls[0].request
+        assert "Content-Encoding" not in request.headers
+        assert json.loads(request.body)["frame"]["data"] == [["0"]]
+
+    @responses.activate
+    def test__no_compression__append_table_data__sends_uncompressed_body(self):
+        client = _client()
+        responses.add(responses.POST, f"{client.session.base_url}tables/table-id/data")
+
+        client.append_table_data("table-id", _append_request(1000))
+
+        assert "Content-Encoding" not in responses.calls[0].request.headers
+
+    def test__unsupported_compression__constructor__raises(self):
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            _client("zstd")
+
+    def test__content_encoding_set__send__leaves_body_unchanged(self):
+        adapter = CompressingAdapter("gzip", min_size=0)
+        request = PreparedRequest()
+        request.prepare(
+            "POST",
+            "http://localhost/",
+            headers={"Content-Encoding": "identity"},
+            data=b"body",
+        )
+
+        with responses.RequestsMock() as mock:
+            mock.add(responses.POST, "http://localhost/")
+            adapter.send(request)
+
+        assert request.body == b"body"
+
+
+class TestResponseDecompression:
+    @responses.activate
+    def test__gzip_response__export_table_data__streams_decompressed_data(self):
+        client = _client()
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/export-data",
+            body=gzip.compress(b"index\r\n1\r\n2\r\n"),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        data = client.export_table_data(
+            "table-id", ExportTableDataRequest(response_format=ExportFormat.CSV)
+        )
+
+        assert "gzip" in responses.calls[0].request.headers["Accept-Encoding"]
+        assert data.read() == b"index\r\n1\r\n2\r\n"
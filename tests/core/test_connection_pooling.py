@@ -0,0 +1,115 @@
+from typing import Iterator, List
+from unittest import mock
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.core._internal._http_client import _limits, HttpClient
+from nisystemlink.clients.core._uplink._compression import CompressingAdapter
+from nisystemlink.clients.dataframe import DataFrameClient
+from requests import Session
+
+
+def _configuration(**settings) -> HttpConfiguration:
+    configuration = HttpConfiguration("https://localhost", "api-key")
+    for name, value in settings.items():
+        setattr(configuration, name, value)
+    return configuration
+
+
+@pytest.fixture
+def sessions() -> Iterator[List[Session]]:
+    """Fixture to record the sessions that clients create."""
+    created = []  # type: List[Session]
+
+    class RecordingSession(Session):
+        def __init__(self) -> None:
+            super().__init__()
+            created.append(self)
+
+    with mock.patch(
+        "nisystemlink.clients.core._uplink._base_client.Session", RecordingSession
+    ):
+        yield created
+
+
+def _pool_kw(session: Session):
+    return session.get_adapter("https://localhost").poolmanager.connection_pool_kw  # type: ignore
+
+
+class TestPoolingConfiguration:
+    def test__defaults__use_library_defaults(self):
+        configuration = HttpConfiguration("https://localhost")
+
+        assert configuration.connection_pool_size is None
+        assert configuration.max_connections_per_host is None
+        assert configuration.keep_alive
+
+    @pytest.mark.parametrize(
+        "name", ["connection_pool_size", "max_connections_per_host"]
+    )
+    def test__zero__set_pool_setting__raises(self, name):
+        configuration = HttpConfiguration("https://localhost")
+
+        with pytest.raises(ValueError, match=name + " cannot be 0 or negative"):
+            setattr(configuration, name, 0)
+
+
+class TestBaseClientPooling:
+    def test__default_configuration__keeps_session_defaults(self, sessions):
+        client = DataFrameClient(_configuration())
+
+        assert _pool_kw(sessions[0]) == {"maxsize": 10, "block": False}
+        assert "Connection" not in client.session.headers
+
+    def test__pool_size__sets_adapter_pool_size(self, sessions):
+        DataFrameClient(_configuration(connection_pool_size=64))
+
+        assert _pool_kw(sessions[0]) == {"maxsize": 64, "block": False}
+
+    def test__max_connections__blocks_at_limit(self, sessions):
+        DataFrameClient(
+            _configuration(connection_pool_size=8, max_connections_per_host=32)
+        )
+
+        assert _pool_kw(sessions[0]) == {"maxsize": 32, "block": True}
+
+    def test__pool_size_and_compression__compressing_adapter_uses_pool_size(
+        self, sessions
+    ):
+        DataFrameClient(
+            _configuration(connection_pool_size=64), request_compression="gzip"
+        )
+
+        adapter = sessions[0].get_adapter("https://localhost")
+        assert isinstance(adapter, CompressingAdapter)
+        assert _pool_kw(sessions[0]) == {"maxsize": 64, "block": False}
+
+    def test__keep_alive_disabled__sends_connection_close(self):
+        client = DataFrameClient(_configuration(keep_alive=False))
+
+        assert client.session.headers["Connection"] == "close"
+
+
+class TestHttpClientPooling:
+    def test__default_configuration__uses_httpx_defaults(self):
+        limits = _limits(_configuration())
+
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 20
+
+    def test__pool_settings__set_limits(self):
+        limits = _limits(
+            _configuration(connection_pool_size=16, max_connections_per_host=64)
+        )
+
+        assert limits.max_connections == 64
+        assert limits.max_keepalive_connections == 16
+
+    def test__keep_alive_disabled__keeps_no_connections(self):
+        configuration = _configuration(connection_pool_size=16, keep_alive=False)
+
+        client = HttpClient(configuration)
+
+        assert _limits(configuration).max_keepalive_connections == 0
+        assert client._client.headers["Connection"] == "close"
+        client.close()
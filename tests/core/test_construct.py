@@ -0,0 +1,125 @@
+from typing import Any, Dict, List, Optional
+
+import pytest  # type: ignore
+import responses
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.core._uplink._construct import construct_obj_as
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import PagedTableRows, TableMetadata
+from nisystemlink.clients.file.models import FileQueryResponse
+from nisystemlink.clients.spec.models import (
+    NumericConditionValue,
+    QuerySpecifications,
+    SpecificationType,
+)
+from pydantic import parse_obj_as
+
+
+table_metadata = {
+    "columns": [
+        {"name": "index", "dataType": "INT32", "columnType": "INDEX", "properties": {}},
+        {"name": "value", "dataType": "FLOAT64", "columnType": "NULLABLE"},
+    ],
+    "createdAt": "2022-08-19T16:17:30.123Z",
+    "id": "table-id",
+    "metadataModifiedAt": "2022-08-19T16:17:30.123Z",
+    "metadataRevision": 1,
+    "name": "table",
+    "properties": {"key": "value"},
+    "rowCount": 2,
+    "rowsModifiedAt": "2022-08-19T16:17:30.123Z",
+    "supportsAppend": True,
+    "workspace": "workspace",
+}
+
+specs = {
+    "specs": [
+        {
+            "id": "1",
+            "productId": "product",
+            "specId": "spec",
+            "version": 0,
+            "type": "PARAMETRIC",
+            "limit": {"min": 1, "max": 2.5},
+            "conditions": [
+                {
+                    "name": "temperature",
+                    "value": {
+                        "conditionType": "NUMERIC",
+                        "discrete": [1, 2.5],
+                        "range": [{"min": 0, "max": 10}],
+                    },
+                },
+                {"name": "empty", "value": None},
+            ],
+            "createdAt": "2023-01-01T12:00:00Z",
+        }
+    ],
+    "continuationToken": None,
+}
+
+
+class TestConstructObjAs:
+    @pytest.mark.parametrize(
+        "type_, data",
+        [
+            (
+                PagedTableRows,
+                {
+                    "frame": {"columns": ["a", "b"], "data": [["1", None]]},
+                    "totalRowCount": 1,
+                    "continuationToken": None,
+                },
+            ),
+            (TableMetadata, table_metadata),
+            (QuerySpecifications, specs),
+            (
+                FileQueryResponse,
+                {
+                    "_links": {"self": {"href": "/files"}},
+                    "availableFiles": [{"id": "file", "size": 10}],
+                    "totalCount": 1,
+                },
+            ),
+            (List[Optional[Dict[str, int]]], [{"a": 1}, None]),
+        ],
+    )
+    def test__valid_data__construct__matches_parse_obj_as(self, type_: Any, data: Any):
+        constructed = construct_obj_as(type_, data)
+
+        assert constructed == parse_obj_as(type_, data)
+
+    def test__model__construct__sets_only_provided_fields(self):
+        constructed = construct_obj_as(TableMetadata, table_metadata)
+
+        assert constructed.__fields_set__ == (
+            parse_obj_as(TableMetadata, table_metadata).__fields_set__
+        )
+
+    def test__nested_values__construct__converts_leaf_types(self):
+        constructed = construct_obj_as(QuerySpecifications, specs)
+
+        spec = constructed.specs[0]
+        assert spec.type == SpecificationType.PARAMETRIC
+        assert isinstance(spec.limit.min, float)
+        assert isinstance(spec.conditions[0].value, NumericConditionValue)
+        assert spec.created_at.year == 2023
+
+
+class TestTrustedResponses:
+    @responses.activate
+    def test__trusted_responses__request__skips_validation(self):
+        client = DataFrameClient(
+            HttpConfiguration("http://localhost", "api-key"), trusted_responses=True
+        )
+        responses.add(
+            responses.GET,
+            f"{client.session.base_url}tables/table-id",
+            json=dict(table_metadata, rowCount="2"),
+        )
+
+        metadata = client.get_table_metadata("table-id")
+
+        # A validated model would have coerced the row count to an int.
+        assert metadata.row_count == "2"
+        assert metadata.columns == parse_obj_as(TableMetadata, table_metadata).columns
@@ -0,0 +1,202 @@
+import gzip
+import json
+import sys
+import threading
+from typing import Callable, Iterator, List
+from unittest import mock
+
+import httpx
+import pytest  # type: ignore
+import requests
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.core._uplink._httpx_adapter import HttpxAdapter
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import ExportFormat, ExportTableDataRequest
+
+from .test_http_client import _Server
+
+
+def _configuration(**settings) -> HttpConfiguration:
+    configuration = HttpConfiguration("https://localhost", "api-key")
+    configuration.http2 = True
+    for name, value in settings.items():
+        setattr(configuration, name, value)
+    return configuration
+
+
+@pytest.fixture
+def local_server() -> Iterator[_Server]:
+    """Fixture to run a local HTTP/1.1 server that records the port of each request."""
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class _MockServer:
+    def __init__(self, handler: Callable[[httpx.Request], httpx.Response]) -> None:
+        self.requests = []  # type: List[httpx.Request]
+        self._handler = handler
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        self.requests.append(request)
+        return self._handler(request)
+
+
+def _session(server: _MockServer, **kwargs) -> requests.Session:
+    session = requests.Session()
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    session.mount("https://", HttpxAdapter(client, **kwargs))
+    return session
+
+
+class TestHttpxAdapter:
+    def test__get__returns_response(self):
+        server = _MockServer(
+            lambda _: httpx.Response(200, json={"value": 1}, headers={"X-Custom": "a"})
+        )
+
+        response = _session(server).get("https://localhost/api", params={"a": "b"})
+
+        assert response.status_code == 200
+        assert response.reason == "OK"
+        assert response.json() == {"value": 1}
+        assert response.headers["x-custom"] == "a"
+        assert response.url == "https://localhost/api?a=b"
+        assert str(server.requests[0].url) == "https://localhost/api?a=b"
+
+    def test__requests_default_headers__replaced_by_httpx_defaults(self):
+        server = _MockServer(lambda _: httpx.Response(204))
+
+        _session(server).get("https://localhost/api", headers={"X-Key": "key"})
+
+        headers = server.requests[0].headers
+        assert headers["x-key"] == "key"
+        assert headers.get_list("connection") == ["keep-alive"]
+        assert len(headers.get_list("accept-encoding")) == 1
+
+    def test__compressed_response__streamed__decompresses_chunks(self):
+        body = b"a,b\r\n" + b"1,2\r\n" * 10000
+        server = _MockServer(
+            lambda _: httpx.Response(
+                200, content=gzip.compress(body), headers={"Content-Encoding": "gzip"}
+            )
+        )
+
+        response = _session(server).get("https://localhost/export", stream=True)
+        chunks = list(response.iter_content(chunk_size=1000))
+
+        assert b"".join(chunks) == body
+        assert all(len(chunk) == 1000 for chunk in chunks[:-1])
+
+    def test__request_compression__sends_compressed_body(self):
+        server = _MockServer(lambda _: httpx.Response(204))
+        body = {"data": ["x" * 2000]}
+
+        _session(server, request_compression="gzip").post(
+            "https://localhost/data", json=body
+        )
+
+        request = server.requests[0]
+        assert request.headers["content-encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.content)) == body
+
+    def test__unsupported_compression__raises(self):
+        with pytest.raises(ValueError, match="Unsupported compression: 'br'"):
+            HttpxAdapter(httpx.Client(), request_compression="br")
+
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (httpx.ConnectError("refused"), requests.ConnectionError),
+            (httpx.ConnectTimeout("timed out"), requests.ConnectTimeout),
+            (httpx.ReadTimeout("timed out"), requests.ReadTimeout),
+        ],
+    )
+    def test__transport_error__raises_requests_exception(self, error, expected):
+        def fail(_: httpx.Request) -> httpx.Response:
+            raise error
+
+        with pytest.raises(expected):
+            _session(_MockServer(fail)).get("https://localhost/api")
+
+
+class TestHttp2Configuration:
+    def test__http2__http_client_uses_http2_transport(self):
+        client = HttpClient(_configuration())
+
+        assert client._client._transport._pool._http2  # type: ignore
+        client.close()
+
+    def test__http2__base_client_uses_httpx_adapter(self):
+        client = DataFrameClient(_configuration(), request_compression="gzip")
+
+        session = client.session._Session__builder.client._RequestsClient__session
+        adapter = session.get_adapter("https://localhost")
+        assert isinstance(adapter, HttpxAdapter)
+        assert adapter._client._transport._pool._http2  # type: ignore
+        client.close()
+        assert adapter._client.is_closed
+
+    def test__http2_and_keep_alive_disabled__base_client_closes_connections(
+        self, local_server: _Server
+    ):
+        server = local_server
+        configuration = HttpConfiguration(server.url, "api-key")
+        configuration.http2 = True
+        configuration.keep_alive = False
+        client = DataFrameClient(configuration)
+        session = client.session._Session__builder.client._RequestsClient__session
+
+        for _ in range(3):
+            session.get(server.url + "/api/value").raise_for_status()
+
+        adapter = session.get_adapter(server.url)
+        assert adapter._client._transport._pool._max_keepalive_connections == 0  # type: ignore
+        assert len(set(server.client_ports)) == 3
+        client.close()
+
+    def test__http2_and_shared__base_clients_share_httpx_client(self):
+        configuration = _configuration(share_connections=True)
+        clients = [DataFrameClient(configuration) for _ in range(2)]
+
+        adapters = [
+            c.session._Session__builder.client._RequestsClient__session.get_adapter(
+                "https://localhost"
+            )
+            for c in clients
+        ]
+        assert adapters[0]._client is adapters[1]._client
+        for client in clients:
+            client.close()
+        assert adapters[0]._client.is_closed
+
+    def test__h2_not_installed__raises_import_error(self):
+        with mock.patch.dict(sys.modules, {"h2": None}):
+            with pytest.raises(ImportError, match=r"nisystemlink-clients\[http2\]"):
+                DataFrameClient(_configuration())
+            with pytest.raises(ImportError, match=r"nisystemlink-clients\[http2\]"):
+                HttpClient(_configuration())
+
+    def test__http2__export_table_data__streams_content(self):
+        server = _MockServer(lambda _: httpx.Response(200, content=b"a,b\r\n1,2\r\n"))
+        mock_client = httpx.Client(transport=httpx.MockTransport(server))
+        with mock.patch(
+            "nisystemlink.clients.core._uplink._base_client._create_httpx_client",
+            return_value=mock_client,
+        ):
+            client = DataFrameClient(_configuration())
+
+        data = client.export_table_data(
+            "table-id", ExportTableDataRequest(response_format=ExportFormat.CSV)
+        )
+
+        assert data.read() == b"a,b\r\n1,2\r\n"
+        request = server.requests[0]
+        assert request.url.path == "/nidataframe/v1/tables/table-id/export-data"
+        assert request.headers["x-ni-api-key"] == "api-key"
+        assert json.loads(request.content) == {"responseFormat": "CSV"}
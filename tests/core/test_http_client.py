@@ -0,0 +1,229 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List, Optional, Tuple
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import ConnectionPoolStats, HttpConfiguration
+from nisystemlink.clients.core._internal._http_client import HttpClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.client_ports.append(self.client_address[1])
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.client_ports = []  # type: List[int]
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    """Fixture to run a local HTTP server that records the port of each request."""
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server: _Server) -> HttpClient:
+    """Fixture to create an HttpClient for the local server."""
+    return HttpClient(HttpConfiguration(server.url, "api-key"))
+
+
+async def _get_many(client: HttpClient, count: int) -> Tuple[Any, ...]:
+    api = client.at_uri("/api").as_async
+    results = []
+    for _ in range(count):
+        data, _ = await api.get("/value")
+        results.append(data)
+    await client.aclose()
+    return tuple(results)
+
+
+class TestAsyncHttpClient:
+    def test__sequential_requests__reuse_one_connection(
+        self, client: HttpClient, server: _Server
+    ):
+        results = asyncio.run(_get_many(client, 5))
+
+        assert results == ({"ok": True},) * 5
+        assert len(server.client_ports) == 5
+        assert len(set(server.client_ports)) == 1
+
+    def test__sync_client_exists__async_requests_reuse_one_connection(
+        self, client: HttpClient, server: _Server
+    ):
+        client.at_uri("/api").get("/value")
+
+        asyncio.run(_get_many(client, 3))
+
+        assert len(set(server.client_ports[1:])) == 1
+
+    @pytest.mark.asyncio
+    async def test__same_event_loop__uses_same_async_client(self, client: HttpClient):
+        first = client._async_client
+
+        assert client._async_client is first
+        await client.aclose()
+
+    def test__different_event_loops__use_different_async_clients(
+        self, client: HttpClient
+    ):
+        async def get_client() -> Any:
+            return client._async_client
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test__aclose__closes_client_and_later_request_opens_new_one(
+        self, client: HttpClient, server: _Server
+    ):
+        api = client.at_uri("/api").as_async
+        await api.get("/value")
+        first = client._async_client
+
+        await client.aclose()
+        await api.get("/value")
+
+        assert first.is_closed
+        assert client._async_client is not first
+        assert len(set(server.client_ports)) == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test__no_async_client__aclose__does_nothing(self, client: HttpClient):
+        await client.aclose()
+
+    def test__event_loops_closed__drops_their_clients(
+        self, client: HttpClient, server: _Server
+    ):
+        async def get() -> None:
+            await client.at_uri("/api").as_async.get("/value")
+
+        for _ in range(5):
+            asyncio.run(get())
+
+        assert client.pool_stats() == ConnectionPoolStats(
+            clients=0, open_connections=0, idle_connections=0, created_connections=5
+        )
+
+
+def _get_in_thread(
+    client: HttpClient, end: Optional[threading.Event] = None
+) -> threading.Thread:
+    """Make a request in a new thread, which then waits for ``end`` if given."""
+    done = threading.Event()
+
+    def run() -> None:
+        client.at_uri("/api").get("/value")
+        done.set()
+        if end is not None:
+            end.wait(10)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    done.wait(10)
+    if end is None:
+        thread.join()
+    return thread
+
+
+class TestHttpClientPool:
+    def test__invalid_max_clients__raises(self):
+        with pytest.raises(ValueError, match="max_clients cannot be 0 or negative"):
+            HttpClient(HttpConfiguration("http://localhost"), max_clients=0)
+
+    def test__requests__pool_stats__counts_connections(
+        self, client: HttpClient, server: _Server
+    ):
+        api = client.at_uri("/api")
+        for _ in range(3):
+            api.get("/value")
+
+        assert client.pool_stats() == ConnectionPoolStats(
+            clients=1, open_connections=1, idle_connections=1, created_connections=1
+        )
+
+    def test__keep_alive_disabled__requests_use_new_connections(self, server: _Server):
+        configuration = HttpConfiguration(server.url, "api-key")
+        configuration.keep_alive = False
+        client = HttpClient(configuration)
+
+        for _ in range(3):
+            client.at_uri("/api").get("/value")
+
+        assert len(set(server.client_ports)) == 3
+        assert client.pool_stats().open_connections == 0
+        client.close()
+
+    def test__ended_threads__new_thread__closes_their_clients(self, server: _Server):
+        client = HttpClient(HttpConfiguration(server.url, "api-key"), max_clients=2)
+        _get_in_thread(client)
+        _get_in_thread(client)
+        ended = [entry[1] for entry in client._pool._clients.values()]
+
+        client.at_uri("/api").get("/value")
+
+        assert all(c.is_closed for c in ended)
+        assert client.pool_stats() == ConnectionPoolStats(
+            clients=1, open_connections=1, idle_connections=1, created_connections=3
+        )
+        client.close()
+
+    def test__pool_full_of_live_threads__new_thread__keeps_their_clients(
+        self, server: _Server
+    ):
+        client = HttpClient(HttpConfiguration(server.url, "api-key"), max_clients=2)
+        end = threading.Event()
+        threads = [_get_in_thread(client, end)]
+        client.at_uri("/api").get("/value")
+        live = [entry[1] for entry in client._pool._clients.values()]
+
+        threads.append(_get_in_thread(client, end))
+
+        assert not any(c.is_closed for c in live)
+        assert client.pool_stats().clients == 3
+        end.set()
+        for thread in threads:
+            thread.join()
+        client.close()
+
+    def test__close__closes_all_clients(self, client: HttpClient, server: _Server):
+        client.at_uri("/api").get("/value")
+        _get_in_thread(client)
+        clients = [entry[1] for entry in client._pool._clients.values()]
+
+        client.close()
+
+        assert all(c.is_closed for c in clients)
+        assert client.pool_stats() == ConnectionPoolStats(
+            clients=0, open_connections=0, idle_connections=0, created_connections=2
+        )
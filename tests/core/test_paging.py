@@ -0,0 +1,152 @@
+import threading
+from typing import List, Optional
+
+import pytest  # type: ignore
+from nisystemlink.clients.core._internal._paging import (
+    AdaptivePageSize,
+    iterate_pages,
+    iterate_pages_adaptively,
+)
+from nisystemlink.clients.core._uplink._with_paging import WithPaging
+
+
+class Page(WithPaging):
+    number: int
+
+
+class Item(WithPaging):
+    text: str
+
+
+class ItemPage(WithPaging):
+    items: List[Item]
+
+
+class PageSource:
+    def __init__(self, count: int, fail_at: Optional[int] = None):
+        self.count = count
+        self.fail_at = fail_at
+        self.requested = []  # type: List[Optional[str]]
+        self.fetched = threading.Semaphore(0)
+
+    def __call__(self, continuation_token: Optional[str]) -> Page:
+        self.requested.append(continuation_token)
+        number = int(continuation_token) if continuation_token else 0
+        if number == self.fail_at:
+            raise RuntimeError("failed")
+        next_token = str(number + 1) if number + 1 < self.count else None
+        self.fetched.release()
+        return Page(number=number, continuation_token=next_token)
+
+
+class TestIteratePages:
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test__multiple_pages__iterate__returns_all_pages_in_order(self, prefetch):
+        source = PageSource(5)
+
+        pages = list(iterate_pages(source, prefetch=prefetch))
+
+        assert [page.number for page in pages] == [0, 1, 2, 3, 4]
+        assert source.requested == [None, "1", "2", "3", "4"]
+
+    def test__continuation_token__iterate__starts_at_token(self):
+        source = PageSource(3)
+
+        pages = list(iterate_pages(source, "1"))
+
+        assert [page.number for page in pages] == [1, 2]
+
+    def test__prefetch__iterate__requests_next_page_before_it_is_consumed(self):
+        source = PageSource(5)
+        pages = iterate_pages(source, prefetch=1)
+
+        first = next(pages)
+        assert source.fetched.acquire(timeout=5)
+        assert source.fetched.acquire(timeout=5)
+
+        assert first.number == 0
+        assert source.requested == [None, "1"]
+        pages.close()
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test__fetch_fails__iterate__raises_after_earlier_pages(self, prefetch):
+        source = PageSource(5, fail_at=2)
+        pages = iterate_pages(source, prefetch=prefetch)
+
+        assert next(pages).number == 0
+        assert next(pages).number == 1
+        with pytest.raises(RuntimeError, match="failed"):
+            next(pages)
+
+    def test__negative_prefetch__iterate__raises(self):
+        with pytest.raises(ValueError):
+            iterate_pages(PageSource(1), prefetch=-1)
+
+
+class TestAdaptivePageSize:
+    def test__fast_full_pages__update__doubles_take_up_to_maximum(self):
+        page_size = AdaptivePageSize(100, 300, target_seconds=1.0)
+        takes = []
+
+        for _ in range(3):
+            page_size.update([Item(text="")] * page_size.take, 0.1)
+            takes.append(page_size.take)
+
+        assert takes == [200, 300, 300]
+
+    def test__slow_page__update__halves_take(self):
+        page_size = AdaptivePageSize(100, 1000, target_seconds=1.0)
+
+        page_size.update([Item(text="")] * 100, 2.0)
+
+        assert page_size.take == 50
+
+    def test__partial_page__update__keeps_take(self):
+        page_size = AdaptivePageSize(100, 1000, target_seconds=1.0)
+
+        page_size.update([Item(text="")] * 10, 0.1)
+
+        assert page_size.take == 100
+
+    def test__max_page_bytes__update__limits_take_to_estimated_size(self):
+        page_size = AdaptivePageSize(
+            100, 1000, target_seconds=1.0, max_page_bytes=10000
+        )
+        item = Item(text="x" * 90)
+        item_bytes = len(item.json(by_alias=True, exclude_unset=True))
+
+        page_size.update([item] * 100, 0.1)
+
+        assert page_size.take == 10000 // item_bytes
+
+    @pytest.mark.parametrize(
+        "args",
+        [(0, 10, 1.0, None), (1, 0, 1.0, None), (1, 10, 0, None), (1, 10, 1.0, 0)],
+    )
+    def test__invalid_argument__constructor__raises(self, args):
+        with pytest.raises(ValueError):
+            AdaptivePageSize(*args)
+
+
+class TestIteratePagesAdaptively:
+    def test__multiple_pages__iterate__requests_adapted_page_sizes(self):
+        requested = []
+
+        def fetch_page(continuation_token: Optional[str], take: int) -> ItemPage:
+            requested.append((continuation_token, take))
+            number = int(continuation_token) if continuation_token else 0
+            return ItemPage(
+                items=[Item(text="")] * take,
+                continuation_token=str(number + 1) if number < 2 else None,
+            )
+
+        pages = list(
+            iterate_pages_adaptively(
+                fetch_page,
+                lambda page: page.items,
+                AdaptivePageSize(10, 1000, target_seconds=60.0),
+            )
+        )
+
+        assert len(pages) == 3
+        assert requested == [(None, 10), ("1", 20), ("2", 40)]
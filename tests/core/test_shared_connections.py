@@ -0,0 +1,143 @@
+import gc
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.core._internal._shared_connections import SharedConnections
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.file import FileClient
+from nisystemlink.clients.tag import TagManager
+
+from .test_http_client import _Server, server  # noqa: F401
+
+
+def _configuration(share_connections: bool = True) -> HttpConfiguration:
+    configuration = HttpConfiguration("https://localhost", "api-key")
+    configuration.share_connections = share_connections
+    return configuration
+
+
+def _adapter(client) -> object:
+    session = client.session._Session__builder.client._RequestsClient__session
+    return session.get_adapter("https://localhost")
+
+
+def _pool_manager(client) -> object:
+    return _adapter(client).poolmanager  # type: ignore
+
+
+class TestSharedConnections:
+    def test__not_shared__clients_use_own_pools(self):
+        configuration = _configuration(share_connections=False)
+
+        first = DataFrameClient(configuration)
+        second = FileClient(configuration)
+
+        assert _pool_manager(first) is not _pool_manager(second)
+        assert SharedConnections._registry.get(configuration) is None
+
+    def test__shared__uplink_clients_use_one_pool(self):
+        configuration = _configuration()
+
+        first = DataFrameClient(configuration)
+        second = FileClient(configuration)
+        compressing = DataFrameClient(configuration, request_compression="gzip")
+
+        assert _adapter(first) is _adapter(second)
+        assert _adapter(compressing) is not _adapter(first)
+        assert _pool_manager(first) is _pool_manager(compressing)
+
+    def test__shared__httpx_clients_use_one_pool(self):
+        configuration = _configuration()
+
+        tags = TagManager(configuration)
+        dataframe = AsyncDataFrameClient(configuration)
+
+        assert tags._http_client._pool is dataframe._http_client._pool
+
+    def test__different_configurations__use_different_pools(self):
+        first = DataFrameClient(_configuration())
+        second = DataFrameClient(_configuration())
+
+        assert _pool_manager(first) is not _pool_manager(second)
+
+    def test__clients_closed__pools_closed_after_last(self):
+        configuration = _configuration()
+        first = TagManager(configuration)
+        second = TagManager(configuration)
+        dataframe = DataFrameClient(configuration)
+        shared = SharedConnections._registry[configuration]
+
+        first.close()
+        first.close()
+        dataframe.close()
+        assert SharedConnections._registry.get(configuration) is shared
+        assert shared._pools
+
+        second.close()
+        assert SharedConnections._registry.get(configuration) is None
+        assert not shared._pools
+
+    def test__shared_tag_manager_closed__use__raises(self):
+        configuration = _configuration()
+        other = TagManager(configuration)
+        closed = TagManager(configuration)
+
+        closed.close()
+
+        with pytest.raises(ReferenceError):
+            closed.open("tag")
+        with pytest.raises(ReferenceError):
+            closed.connection_pool_stats
+        assert other.connection_pool_stats.clients == 0
+        other.close()
+
+    def test__clients_garbage_collected__releases_pools(self):
+        configuration = _configuration()
+        with DataFrameClient(configuration):
+            pass
+        client = DataFrameClient(configuration)
+        shared = SharedConnections._registry[configuration]
+
+        del client
+        gc.collect()
+
+        assert SharedConnections._registry.get(configuration) is None
+        assert not shared._pools
+
+    def test__other_client_released_while_creating_pool__creates_pool(self):
+        other = DataFrameClient(_configuration())
+        shared = SharedConnections.acquire(_configuration())
+
+        # Releasing on the same thread while the lock is held is what garbage
+        # collecting a client during pool creation does.
+        pool = shared.pool("pool", lambda: other.close() or "created", str)
+
+        assert pool == "created"
+        shared.release()
+
+    def test__new_client_after_release__creates_new_pools(self):
+        configuration = _configuration()
+        first = DataFrameClient(configuration)
+        pool_manager = _pool_manager(first)
+        first.close()
+
+        second = DataFrameClient(configuration)
+
+        assert _pool_manager(second) is not pool_manager
+        second.close()
+
+    def test__shared_http_clients__requests_reuse_one_connection(
+        self, server: _Server  # noqa: F811
+    ):
+        configuration = HttpConfiguration(server.url, "api-key")
+        configuration.share_connections = True
+        clients = [HttpClient(configuration) for _ in range(3)]
+
+        for client in clients:
+            client.at_uri("/api").get("/value")
+
+        assert len(set(server.client_ports)) == 1
+        assert clients[0].pool_stats().created_connections == 1
+        for client in clients:
+            client.close()
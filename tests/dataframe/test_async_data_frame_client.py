@@ -0,0 +1,181 @@
+import json
+from typing import Any, Callable, cast, Dict, List
+from unittest import mock
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.dataframe import AsyncDataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    ExportFormat,
+    ExportTableDataRequest,
+    ModifyTableRequest,
+    QueryTableDataRequest,
+)
+
+
+class MockServer:
+    def __init__(self) -> None:
+        self.requests = []  # type: List[httpx.Request]
+        self.handlers = {}  # type: Dict[str, Callable[[httpx.Request], httpx.Response]]
+
+    def route(
+        self, method: str, path: str, status_code: int = 200, **kwargs: Any
+    ) -> None:
+        self.handlers[method + " " + path] = lambda _: httpx.Response(
+            status_code, **kwargs
+        )
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.raw_path.decode().split("?")[0]
+        return self.handlers[request.method + " " + path](request)
+
+
+@pytest.fixture
+def server():
+    """Fixture to replace the HTTP transport with a mock server."""
+    server = MockServer()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    with mock.patch.object(
+        HttpClient, "_async_client", new_callable=mock.PropertyMock
+    ) as async_client:
+        async_client.return_value = client
+        yield server
+
+
+@pytest.fixture
+def client():
+    """Fixture to create an AsyncDataFrameClient instance."""
+    return AsyncDataFrameClient(HttpConfiguration("http://localhost", "api-key"))
+
+
+class TestAsyncDataFrameClient:
+    @pytest.mark.asyncio
+    async def test__get_table_data__sends_query_parameters(
+        self, client: AsyncDataFrameClient, server: MockServer
+    ):
+        server.route(
+            "GET",
+            "/nidataframe/v1/tables/table%2Fid/data",
+            json={
+                "frame": {"columns": ["a", "b"], "data": [["1", None]]},
+                "totalRowCount": 1,
+                "continuationToken": None,
+            },
+        )
+
+        result = await client.get_table_data(
+            "table/id", columns=["a", "b"], order_by_descending=True, take=5
+        )
+
+        assert result.frame.data == [["1", None]]
+        assert result.total_row_count == 1
+        params = server.requests[0].url.params
+        assert params.get_list("columns") == ["a", "b"]
+        assert params["orderByDescending"] == "true"
+        assert params["take"] == "5"
+        assert "continuationToken" not in params
+
+    @pytest.mark.asyncio
+    async def test__query_table_data__sends_model_as_json(
+        self, client: AsyncDataFrameClient, server: MockServer
+    ):
+        server.route(
+            "POST",
+            "/nidataframe/v1/tables/table-id/query-data",
+            json={
+                "frame": {"columns": ["a"], "data": []},
+                "totalRowCount": 0,
+            },
+        )
+
+        await client.query_table_data(
+            "table-id", QueryTableDataRequest(columns=["a"], continuation_token="t")
+        )
+
+        assert json.loads(server.requests[0].content) == {
+            "columns": ["a"],
+            "continuationToken": "t",
+        }
+
+    @pytest.mark.asyncio
+    async def test__modify_table__sends_update(
+        self, client: AsyncDataFrameClient, server: MockServer
+    ):
+        server.route("PATCH", "/nidataframe/v1/tables/table-id", status_code=204)
+
+        await client.modify_table("table-id", ModifyTableRequest(name="name"))
+
+        assert json.loads(server.requests[0].content) == {"name": "name"}
+
+    @pytest.mark.asyncio
+    async def test__all_deleted__delete_tables__returns_none(
+        self, client: AsyncDataFrameClient, server: MockServer
+    ):
+        server.route("POST", "/nidataframe/v1/delete-tables", status_code=204)
+
+        assert await client.delete_tables(["a", "b"]) is None
+        assert json.loads(server.requests[0].content) == {"ids": ["a", "b"]}
+
+    @pytest.mark.asyncio
+    async def test__error_response__raises_api_exception(
+        self, client: AsyncDataFrameClient, server: MockServer
+    ):
+        server.route(
+            "GET",
+            "/nidataframe/v1/tables/table-id",
+            status_code=404,
+            json={"error": {"name": "Skyline.NotFound", "message": "Not found"}},
+        )
+
+        with pytest.raises(ApiException) as ex:
+            await client.get_table_metadata("table-id")
+
+        error = cast(ApiException, ex.value)
+        assert error.http_status_code == 404
+        assert error.error is not None
+        assert error.error.name == "Skyline.NotFound"
+
+    @pytest.mark.asyncio
+    async def test__export_table_data__streams_content(
+        self, client: AsyncDataFrameClient, server: MockServer
+    ):
+        server.route(
+            "POST",
+            "/nidataframe/v1/tables/table-id/export-data",
+            content=b"a,b\r\n1,2\r\n",
+        )
+
+        chunks = await client.export_table_data(
+            "table-id", ExportTableDataRequest(response_format=ExportFormat.CSV)
+        )
+
+        assert b"".join([chunk async for chunk in chunks]) == b"a,b\r\n1,2\r\n"
+
+    @pytest.mark.asyncio
+    async def test__export_fails__export_table_data__raises(
+        self, client: AsyncDataFrameClient, server: MockServer
+    ):
+        server.route(
+            "POST",
+            "/nidataframe/v1/tables/table-id/export-data",
+            status_code=400,
+            text="Bad request",
+        )
+
+        with pytest.raises(ApiException, match="400"):
+            await client.export_table_data(
+                "table-id", ExportTableDataRequest(response_format=ExportFormat.CSV)
+            )
+
+    @pytest.mark.asyncio
+    async def test__async_with__closes_connections_on_exit(self):
+        with mock.patch.object(HttpClient, "aclose") as aclose:
+            async with AsyncDataFrameClient(
+                HttpConfiguration("http://localhost", "api-key")
+            ):
+                aclose.assert_not_called()
+
+        aclose.assert_awaited_once()
@@ -0,0 +1,135 @@
+import threading
+import time
+from datetime import timedelta
+from typing import List
+from unittest import mock
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import ApiException
+from nisystemlink.clients.dataframe import BufferedTableWriter, DataFrameClient
+from nisystemlink.clients.dataframe.models import AppendTableDataRequest, DataFrame
+
+
+@pytest.fixture
+def client():
+    """Fixture to create a mock DataFrameClient."""
+    return mock.Mock(spec=DataFrameClient)
+
+
+def _appended_frames(client: mock.Mock) -> List[DataFrame]:
+    requests = [call.args[1] for call in client.append_table_data.call_args_list]
+    return [request.frame for request in requests if request.frame is not None]
+
+
+class TestBufferedTableWriter:
+    def test__buffer_size_reached__append_rows__sends_batch(self, client):
+        writer = BufferedTableWriter(client, "table-id", ["a", "b"], buffer_size=2)
+
+        writer.append_rows([["1", "2"], ["3", None], ["5", "6"]])
+        writer.flush()
+
+        assert _appended_frames(client) == [
+            DataFrame(columns=["a", "b"], data=[["1", "2"], ["3", None]]),
+            DataFrame(columns=["a", "b"], data=[["5", "6"]]),
+        ]
+
+    def test__byte_limit_reached__append_rows__sends_batch(self, client):
+        writer = BufferedTableWriter(client, "table-id", max_buffer_bytes=10)
+
+        writer.append_rows([["12345"]])
+        assert client.append_table_data.call_count == 0
+        writer.append_rows([["12345"]])
+        writer.flush()
+
+        assert _appended_frames(client) == [
+            DataFrame(data=[["12345"], ["12345"]]),
+        ]
+
+    def test__max_buffer_time_elapsed__sends_batch(self, client):
+        sent = threading.Event()
+        client.append_table_data.side_effect = lambda *args: sent.set()
+        writer = BufferedTableWriter(
+            client, "table-id", max_buffer_time=timedelta(milliseconds=10)
+        )
+
+        writer.append_rows([["1"]])
+
+        assert sent.wait(5)
+        assert _appended_frames(client) == [DataFrame(data=[["1"]])]
+
+    def test__close__sends_remaining_rows_then_end_of_data(self, client):
+        writer = BufferedTableWriter(client, "table-id", buffer_size=10)
+        writer.append_frame(DataFrame(data=[["1"]]))
+
+        writer.close()
+
+        assert client.append_table_data.call_args_list == [
+            mock.call(
+                "table-id", AppendTableDataRequest(frame=DataFrame(data=[["1"]]))
+            ),
+            mock.call("table-id", AppendTableDataRequest(end_of_data=True)),
+        ]
+
+    def test__with_statement_raises__exit__does_not_send_end_of_data(self, client):
+        with pytest.raises(RuntimeError):
+            with BufferedTableWriter(client, "table-id", buffer_size=10) as writer:
+                writer.append_rows([["1"]])
+                raise RuntimeError()
+
+        assert client.append_table_data.call_args_list == [
+            mock.call("table-id", AppendTableDataRequest(frame=DataFrame(data=[["1"]])))
+        ]
+
+    def test__closed__append_rows__raises(self, client):
+        writer = BufferedTableWriter(client, "table-id", buffer_size=10)
+        writer.close()
+
+        with pytest.raises(ReferenceError):
+            writer.append_rows([["1"]])
+
+    def test__background_request_fails__flush__raises(self, client):
+        error = ApiException("failed")
+        client.append_table_data.side_effect = error
+        writer = BufferedTableWriter(client, "table-id", buffer_size=1)
+
+        writer.append_rows([["1"]])
+
+        with pytest.raises(ApiException) as ex:
+            writer.flush()
+        assert ex.value is error
+
+    def test__max_requests_in_flight__append_rows__limits_outstanding_requests(
+        self, client
+    ):
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def append_table_data(*args):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+        client.append_table_data.side_effect = append_table_data
+        writer = BufferedTableWriter(
+            client, "table-id", buffer_size=1, max_requests_in_flight=2
+        )
+
+        writer.append_rows([[str(i)] for i in range(10)])
+        writer.flush()
+
+        assert client.append_table_data.call_count == 10
+        assert peak[0] == 2
+
+    def test__mismatched_frame_columns__append_frame__raises(self, client):
+        writer = BufferedTableWriter(client, "table-id", ["a"], buffer_size=10)
+
+        with pytest.raises(ValueError):
+            writer.append_frame(DataFrame(columns=["b"], data=[["1"]]))
+
+    def test__no_limits__init__raises(self, client):
+        with pytest.raises(ValueError):
+            BufferedTableWriter(client, "table-id")
@@ -0,0 +1,190 @@
+import json
+import threading
+from typing import Any, Dict, List, Tuple
+
+import pytest  # type: ignore
+import requests
+import responses
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    ModifyTablesRequest,
+    TableMetadataModification,
+)
+
+
+@pytest.fixture
+def client():
+    """Fixture to create a DataFrameClient instance."""
+    return DataFrameClient(HttpConfiguration("http://localhost", "api-key"))
+
+
+class FakeService:
+    """Answers bulk requests, failing tables whose IDs start with "bad",
+    rejecting whole requests that include a table whose ID starts with "reject",
+    and dropping the connection for requests that include a table whose ID starts
+    with "unreachable".
+    """
+
+    def __init__(self):
+        self.requests = []  # type: List[List[str]]
+        self.bodies = []  # type: List[Dict[str, Any]]
+        self.lock = threading.Lock()
+
+    def delete_tables(self, request: Any) -> Tuple[int, Dict[str, str], str]:
+        ids = json.loads(request.body)["ids"]
+        return self._respond(
+            ids,
+            lambda ok, failed: {"deletedTableIds": ok, "failedTableIds": failed},
+        )
+
+    def modify_tables(self, request: Any) -> Tuple[int, Dict[str, str], str]:
+        body = json.loads(request.body)
+        with self.lock:
+            self.bodies.append(body)
+        tables = {table["id"]: table for table in body["tables"]}
+        return self._respond(
+            list(tables),
+            lambda ok, failed: {
+                "modifiedTableIds": ok,
+                "failedModifications": [tables[id] for id in failed],
+            },
+        )
+
+    def _respond(self, ids, make_body) -> Tuple[int, Dict[str, str], str]:
+        with self.lock:
+            self.requests.append(ids)
+        if any(id.startswith("unreachable") for id in ids):
+            raise requests.ConnectionError("connection dropped")
+        headers = {"Content-Type": "application/json"}
+        if any(id.startswith("reject") for id in ids):
+            error = {"name": "Rejected", "message": "rejected"}
+            return 400, headers, json.dumps({"error": error})
+
+        failed = [id for id in ids if id.startswith("bad")]
+        if not failed:
+            return 204, {}, ""
+        ok = [id for id in ids if id not in failed]
+        body = make_body(ok, failed)
+        body["error"] = {"name": "Failed", "message": "failed " + ",".join(failed)}
+        return 200, headers, json.dumps(body)
+
+
+@pytest.fixture
+def service(client):
+    """Fixture to register a FakeService's responses."""
+    service = FakeService()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add_callback(
+            responses.POST,
+            f"{client.session.base_url}delete-tables",
+            callback=service.delete_tables,
+        )
+        mock.add_callback(
+            responses.POST,
+            f"{client.session.base_url}modify-tables",
+            callback=service.modify_tables,
+        )
+        yield service
+
+
+class TestDeleteTablesChunked:
+    def test__all_succeed__delete_tables_chunked__returns_none(self, client, service):
+        ids = [f"table-{index}" for index in range(7)]
+
+        result = client.delete_tables_chunked(ids, chunk_size=3)
+
+        assert result is None
+        assert sorted(service.requests) == [ids[0:3], ids[3:6], ids[6:7]]
+
+    def test__chunks_fail__delete_tables_chunked__merges_results(self, client, service):
+        ids = ["table-0", "bad-1", "table-2", "reject-3", "bad-4", "table-5"]
+
+        result = client.delete_tables_chunked(ids, chunk_size=2, max_workers=3)
+
+        assert result is not None
+        assert result.deleted_table_ids == ["table-0", "table-5"]
+        assert result.failed_table_ids == ["bad-1", "table-2", "reject-3", "bad-4"]
+        assert [error.message for error in result.error.inner_errors] == [
+            "failed bad-1",
+            "rejected",
+            "failed bad-4",
+        ]
+
+    def test__one_chunk_fails__delete_tables_chunked__returns_chunk_error(
+        self, client, service
+    ):
+        result = client.delete_tables_chunked(["table-0", "bad-1"], chunk_size=1)
+
+        assert result is not None
+        assert result.error.name == "Failed"
+        assert result.error.inner_errors == []
+
+    def test__connection_error__delete_tables_chunked__keeps_other_chunk_results(
+        self, client, service
+    ):
+        ids = ["table-0", "table-1", "unreachable-2"]
+
+        result = client.delete_tables_chunked(ids, chunk_size=2)
+
+        assert result is not None
+        assert result.deleted_table_ids == ["table-0", "table-1"]
+        assert result.failed_table_ids == ["unreachable-2"]
+        assert result.error.message == "connection dropped"
+
+    def test__invalid_chunk_size__delete_tables_chunked__raises(self, client):
+        with pytest.raises(ValueError, match="chunk_size"):
+            client.delete_tables_chunked(["table-0"], chunk_size=0)
+
+
+class TestModifyTablesChunked:
+    def test__chunks_fail__modify_tables_chunked__merges_results(self, client, service):
+        updates = ModifyTablesRequest(
+            tables=[
+                TableMetadataModification(id=id, name="renamed")
+                for id in ("table-0", "bad-1", "table-2", "table-3")
+            ],
+            replace=True,
+        )
+
+        result = client.modify_tables_chunked(updates, chunk_size=2)
+
+        assert result is not None
+        assert result.modified_table_ids == ["table-0", "table-2", "table-3"]
+        assert [table.id for table in result.failed_modifications] == ["bad-1"]
+        assert result.error.message == "failed bad-1"
+        assert len(service.requests) == 2
+        assert all(body["replace"] is True for body in service.bodies)
+
+    def test__replace_unset__modify_tables_chunked__omits_replace(
+        self, client, service
+    ):
+        updates = ModifyTablesRequest(
+            tables=[
+                TableMetadataModification(id=id, name="renamed")
+                for id in ("table-0", "table-1", "table-2")
+            ]
+        )
+
+        result = client.modify_tables_chunked(updates, chunk_size=2)
+
+        assert result is None
+        assert len(service.bodies) == 2
+        assert not any("replace" in body for body in service.bodies)
+
+    def test__connection_error__modify_tables_chunked__keeps_other_chunk_results(
+        self, client, service
+    ):
+        updates = ModifyTablesRequest(
+            tables=[
+                TableMetadataModification(id=id, name="renamed")
+                for id in ("table-0", "unreachable-1")
+            ]
+        )
+
+        result = client.modify_tables_chunked(updates, chunk_size=1)
+
+        assert result is not None
+        assert result.modified_table_ids == ["table-0"]
+        assert [table.id for table in result.failed_modifications] == ["unreachable-1"]
+        assert result.error.message == "connection dropped"
@@ -0,0 +1,271 @@
+import io
+from unittest import mock
+
+import numpy as np
+import pytest  # type: ignore
+import requests
+import responses
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.columnar import (
+    ColumnarFrame,
+    decode_column,
+    decode_frame,
+    read_csv_batches,
+)
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    ColumnType,
+    DataFrame,
+    DataType,
+    ExportFormat,
+    ExportTableDataRequest,
+    QueryTableDataRequest,
+)
+
+
+columns = [
+    Column(name="index", data_type=DataType.Int32, column_type=ColumnType.Index),
+    Column(name="time", data_type=DataType.Timestamp),
+    Column(name="value", data_type=DataType.Float64, column_type=ColumnType.Nullable),
+    Column(name="flag", data_type=DataType.Bool),
+    Column(name="label", data_type=DataType.String, column_type=ColumnType.Nullable),
+]
+
+
+@pytest.fixture
+def client():
+    """Fixture to create a DataFrameClient instance."""
+    return DataFrameClient(HttpConfiguration("http://localhost", "api-key"))
+
+
+class TestDecodeColumn:
+    def test__float_values__decode__returns_float64_array(self):
+        column = decode_column(
+            "value", DataType.Float64, ["1.5", "NaN", "Infinity", "-Infinity"]
+        )
+
+        assert column.values.dtype == np.float64
+        assert column.values[0] == 1.5
+        assert np.isnan(column.values[1])
+        assert column.values[2] == np.inf
+        assert column.values[3] == -np.inf
+        assert not column.has_nulls
+
+    def test__int64_values__decode__preserves_full_range(self):
+        column = decode_column(
+            "value", DataType.Int64, ["-9223372036854775808", "9223372036854775807"]
+        )
+
+        assert column.values.dtype == np.int64
+        assert column.values.tolist() == [-(2**63), 2**63 - 1]
+
+    def test__bool_values__decode__is_case_insensitive(self):
+        column = decode_column("flag", DataType.Bool, ["true", "False", "TRUE"])
+
+        assert column.values.tolist() == [True, False, True]
+
+    def test__timestamp_values__decode__returns_utc_milliseconds(self):
+        column = decode_column(
+            "time",
+            DataType.Timestamp,
+            ["2022-08-19T16:17:30.123Z", "2022-08-19T18:17:30.123+02:00"],
+        )
+
+        expected = np.datetime64("2022-08-19T16:17:30.123", "ms")
+        assert column.values.dtype == np.dtype("datetime64[ms]")
+        assert column.values.tolist() == [expected.item(), expected.item()]
+
+    def test__null_values__decode__sets_mask(self):
+        column = decode_column("value", DataType.Int32, ["1", None, "3"])
+
+        assert column.has_nulls
+        assert column.mask.tolist() == [False, True, False]
+        assert column.to_list() == [1, None, 3]
+
+    def test__invalid_value__decode__raises(self):
+        with pytest.raises(ValueError):
+            decode_column("value", DataType.Float64, ["not a number"])
+
+    @pytest.mark.parametrize("value", ["yes", "1", ""])
+    def test__invalid_bool_value__decode__raises(self, value):
+        with pytest.raises(ValueError, match="Invalid bool value"):
+            decode_column("flag", DataType.Bool, ["true", value])
+
+
+class TestDecodeFrame:
+    def test__frame_with_columns__decode__uses_column_data_types(self):
+        frame = DataFrame(columns=["value", "label"], data=[["1.5", "a"], [None, None]])
+
+        decoded = decode_frame(frame, columns)
+
+        assert decoded.column_names == ["value", "label"]
+        assert len(decoded) == 2
+        assert decoded["value"].data_type == DataType.Float64
+        assert decoded["label"].to_list() == ["a", None]
+        assert decoded.to_rows() == [[1.5, "a"], [None, None]]
+
+    def test__frame_without_columns__decode__assumes_table_order(self):
+        frame = DataFrame(
+            data=[["1", "2022-08-19T16:17:30.123Z", "2.5", "true", "x"]],
+        )
+
+        decoded = decode_frame(frame, columns)
+
+        assert decoded.column_names == [column.name for column in columns]
+        assert decoded["index"].values.dtype == np.int32
+
+    def test__empty_frame__decode__returns_empty_columns(self):
+        decoded = decode_frame(DataFrame(columns=["index"], data=[]), columns)
+
+        assert len(decoded) == 0
+        assert decoded["index"].values.dtype == np.int32
+
+    def test__unknown_column__decode__raises(self):
+        with pytest.raises(ValueError, match="Unknown column"):
+            decode_frame(DataFrame(columns=["missing"], data=[["1"]]), columns)
+
+    def test__frames__concat__appends_rows(self):
+        first = decode_frame(DataFrame(columns=["index"], data=[["1"]]), columns)
+        second = decode_frame(DataFrame(columns=["index"], data=[["2"]]), columns)
+
+        combined = ColumnarFrame.concat([first, second])
+
+        assert combined["index"].values.tolist() == [1, 2]
+
+
+class TestReadCsvBatches:
+    def test__csv_data__read__yields_batches_of_batch_size(self):
+        data = b"index,value\r\n" + b"".join(b"%d,%d.5\r\n" % (i, i) for i in range(5))
+
+        batches = list(read_csv_batches(io.BytesIO(data), columns, batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert ColumnarFrame.concat(batches)["index"].values.tolist() == [0, 1, 2, 3, 4]
+        assert batches[2]["value"].values.tolist() == [4.5]
+
+    def test__values_split_across_chunks__read__decodes_values(self):
+        data = 'index,label\n1,"a\nb"\n2,"ünï, cödé"\n'.encode()
+
+        batches = list(read_csv_batches(io.BytesIO(data), columns, chunk_size=1))
+
+        assert batches[0]["label"].to_list() == ["a\nb", "ünï, cödé"]
+
+    def test__empty_values__read__decodes_nulls_except_strings(self):
+        data = b"\xef\xbb\xbfvalue,label,time\n,,\n1,x,2022-01-01T00:00:00Z\n"
+
+        batches = list(read_csv_batches(io.BytesIO(data), columns))
+
+        assert batches[0]["value"].to_list() == [None, 1.0]
+        assert batches[0]["label"].to_list() == ["", "x"]
+        assert batches[0]["time"].mask.tolist() == [True, False]
+
+    def test__header_only__read__yields_nothing(self):
+        assert list(read_csv_batches(io.BytesIO(b"index\n"), columns)) == []
+
+    def test__unknown_column__read__raises(self):
+        with pytest.raises(ValueError, match="Unknown column"):
+            list(read_csv_batches(io.BytesIO(b"missing\n1\n"), columns))
+
+    def test__row_with_missing_values__read__raises(self):
+        with pytest.raises(ValueError, match="Expected 2 values"):
+            list(read_csv_batches(io.BytesIO(b"index,value\n1\n"), columns))
+
+    def test__invalid_batch_size__read__raises(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            read_csv_batches(io.BytesIO(b""), columns, batch_size=0)
+
+
+class TestDataFrameClientColumnar:
+    @responses.activate
+    def test__query_table_data_columnar__decodes_with_table_metadata(
+        self, client: DataFrameClient
+    ):
+        responses.add(
+            responses.GET,
+            f"{client.session.base_url}tables/table-id",
+            json={
+                "columns": [column.dict(by_alias=True) for column in columns],
+                "createdAt": "2022-08-19T16:17:30.123Z",
+                "id": "table-id",
+                "metadataModifiedAt": "2022-08-19T16:17:30.123Z",
+                "metadataRevision": 1,
+                "name": "table",
+                "properties": {},
+                "rowCount": 2,
+                "rowsModifiedAt": "2022-08-19T16:17:30.123Z",
+                "supportsAppend": True,
+                "workspace": "workspace",
+            },
+        )
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/query-data",
+            json={
+                "frame": {"columns": ["index", "value"], "data": [["1", "1.5"]]},
+                "totalRowCount": 2,
+                "continuationToken": "token",
+            },
+        )
+
+        result = client.query_table_data_columnar(
+            "table-id", QueryTableDataRequest(columns=["index", "value"], take=1)
+        )
+
+        assert result.total_row_count == 2
+        assert result.continuation_token == "token"
+        assert result.frame["index"].values.tolist() == [1]
+        assert result.frame["value"].values.tolist() == [1.5]
+
+    @responses.activate
+    def test__table_columns_provided__get_table_data_columnar__skips_metadata_request(
+        self, client: DataFrameClient
+    ):
+        responses.add(
+            responses.GET,
+            f"{client.session.base_url}tables/table-id/data",
+            json={
+                "frame": {"columns": ["flag"], "data": [["true"], ["false"]]},
+                "totalRowCount": 2,
+                "continuationToken": None,
+            },
+        )
+
+        result = client.get_table_data_columnar(
+            "table-id", columns=["flag"], table_columns=columns
+        )
+
+        assert len(responses.calls) == 1
+        assert result.frame["flag"].values.tolist() == [True, False]
+
+    @responses.activate
+    def test__export_table_data_batches__streams_and_decodes_export(
+        self, client: DataFrameClient
+    ):
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/export-data",
+            body=b"index,flag\r\n1,true\r\n2,false\r\n3,true\r\n",
+        )
+
+        with mock.patch.object(
+            requests.Session,
+            "request",
+            autospec=True,
+            side_effect=requests.Session.request,
+        ) as request:
+            batches = list(
+                client.export_table_data_batches(
+                    "table-id",
+                    ExportTableDataRequest(
+                        columns=["index", "flag"], response_format=ExportFormat.CSV
+                    ),
+                    batch_size=2,
+                    table_columns=columns,
+                )
+            )
+
+        assert request.call_args.kwargs["stream"] is True
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[0]["flag"].values.tolist() == [True, False]
+        assert batches[1]["index"].values.tolist() == [3]
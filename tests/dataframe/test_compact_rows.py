@@ -0,0 +1,110 @@
+import json
+import sys
+
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    CompactDataFrame,
+    CompactPagedTableRows,
+    CompactRows,
+    DataFrame,
+    PagedTableRows,
+)
+
+rows = [["1", "café", "1.5"], ["2", None, ""], ["3", "☃", None]]
+
+
+class TestCompactRows:
+    def test__rows__access__returns_same_rows(self):
+        compact = CompactRows(rows)
+
+        assert len(compact) == 3
+        assert compact.column_count == 3
+        assert list(compact) == rows
+        assert compact[1] == ["2", None, ""]
+        assert compact[-1] == ["3", "☃", None]
+        assert compact[1:] == rows[1:]
+        assert compact.column(1) == ["café", None, "☃"]
+        assert compact.to_list() == rows
+        assert compact == rows
+
+    def test__index_out_of_range__getitem__raises(self):
+        with pytest.raises(IndexError):
+            CompactRows(rows)[3]
+
+    def test__row_with_wrong_length__append__raises_and_keeps_rows(self):
+        compact = CompactRows(rows)
+
+        with pytest.raises(ValueError, match="Each row must have 3 values, not 2"):
+            compact.append(["4", "x"])
+
+        assert compact.to_list() == rows
+
+    def test__row_with_invalid_value__append__raises_and_keeps_rows(self):
+        compact = CompactRows(rows)
+
+        with pytest.raises(ValueError, match="strings or nulls"):
+            compact.append(["4", "x", 5])  # type: ignore
+
+        compact.append(["4", "x", "y"])
+        assert compact.to_list() == rows + [["4", "x", "y"]]
+
+    def test__many_rows__nbytes__smaller_than_lists(self):
+        many = [[str(i), "value {}".format(i)] for i in range(1000)]
+
+        compact = CompactRows(many)
+
+        list_size = sys.getsizeof(many) + sum(
+            sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+            for row in many
+        )
+        assert compact.nbytes * 4 < list_size
+
+
+class TestCompactDataFrame:
+    def test__compact_frame__serialize__same_as_data_frame(self):
+        compact = CompactDataFrame(columns=["a", "b", "c"], data=CompactRows(rows))
+        frame = DataFrame(columns=["a", "b", "c"], data=rows)
+
+        assert compact.json(by_alias=True) == frame.json(by_alias=True)
+        assert compact.dict() == frame.dict()
+        assert compact.to_data_frame() == frame
+
+    def test__compact_frame__append_request__serializes_same_as_data_frame(self):
+        compact = AppendTableDataRequest(
+            frame=CompactDataFrame(data=CompactRows(rows)), end_of_data=True
+        )
+        request = AppendTableDataRequest(frame=DataFrame(data=rows), end_of_data=True)
+
+        assert isinstance(compact.frame, CompactDataFrame)
+        assert compact.json(by_alias=True, exclude_unset=True) == request.json(
+            by_alias=True, exclude_unset=True
+        )
+
+    def test__compact_frame__append_request__keeps_rows_without_copying(self):
+        data = CompactRows(rows)
+
+        request = AppendTableDataRequest(frame=CompactDataFrame(data=data))
+
+        assert isinstance(request.frame, CompactDataFrame)
+        assert request.frame.data is data
+
+    def test__json__parse_append_request__uses_data_frame(self):
+        request = AppendTableDataRequest.parse_obj({"frame": {"data": rows}})
+
+        assert isinstance(request.frame, DataFrame)
+
+    def test__compact_page__serialize__same_as_paged_table_rows(self):
+        page = {
+            "frame": {"columns": ["a", "b", "c"], "data": rows},
+            "totalRowCount": 3,
+            "continuationToken": "token",
+        }
+
+        compact = CompactPagedTableRows.parse_obj(page)
+
+        assert isinstance(compact.frame.data, CompactRows)
+        assert json.loads(compact.json(by_alias=True)) == page
+        assert compact.json(by_alias=True) == PagedTableRows.parse_obj(page).json(
+            by_alias=True
+        )
@@ -0,0 +1,429 @@
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+import pytest  # type: ignore
+import responses
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    CompactDataFrame,
+    CompactRows,
+    ModifyTableRequest,
+    ModifyTablesRequest,
+    QueryTableDataRequest,
+    QueryTablesRequest,
+    TableMetadataModification,
+)
+from responses import matchers
+
+
+@pytest.fixture
+def client():
+    """Fixture to create a DataFrameClient instance."""
+    return DataFrameClient(HttpConfiguration("http://localhost", "api-key"))
+
+
+@pytest.fixture
+def cached_client():
+    """Fixture to create a DataFrameClient instance that caches table metadata."""
+    return DataFrameClient(
+        HttpConfiguration("http://localhost", "api-key"),
+        metadata_cache_ttl=timedelta(minutes=5),
+    )
+
+
+def _table_metadata(id: str, row_count: int = 0) -> Dict[str, Any]:
+    return {
+        "columns": [{"name": "index", "dataType": "INT32", "columnType": "INDEX"}],
+        "createdAt": "2022-08-19T16:17:30.123Z",
+        "id": id,
+        "metadataModifiedAt": "2022-08-19T16:17:30.123Z",
+        "metadataRevision": 1,
+        "name": "table",
+        "properties": {},
+        "rowCount": row_count,
+        "rowsModifiedAt": "2022-08-19T16:17:30.123Z",
+        "supportsAppend": True,
+        "workspace": "workspace",
+    }
+
+
+def _paged_rows(
+    data: List[List[Optional[str]]], continuation_token: Optional[str] = None
+) -> Dict[str, Any]:
+    return {
+        "frame": {"columns": ["index"], "data": data},
+        "totalRowCount": 3,
+        "continuationToken": continuation_token,
+    }
+
+
+class TestQueryTableDataPages:
+    @responses.activate
+    def test__multiple_pages__query_table_data_pages__follows_continuation_tokens(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}tables/table-id/query-data"
+        responses.add(
+            responses.POST,
+            url,
+            json=_paged_rows([["1"], ["2"]], "token"),
+            match=[matchers.json_params_matcher({"columns": ["index"], "take": 2})],
+        )
+        responses.add(
+            responses.POST,
+            url,
+            json=_paged_rows([["3"]]),
+            match=[
+                matchers.json_params_matcher(
+                    {"columns": ["index"], "take": 2, "continuationToken": "token"}
+                )
+            ],
+        )
+
+        pages = list(
+            client.query_table_data_pages(
+                "table-id", QueryTableDataRequest(columns=["index"], take=2)
+            )
+        )
+
+        assert [page.frame.data for page in pages] == [[["1"], ["2"]], [["3"]]]
+
+    @responses.activate
+    def test__request_fails__query_table_data_pages__raises(
+        self, client: DataFrameClient
+    ):
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/query-data",
+            status=400,
+        )
+
+        with pytest.raises(ApiException, match="400 Bad Request"):
+            list(client.query_table_data_pages("table-id", QueryTableDataRequest()))
+
+
+class TestTableMetadataCache:
+    @responses.activate
+    def test__no_ttl__get_table_metadata__requests_metadata_every_time(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}tables/table-id"
+        responses.add(responses.GET, url, json=_table_metadata("table-id"))
+
+        client.get_table_metadata("table-id")
+        client.get_table_metadata("table-id")
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test__cached__get_table_metadata__returns_cached_metadata(
+        self, cached_client: DataFrameClient
+    ):
+        url = f"{cached_client.session.base_url}tables/table-id"
+        responses.add(responses.GET, url, json=_table_metadata("table-id"))
+
+        first = cached_client.get_table_metadata("table-id")
+        second = cached_client.get_table_metadata("table-id")
+
+        assert second is first
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test__cached__get_table_metadata_with_refresh__requests_metadata(
+        self, cached_client: DataFrameClient
+    ):
+        url = f"{cached_client.session.base_url}tables/table-id"
+        responses.add(responses.GET, url, json=_table_metadata("table-id"))
+        responses.add(responses.GET, url, json=_table_metadata("table-id", 5))
+        cached_client.get_table_metadata("table-id")
+
+        refreshed = cached_client.get_table_metadata("table-id", refresh=True)
+
+        assert refreshed.row_count == 5
+        assert cached_client.get_table_metadata("table-id") is refreshed
+
+    @responses.activate
+    def test__expired__get_table_metadata__requests_metadata(
+        self, cached_client: DataFrameClient
+    ):
+        url = f"{cached_client.session.base_url}tables/table-id"
+        responses.add(responses.GET, url, json=_table_metadata("table-id"))
+        with mock.patch("time.monotonic", return_value=1000.0):
+            cached_client.get_table_metadata("table-id")
+
+        with mock.patch("time.monotonic", return_value=1301.0):
+            cached_client.get_table_metadata("table-id")
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test__cache_full__get_table_metadata__evicts_least_recently_used(self):
+        client = DataFrameClient(
+            HttpConfiguration("http://localhost", "api-key"),
+            metadata_cache_ttl=timedelta(minutes=5),
+            metadata_cache_size=1,
+        )
+        for id in ("table-1", "table-2"):
+            responses.add(
+                responses.GET,
+                f"{client.session.base_url}tables/{id}",
+                json=_table_metadata(id),
+            )
+
+        client.get_table_metadata("table-1")
+        client.get_table_metadata("table-2")
+        client.get_table_metadata("table-1")
+
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test__modify_table__get_table_metadata__requests_metadata(
+        self, cached_client: DataFrameClient
+    ):
+        url = f"{cached_client.session.base_url}tables/table-id"
+        responses.add(responses.GET, url, json=_table_metadata("table-id"))
+        responses.add(responses.PATCH, url)
+        cached_client.get_table_metadata("table-id")
+
+        cached_client.modify_table("table-id", ModifyTableRequest(name="renamed"))
+        cached_client.get_table_metadata("table-id")
+
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test__modify_tables__get_table_metadata__requests_metadata(
+        self, cached_client: DataFrameClient
+    ):
+        base_url = cached_client.session.base_url
+        responses.add(
+            responses.GET,
+            f"{base_url}tables/table-id",
+            json=_table_metadata("table-id"),
+        )
+        responses.add(responses.POST, f"{base_url}modify-tables", status=204)
+        cached_client.get_table_metadata("table-id")
+
+        cached_client.modify_tables(
+            ModifyTablesRequest(
+                tables=[TableMetadataModification(id="table-id", name="renamed")]
+            )
+        )
+        cached_client.get_table_metadata("table-id")
+
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test__delete_request_fails__get_table_metadata__requests_metadata(
+        self, cached_client: DataFrameClient
+    ):
+        base_url = cached_client.session.base_url
+        responses.add(
+            responses.GET,
+            f"{base_url}tables/table-id",
+            json=_table_metadata("table-id"),
+        )
+        responses.add(responses.POST, f"{base_url}delete-tables", status=500)
+        cached_client.get_table_metadata("table-id")
+
+        with pytest.raises(ApiException):
+            cached_client.delete_tables(["table-id"])
+        cached_client.get_table_metadata("table-id")
+
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test__warm_metadata_cache__get_table_metadata__returns_cached_metadata(
+        self, cached_client: DataFrameClient
+    ):
+        responses.add(
+            responses.POST,
+            f"{cached_client.session.base_url}query-tables",
+            json={
+                "tables": [_table_metadata("table-1"), _table_metadata("table-2")],
+                "continuationToken": "token",
+            },
+        )
+
+        page = cached_client.warm_metadata_cache(QueryTablesRequest(filter=""))
+        metadata = cached_client.get_table_metadata("table-2")
+
+        assert page.continuation_token == "token"
+        assert metadata is page.tables[1]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test__clear_metadata_cache__get_table_metadata__requests_metadata(
+        self, cached_client: DataFrameClient
+    ):
+        url = f"{cached_client.session.base_url}tables/table-id"
+        responses.add(responses.GET, url, json=_table_metadata("table-id"))
+        cached_client.get_table_metadata("table-id")
+
+        cached_client.clear_metadata_cache()
+        cached_client.get_table_metadata("table-id")
+
+        assert len(responses.calls) == 2
+
+    def test__negative_ttl__constructor__raises(self):
+        with pytest.raises(ValueError, match="metadata_cache_ttl"):
+            DataFrameClient(
+                HttpConfiguration("http://localhost", "api-key"),
+                metadata_cache_ttl=timedelta(seconds=-1),
+            )
+
+
+class TestQueryAllTables:
+    @responses.activate
+    def test__multiple_pages__query_all_tables__returns_every_table(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}query-tables"
+        responses.add(
+            responses.POST,
+            url,
+            json={
+                "tables": [_table_metadata("table-1"), _table_metadata("table-2")],
+                "continuationToken": "token",
+            },
+            match=[matchers.json_params_matcher({"filter": "", "take": 2})],
+        )
+        responses.add(
+            responses.POST,
+            url,
+            json={"tables": [_table_metadata("table-3")], "continuationToken": None},
+            match=[
+                matchers.json_params_matcher(
+                    {"filter": "", "take": 4, "continuationToken": "token"}
+                )
+            ],
+        )
+
+        tables = client.query_all_tables(QueryTablesRequest(filter="", take=2))
+
+        assert [table.id for table in tables] == ["table-1", "table-2", "table-3"]
+
+    @responses.activate
+    def test__list_all_tables__requests_pages_lazily(self, client: DataFrameClient):
+        responses.add(
+            responses.GET,
+            f"{client.session.base_url}tables",
+            json={"tables": [_table_metadata("table-1")], "continuationToken": "t"},
+        )
+
+        tables = client.list_all_tables(workspace=["workspace"], take=1)
+        first = next(tables)
+
+        assert first.id == "table-1"
+        assert len(responses.calls) == 1
+        assert responses.calls[0].request.params == {  # type: ignore
+            "take": "1",
+            "workspace": "workspace",
+        }
+
+    def test__zero_take__query_all_tables__raises(self, client: DataFrameClient):
+        with pytest.raises(ValueError, match="take cannot be 0 or negative"):
+            client.query_all_tables(QueryTablesRequest(filter="", take=0))
+
+    def test__zero_take__list_all_tables__raises(self, client: DataFrameClient):
+        with pytest.raises(ValueError, match="take cannot be 0 or negative"):
+            client.list_all_tables(take=0)
+
+    def test__invalid_max_take__query_all_tables__raises(self, client: DataFrameClient):
+        with pytest.raises(ValueError, match="maximum"):
+            client.query_all_tables(QueryTablesRequest(filter=""), max_take=0)
+
+
+class TestStreamedTableData:
+    @responses.activate
+    def test__query_table_data_streamed__returns_page(self, client: DataFrameClient):
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/query-data",
+            json=_paged_rows([["1"], ["2"]], "token"),
+        )
+
+        page = client.query_table_data_streamed("table-id", QueryTableDataRequest())
+
+        assert page.frame.data == [["1"], ["2"]]
+        assert page.total_row_count == 3
+        assert page.continuation_token == "token"
+
+    @responses.activate
+    def test__query_table_data_compact__returns_compact_page(
+        self, client: DataFrameClient
+    ):
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/query-data",
+            json=_paged_rows([["1", "a"], ["2", None]], "token"),
+        )
+
+        page = client.query_table_data_compact("table-id", QueryTableDataRequest())
+
+        assert isinstance(page.frame.data, CompactRows)
+        assert page.frame.data.to_list() == [["1", "a"], ["2", None]]
+        assert page.total_row_count == 3
+        assert page.continuation_token == "token"
+
+    @responses.activate
+    def test__compact_frame__append_table_data__sends_rows(
+        self, client: DataFrameClient
+    ):
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/data",
+            match=[
+                matchers.json_params_matcher(
+                    {"frame": {"columns": ["a"], "data": [["1"], [None]]}}
+                )
+            ],
+        )
+
+        client.append_table_data(
+            "table-id",
+            AppendTableDataRequest(
+                frame=CompactDataFrame(columns=["a"], data=CompactRows([["1"], [None]]))
+            ),
+        )
+
+    @responses.activate
+    def test__multiple_pages__iter_table_data_rows__follows_continuation_tokens(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}tables/table-id/query-data"
+        responses.add(
+            responses.POST,
+            url,
+            json=_paged_rows([["1"], ["2"]], "token"),
+            match=[matchers.json_params_matcher({"take": 2})],
+        )
+        responses.add(
+            responses.POST,
+            url,
+            json=_paged_rows([["3"]]),
+            match=[
+                matchers.json_params_matcher({"take": 2, "continuationToken": "token"})
+            ],
+        )
+
+        rows = list(
+            client.iter_table_data_rows("table-id", QueryTableDataRequest(take=2))
+        )
+
+        assert rows == [["1"], ["2"], ["3"]]
+
+    @responses.activate
+    def test__request_fails__query_table_data_streamed__raises(
+        self, client: DataFrameClient
+    ):
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/query-data",
+            status=400,
+        )
+
+        with pytest.raises(ApiException, match="400 Bad Request"):
+            client.query_table_data_streamed("table-id", QueryTableDataRequest())
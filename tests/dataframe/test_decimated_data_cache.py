@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe import DataFrameClient, DecimatedDataCache
+from nisystemlink.clients.dataframe.models import (
+    DataFrame,
+    DecimationMethod,
+    DecimationOptions,
+    QueryDecimatedDataRequest,
+    TableRows,
+)
+
+
+def _query(intervals: int = 100) -> QueryDecimatedDataRequest:
+    return QueryDecimatedDataRequest(
+        columns=["x", "y"],
+        decimation=DecimationOptions(
+            x_column="x", y_columns=["y"], intervals=intervals
+        ),
+    )
+
+
+def _modified_at(minute: int) -> datetime:
+    return datetime(2023, 1, 1, 12, minute, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def client():
+    """Fixture to create a mock DataFrameClient."""
+    client = mock.Mock(spec=DataFrameClient)
+    client.get_table_metadata.return_value.rows_modified_at = _modified_at(0)
+    client.query_decimated_data.side_effect = lambda id, query: TableRows(
+        frame=DataFrame(data=[[id]])
+    )
+    return client
+
+
+class TestDecimatedDataCache:
+    def test__same_query__query_decimated_data__returns_cached_result(self, client):
+        cache = DecimatedDataCache(client)
+
+        first = cache.query_decimated_data("table-id", _query())
+        second = cache.query_decimated_data("table-id", _query())
+
+        assert second is first
+        assert client.query_decimated_data.call_count == 1
+
+    def test__different_queries__query_decimated_data__caches_each_result(self, client):
+        cache = DecimatedDataCache(client)
+
+        cache.query_decimated_data("table-id", _query(100))
+        cache.query_decimated_data("table-id", _query(200))
+        cache.query_decimated_data("other-id", _query(100))
+        decimation = _query(100).decimation
+        assert decimation is not None
+        decimation.method = DecimationMethod.MaxMin
+        cache.query_decimated_data(
+            "table-id",
+            QueryDecimatedDataRequest(columns=["x", "y"], decimation=decimation),
+        )
+
+        assert client.query_decimated_data.call_count == 4
+        assert len(cache) == 4
+
+    def test__rows_modified__query_decimated_data__discards_table_results(self, client):
+        cache = DecimatedDataCache(client)
+        cache.query_decimated_data("table-id", _query(100))
+        cache.query_decimated_data("table-id", _query(200))
+
+        client.get_table_metadata.return_value.rows_modified_at = _modified_at(1)
+        cache.query_decimated_data("table-id", _query(100))
+
+        assert client.query_decimated_data.call_count == 3
+        assert len(cache) == 1
+
+    def test__max_entries_reached__query_decimated_data__evicts_least_recently_used(
+        self, client
+    ):
+        cache = DecimatedDataCache(client, max_entries=2)
+        cache.query_decimated_data("table-id", _query(1))
+        cache.query_decimated_data("table-id", _query(2))
+        cache.query_decimated_data("table-id", _query(1))
+
+        cache.query_decimated_data("table-id", _query(3))
+        cache.query_decimated_data("table-id", _query(1))
+        cache.query_decimated_data("table-id", _query(2))
+
+        assert [
+            call.args[1].decimation.intervals
+            for call in client.query_decimated_data.call_args_list
+        ] == [1, 2, 3, 2]
+
+    def test__metadata_max_age__query_decimated_data__reuses_rows_modified_at(
+        self, client
+    ):
+        cache = DecimatedDataCache(client, metadata_max_age=timedelta(hours=1))
+
+        cache.query_decimated_data("table-id", _query())
+        client.get_table_metadata.return_value.rows_modified_at = _modified_at(1)
+        cache.query_decimated_data("table-id", _query())
+
+        assert client.get_table_metadata.call_count == 1
+        assert client.query_decimated_data.call_count == 1
+
+    def test__invalidate_table__query_decimated_data__queries_server(self, client):
+        cache = DecimatedDataCache(client)
+        cache.query_decimated_data("table-id", _query())
+        cache.query_decimated_data("other-id", _query())
+
+        cache.invalidate("table-id")
+        cache.query_decimated_data("table-id", _query())
+        cache.query_decimated_data("other-id", _query())
+
+        assert client.query_decimated_data.call_count == 3
+
+    def test__invalid_max_entries__create__raises(self, client):
+        with pytest.raises(ValueError, match="max_entries"):
+            DecimatedDataCache(client, max_entries=0)
@@ -0,0 +1,152 @@
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import (
+    ColumnarFrame,
+    decimate,
+    DecimationPyramid,
+    TypedColumn,
+)
+from nisystemlink.clients.dataframe.models import (
+    DataType,
+    DecimationMethod,
+    DecimationOptions,
+)
+
+
+def _frame(x: np.ndarray, y: np.ndarray) -> ColumnarFrame:
+    return ColumnarFrame(
+        [
+            TypedColumn("x", DataType.Int64, x),
+            TypedColumn("y", DataType.Float64, y),
+        ]
+    )
+
+
+def _options(method: DecimationMethod, intervals: int) -> DecimationOptions:
+    return DecimationOptions(
+        x_column="x", y_columns=["y"], intervals=intervals, method=method
+    )
+
+
+class TestDecimate:
+    def test__lossy__decimate__samples_rows_uniformly(self):
+        frame = _frame(np.arange(100), np.zeros(100))
+
+        result = decimate(frame, _options(DecimationMethod.Lossy, 5))
+
+        assert result["x"].values.tolist() == [0, 25, 50, 74, 99]
+
+    def test__fewer_rows_than_intervals__lossy__returns_all_rows(self):
+        frame = _frame(np.array([3, 1, 2]), np.zeros(3))
+
+        result = decimate(frame, DecimationOptions(intervals=10), index_column="x")
+
+        assert result["x"].values.tolist() == [1, 2, 3]
+
+    def test__max_min__decimate__returns_extrema_of_each_interval(self):
+        frame = _frame(np.arange(8), np.array([5.0, 1.0, 3.0, 9.0, 2.0, 2.0, 8.0, 0.0]))
+
+        result = decimate(frame, _options(DecimationMethod.MaxMin, 2))
+
+        assert result["x"].values.tolist() == [1, 3, 6, 7]
+
+    def test__entry_exit__decimate__includes_first_and_last_rows(self):
+        frame = _frame(np.arange(8), np.array([5.0, 1.0, 3.0, 9.0, 2.0, 2.0, 8.0, 0.0]))
+
+        result = decimate(frame, _options(DecimationMethod.EntryExit, 2))
+
+        assert result["x"].values.tolist() == [0, 1, 3, 4, 6, 7]
+
+    def test__null_values__max_min__ignores_nulls(self):
+        frame = ColumnarFrame(
+            [
+                TypedColumn("x", DataType.Int32, np.arange(4), [False] * 3 + [True]),
+                TypedColumn(
+                    "y", DataType.Int32, [0, 7, 3, 9], [True, False, False, False]
+                ),
+            ]
+        )
+
+        result = decimate(frame, _options(DecimationMethod.MaxMin, 1))
+
+        assert result["x"].values.tolist() == [1, 2]
+
+    def test__timestamp_x_column__decimate__orders_by_time(self):
+        frame = ColumnarFrame(
+            [
+                TypedColumn(
+                    "time",
+                    DataType.Timestamp,
+                    np.array(["2023-01-02", "2023-01-01", "NaT"], "datetime64[ms]"),
+                ),
+                TypedColumn("y", DataType.Float64, [1.0, 2.0, 3.0]),
+            ]
+        )
+
+        result = decimate(
+            frame, DecimationOptions(x_column="time", method=DecimationMethod.MaxMin)
+        )
+
+        assert result["y"].values.tolist() == [2.0, 1.0]
+
+    def test__string_column__decimate__raises(self):
+        frame = ColumnarFrame([TypedColumn("x", DataType.String, ["a"])])
+
+        with pytest.raises(ValueError, match="numeric"):
+            decimate(frame, index_column="x")
+
+    def test__no_x_column__decimate__raises(self):
+        with pytest.raises(ValueError, match="x_column"):
+            decimate(_frame(np.arange(2), np.zeros(2)))
+
+    def test__max_min_without_y_columns__decimate__raises(self):
+        frame = ColumnarFrame([TypedColumn("x", DataType.Int64, np.arange(8))])
+        options = DecimationOptions(method=DecimationMethod.MaxMin, intervals=3)
+
+        with pytest.raises(ValueError, match="requires at least one y column"):
+            decimate(frame, options, "x")
+        with pytest.raises(ValueError, match="requires at least one y column"):
+            DecimationPyramid(frame, options, "x")
+
+
+class TestDecimationPyramid:
+    @pytest.mark.parametrize(
+        "method", [DecimationMethod.MaxMin, DecimationMethod.EntryExit]
+    )
+    def test__levels__match_direct_decimation(self, method):
+        random = np.random.default_rng(0)
+        frame = _frame(np.arange(4096), random.normal(size=4096))
+
+        pyramid = DecimationPyramid(frame, _options(method, 16), factor=4)
+
+        levels = pyramid.levels[1:]
+        assert len(levels) > 1
+        counts = [16 * 4**index for index in reversed(range(len(levels)))]
+        for level, intervals in zip(levels, counts):
+            expected = decimate(frame, _options(method, intervals))
+            assert level["x"].values.tolist() == expected["x"].values.tolist()
+
+    def test__aligned_range__query__matches_direct_decimation(self):
+        random = np.random.default_rng(1)
+        frame = _frame(np.arange(4096), random.normal(size=4096))
+        pyramid = DecimationPyramid(frame, _options(DecimationMethod.MaxMin, 16))
+
+        result = pyramid.query(1023.75, 2047.5, intervals=16)
+
+        subset = frame.take(np.arange(1024, 2048))
+        expected = decimate(subset, _options(DecimationMethod.MaxMin, 16))
+        assert result["x"].values.tolist() == expected["x"].values.tolist()
+
+    def test__narrow_range__query__returns_rows_in_range(self):
+        frame = _frame(np.arange(1000), np.arange(1000, dtype=np.float64))
+        pyramid = DecimationPyramid(frame, _options(DecimationMethod.Lossy, 10))
+
+        result = pyramid.query(100, 104)
+
+        assert result["x"].values.tolist() == [100, 101, 102, 103, 104]
+
+    def test__empty_range__query__returns_no_rows(self):
+        frame = _frame(np.arange(10), np.zeros(10))
+        pyramid = DecimationPyramid(frame, _options(DecimationMethod.MaxMin, 2))
+
+        assert len(pyramid.query(20, 30)) == 0
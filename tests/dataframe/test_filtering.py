@@ -0,0 +1,160 @@
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import (
+    ColumnarFrame,
+    decode_frame,
+    evaluate_filters,
+    filter_frame,
+    query_frame,
+    sort_frame,
+)
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    ColumnFilter,
+    ColumnOrderBy,
+    DataFrame,
+    DataType,
+    FilterOperation,
+    QueryTableDataRequest,
+)
+
+
+@pytest.fixture
+def frame() -> ColumnarFrame:
+    """Fixture to create a frame with nulls and NaN values."""
+    columns = [
+        Column(name="index", data_type=DataType.Int32),
+        Column(name="value", data_type=DataType.Float64),
+        Column(name="name", data_type=DataType.String),
+        Column(name="time", data_type=DataType.Timestamp),
+    ]
+    data = [
+        ["0", "1.5", "alpha", "2023-01-01T00:00:00Z"],
+        ["1", None, "beta", "2023-01-02T00:00:00Z"],
+        ["2", "NaN", None, None],
+        ["3", "-2.5", "Alphabet", "2023-01-03T00:00:00Z"],
+        ["4", "1.5", "gamma", "2023-01-01T00:00:00Z"],
+    ]
+    return decode_frame(DataFrame(data=data), columns)
+
+
+def _filter(column: str, operation: FilterOperation, value) -> ColumnFilter:
+    return ColumnFilter(column=column, operation=operation, value=value)
+
+
+def _indices(frame: ColumnarFrame) -> list:
+    return frame["index"].to_list()
+
+
+class TestEvaluateFilters:
+    @pytest.mark.parametrize(
+        "operation, value, expected",
+        [
+            (FilterOperation.Equals, "1.5", [0, 4]),
+            (FilterOperation.NotEquals, "1.5", [2, 3]),
+            (FilterOperation.LessThan, "1.5", [3]),
+            (FilterOperation.LessThanEquals, "1.5", [0, 3, 4]),
+            (FilterOperation.GreaterThan, "-2.5", [0, 4]),
+            (FilterOperation.GreaterThanEquals, "-2.5", [0, 3, 4]),
+            (FilterOperation.Equals, None, [1]),
+            (FilterOperation.NotEquals, None, [0, 2, 3, 4]),
+            (FilterOperation.NotEquals, "NaN", [0, 3, 4]),
+        ],
+    )
+    def test__float_column__evaluate_filters__applies_null_and_nan_rules(
+        self, frame, operation, value, expected
+    ):
+        result = filter_frame(frame, [_filter("value", operation, value)])
+
+        assert _indices(result) == expected
+
+    @pytest.mark.parametrize(
+        "operation, value, expected",
+        [
+            (FilterOperation.Equals, "alpha", [0]),
+            (FilterOperation.NotEquals, "alpha", [1, 3, 4]),
+            (FilterOperation.Contains, "lpha", [0, 3]),
+            (FilterOperation.NotContains, "lpha", [1, 4]),
+            (FilterOperation.Equals, None, [2]),
+        ],
+    )
+    def test__string_column__evaluate_filters__compares_strings(
+        self, frame, operation, value, expected
+    ):
+        result = filter_frame(frame, [_filter("name", operation, value)])
+
+        assert _indices(result) == expected
+
+    def test__timestamp_column__evaluate_filters__compares_times(self, frame):
+        result = filter_frame(
+            frame,
+            [_filter("time", FilterOperation.GreaterThan, "2023-01-01T12:00:00+02:00")],
+        )
+
+        assert _indices(result) == [1, 3]
+
+    def test__multiple_filters__evaluate_filters__matches_all_filters(self, frame):
+        matches = evaluate_filters(
+            frame,
+            [
+                _filter("value", FilterOperation.Equals, "1.5"),
+                _filter("index", FilterOperation.GreaterThan, "0"),
+            ],
+        )
+
+        assert matches.tolist() == [False, False, False, False, True]
+
+    @pytest.mark.parametrize(
+        "column_filter",
+        [
+            _filter("name", FilterOperation.LessThan, "alpha"),
+            _filter("value", FilterOperation.Contains, "1"),
+            _filter("value", FilterOperation.LessThan, None),
+            _filter("value", FilterOperation.Equals, "NaN"),
+            _filter("index", FilterOperation.Equals, "one"),
+        ],
+    )
+    def test__invalid_filter__evaluate_filters__raises(self, frame, column_filter):
+        with pytest.raises(ValueError):
+            evaluate_filters(frame, [column_filter])
+
+    def test__unknown_column__evaluate_filters__raises(self, frame):
+        with pytest.raises(KeyError):
+            evaluate_filters(frame, [_filter("missing", FilterOperation.Equals, "1")])
+
+
+class TestSortFrame:
+    def test__ascending__sort_frame__orders_nan_then_nulls_last(self, frame):
+        result = sort_frame(frame, [ColumnOrderBy(column="value")])
+
+        assert _indices(result) == [3, 0, 4, 2, 1]
+
+    def test__descending__sort_frame__orders_nulls_then_nan_first(self, frame):
+        result = sort_frame(frame, [ColumnOrderBy(column="value", descending=True)])
+
+        assert _indices(result) == [1, 2, 0, 4, 3]
+
+    def test__multiple_columns__sort_frame__orders_ties_by_later_columns(self, frame):
+        result = sort_frame(
+            frame,
+            [
+                ColumnOrderBy(column="time"),
+                ColumnOrderBy(column="name", descending=True),
+            ],
+        )
+
+        assert _indices(result) == [4, 0, 1, 3, 2]
+
+
+class TestQueryFrame:
+    def test__query__query_frame__filters_sorts_takes_and_selects_columns(self, frame):
+        query = QueryTableDataRequest(
+            columns=["name"],
+            filters=[_filter("value", FilterOperation.NotEquals, "NaN")],
+            order_by=[ColumnOrderBy(column="index", descending=True)],
+            take=2,
+        )
+
+        result = query_frame(frame, query)
+
+        assert result.column_names == ["name"]
+        assert result["name"].to_list() == ["gamma", "Alphabet"]
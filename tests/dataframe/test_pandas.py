@@ -0,0 +1,270 @@
+import json
+
+import numpy as np
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+import responses
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.columnar import (
+    decode_column,
+    decode_frame,
+    encode_column,
+    encode_frame,
+    from_pandas,
+    to_pandas,
+    TypedColumn,
+)
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    ColumnType,
+    DataFrame,
+    DataType,
+    QueryTableDataRequest,
+)
+from responses import matchers
+
+
+columns = [
+    Column(name="index", data_type=DataType.Int32, column_type=ColumnType.Index),
+    Column(name="time", data_type=DataType.Timestamp, column_type=ColumnType.Nullable),
+    Column(name="value", data_type=DataType.Float64, column_type=ColumnType.Nullable),
+    Column(name="flag", data_type=DataType.Bool, column_type=ColumnType.Nullable),
+    Column(name="label", data_type=DataType.String, column_type=ColumnType.Nullable),
+]
+
+rows = [
+    ["1", "2022-08-19T16:17:30.123Z", "0.1", "true", "a"],
+    ["2", None, "NaN", None, None],
+    ["3", "2022-08-19T16:17:31.000Z", None, "false", "☃"],
+]
+
+
+@pytest.fixture
+def client():
+    """Fixture to create a DataFrameClient instance."""
+    return DataFrameClient(HttpConfiguration("http://localhost", "api-key"))
+
+
+class TestEncodeColumn:
+    def test__float64_values__encode__round_trips_exactly(self):
+        values = np.array([0.1, 1 / 3, 1e300, -2.5e-310, 123456789.0])
+
+        encoded = encode_column(TypedColumn("value", DataType.Float64, values))
+
+        assert np.array_equal(np.array(encoded.tolist(), dtype=np.float64), values)
+
+    def test__float32_values__encode__uses_shortest_float32_text(self):
+        values = np.array([0.1, 3.4028235e38], dtype=np.float32)
+
+        encoded = encode_column(TypedColumn("value", DataType.Float32, values))
+
+        assert encoded.tolist() == ["0.1", "3.4028235e+38"]
+
+    def test__special_float_values__encode__uses_service_spelling(self):
+        values = np.array([np.nan, np.inf, -np.inf, 1.0])
+
+        encoded = encode_column(TypedColumn("value", DataType.Float64, values))
+
+        assert encoded.tolist() == ["NaN", "Infinity", "-Infinity", "1.0"]
+
+    def test__timestamp_values__encode__returns_utc_milliseconds(self):
+        values = np.array(
+            ["2022-08-19T16:17:30.123", "2022-08-19T16:17:30", "NaT"],
+            dtype="datetime64[ms]",
+        )
+
+        encoded = encode_column(TypedColumn("time", DataType.Timestamp, values))
+
+        assert encoded.tolist() == [
+            "2022-08-19T16:17:30.123Z",
+            "2022-08-19T16:17:30.000Z",
+            None,
+        ]
+
+    def test__masked_values__encode__returns_none(self):
+        column = TypedColumn(
+            "flag", DataType.Bool, np.array([True, False]), np.array([False, True])
+        )
+
+        assert encode_column(column).tolist() == ["true", None]
+
+    def test__masked_strings__encode__does_not_modify_column(self):
+        column = decode_column("label", DataType.String, ["a", "b"])
+        column.mask[1] = True
+
+        encoded = encode_column(column)
+
+        assert encoded.tolist() == ["a", None]
+        assert column.values.tolist() == ["a", "b"]
+
+    def test__decoded_frame__encode_frame__returns_same_rows(self):
+        frame = decode_frame(DataFrame(data=rows), columns)
+
+        encoded = encode_frame(frame, ["label", "index"])
+
+        assert encoded.columns == ["label", "index"]
+        assert encoded.data == [["a", "1"], [None, "2"], ["☃", "3"]]
+
+
+class TestPandasConversion:
+    def test__frame_with_nulls__to_pandas__uses_nullable_types(self):
+        frame = decode_frame(DataFrame(data=rows), columns)
+
+        data = to_pandas(frame)
+
+        assert list(data.columns) == [column.name for column in columns]
+        assert data["index"].dtype == np.int32
+        assert str(data["value"].dtype) == "Float64"
+        assert str(data["flag"].dtype) == "boolean"
+        assert str(data["time"].dtype) == "datetime64[ms, UTC]"
+        assert np.isnan(data["value"][1])
+        assert data["value"][2] is pd.NA
+        assert data["time"][1] is pd.NaT
+        assert data["time"][0] == pd.Timestamp("2022-08-19T16:17:30.123Z")
+        assert data["label"].tolist()[0] == "a"
+        assert pd.isna(data["label"][1])
+
+    def test__column_without_nulls__to_pandas__shares_memory(self):
+        frame = decode_frame(DataFrame(data=rows), columns)
+
+        data = to_pandas(frame)
+
+        assert np.shares_memory(data["index"].to_numpy(), frame["index"].values)
+
+    def test__converted_frame__from_pandas__round_trips(self):
+        frame = decode_frame(DataFrame(data=rows), columns)
+
+        result = encode_frame(from_pandas(to_pandas(frame), columns))
+
+        assert result.data == rows
+
+    def test__naive_timestamps_and_missing_strings__from_pandas__uses_nulls(self):
+        data = pd.DataFrame(
+            {
+                "time": pd.to_datetime(["2022-08-19 16:17:30.5", None]),
+                "label": ["a", None],
+                "value": [np.nan, 2.0],
+            }
+        )
+
+        result = encode_frame(from_pandas(data, columns))
+
+        assert result.data == [
+            ["2022-08-19T16:17:30.500Z", "a", "NaN"],
+            [None, None, "2.0"],
+        ]
+
+    def test__unknown_column__from_pandas__raises(self):
+        with pytest.raises(ValueError, match="Unknown column: 'other'"):
+            from_pandas(pd.DataFrame({"other": [1]}), columns)
+
+    def test__missing_int_values__from_pandas__raises(self):
+        data = pd.DataFrame({"index": [1.0, None]}).astype(object)
+
+        with pytest.raises(ValueError, match="does not use a nullable data type"):
+            from_pandas(data, columns)
+
+
+class TestDataFrameClientPandas:
+    @responses.activate
+    def test__multiple_pages__read_table__returns_all_rows(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}tables/table-id/query-data"
+        responses.add(
+            responses.POST,
+            url,
+            json={
+                "frame": {"columns": ["index", "value"], "data": [["1", "1.5"]]},
+                "totalRowCount": 2,
+                "continuationToken": "token",
+            },
+            match=[matchers.json_params_matcher({"columns": ["index", "value"]})],
+        )
+        responses.add(
+            responses.POST,
+            url,
+            json={
+                "frame": {"columns": ["index", "value"], "data": [["2", None]]},
+                "totalRowCount": 2,
+                "continuationToken": None,
+            },
+            match=[
+                matchers.json_params_matcher(
+                    {"columns": ["index", "value"], "continuationToken": "token"}
+                )
+            ],
+        )
+
+        data = client.read_table(
+            "table-id",
+            QueryTableDataRequest(columns=["index", "value"]),
+            table_columns=columns,
+        )
+
+        assert data["index"].tolist() == [1, 2]
+        assert data["value"][0] == 1.5
+        assert data["value"][1] is pd.NA
+
+    @responses.activate
+    def test__dataframe__append_dataframe__sends_rows_in_batches(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}tables/table-id/data"
+        responses.add(responses.POST, url)
+        data = pd.DataFrame(
+            {"index": np.array([1, 2, 3], dtype=np.int32), "value": [0.5, None, 2.0]}
+        )
+        data["value"] = data["value"].astype("Float64")
+
+        client.append_dataframe(
+            "table-id",
+            data,
+            rows_per_request=2,
+            end_of_data=True,
+            table_columns=columns,
+        )
+
+        bodies = [
+            json.loads(call.request.body) for call in responses.calls  # type: ignore
+        ]
+        assert bodies == [
+            {
+                "frame": {
+                    "columns": ["index", "value"],
+                    "data": [["1", "0.5"], ["2", None]],
+                }
+            },
+            {
+                "frame": {"columns": ["index", "value"], "data": [["3", "2.0"]]},
+                "endOfData": True,
+            },
+        ]
+
+    @responses.activate
+    def test__empty_dataframe__append_dataframe__sends_end_of_data(
+        self, client: DataFrameClient
+    ):
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/data",
+            match=[matchers.json_params_matcher({"endOfData": True})],
+        )
+
+        client.append_dataframe(
+            "table-id",
+            pd.DataFrame({"index": np.array([], dtype=np.int32)}),
+            end_of_data=True,
+            table_columns=columns,
+        )
+
+        assert len(responses.calls) == 1
+
+    def test__invalid_rows_per_request__append_dataframe__raises(
+        self, client: DataFrameClient
+    ):
+        with pytest.raises(ValueError, match="rows_per_request cannot be 0"):
+            client.append_dataframe(
+                "table-id", pd.DataFrame(), rows_per_request=0, table_columns=columns
+            )
@@ -0,0 +1,229 @@
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest  # type: ignore
+import responses
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    ColumnFilter,
+    ColumnOrderBy,
+    FilterOperation,
+    QueryTableDataRequest,
+)
+
+
+def _metadata(index_type: str = "INT32") -> Dict[str, Any]:
+    return {
+        "columns": [
+            {"name": "index", "dataType": index_type, "columnType": "INDEX"},
+            {"name": "value", "dataType": "STRING", "columnType": "NULLABLE"},
+        ],
+        "createdAt": "2022-08-19T16:17:30.123Z",
+        "id": "table-id",
+        "metadataModifiedAt": "2022-08-19T16:17:30.123Z",
+        "metadataRevision": 1,
+        "name": "table",
+        "properties": {},
+        "rowCount": 0,
+        "rowsModifiedAt": "2022-08-19T16:17:30.123Z",
+        "supportsAppend": True,
+        "workspace": "workspace",
+    }
+
+
+class FakeTable:
+    """Answers query-data requests for a table of (index, value) rows."""
+
+    def __init__(self, rows: List[Tuple[int, str]]):
+        self.rows = rows
+        self.queries = []  # type: List[Dict[str, Any]]
+        self.lock = threading.Lock()
+
+    def query_data(self, request: Any) -> Tuple[int, Dict[str, str], str]:
+        query = json.loads(request.body)
+        with self.lock:
+            self.queries.append(query)
+
+        rows = [row for row in self.rows if self._matches(row, query)]
+        order_by = query.get("orderBy") or []
+        if order_by:
+            rows.sort(
+                key=lambda row: row[0], reverse=bool(order_by[0].get("descending"))
+            )
+        start = int(query.get("continuationToken") or 0)
+        take = query.get("take", 2)
+        page = rows[start : start + take]
+        token = str(start + take) if start + take < len(rows) else None
+        columns = query.get("columns") or ["index", "value"]
+        body = {
+            "frame": {
+                "columns": columns,
+                "data": [
+                    [str(row[0]) if name == "index" else row[1] for name in columns]
+                    for row in page
+                ],
+            },
+            "totalRowCount": len(rows),
+            "continuationToken": token,
+        }
+        return 200, {}, json.dumps(body)
+
+    @staticmethod
+    def _matches(row: Tuple[int, str], query: Dict[str, Any]) -> bool:
+        for filter in query.get("filters") or []:
+            value = int(filter["value"])
+            operation = filter["operation"]
+            if operation == "GREATER_THAN_EQUALS" and not row[0] >= value:
+                return False
+            if operation == "LESS_THAN" and not row[0] < value:
+                return False
+        return True
+
+
+@pytest.fixture
+def client():
+    """Fixture to create a DataFrameClient instance."""
+    return DataFrameClient(HttpConfiguration("http://localhost", "api-key"))
+
+
+def _add_table(
+    client: DataFrameClient, rows: List[Tuple[int, str]], status: Optional[int] = None
+) -> FakeTable:
+    table = FakeTable(rows)
+    responses.add(
+        responses.GET,
+        f"{client.session.base_url}tables/table-id",
+        json=_metadata(),
+    )
+    responses.add_callback(
+        responses.POST,
+        f"{client.session.base_url}tables/table-id/query-data",
+        callback=table.query_data,
+    )
+    return table
+
+
+class TestQueryTableDataPartitioned:
+    @responses.activate
+    def test__partitions__query__returns_all_rows_in_order(
+        self, client: DataFrameClient
+    ):
+        rows = [(index, "v{}".format(index)) for index in range(20)]
+        table = _add_table(client, list(reversed(rows)))
+
+        frames = list(
+            client.query_table_data_partitioned(
+                "table-id", QueryTableDataRequest(take=3), partitions=4
+            )
+        )
+
+        assert [row for frame in frames for row in frame.data] == [
+            [str(index), value] for index, value in rows
+        ]
+        partition_filters = [
+            [(f["operation"], f["value"]) for f in query["filters"]]
+            for query in table.queries
+            if "continuationToken" not in query and query.get("take") == 3
+        ]
+        assert sorted(partition_filters) == sorted(
+            [
+                [("LESS_THAN", "5")],
+                [("GREATER_THAN_EQUALS", "5"), ("LESS_THAN", "10")],
+                [("GREATER_THAN_EQUALS", "10"), ("LESS_THAN", "15")],
+                [("GREATER_THAN_EQUALS", "15")],
+            ]
+        )
+
+    @responses.activate
+    def test__fewer_values_than_partitions__query__skips_empty_ranges(
+        self, client: DataFrameClient
+    ):
+        _add_table(client, [(1, "a"), (2, "b")])
+
+        frames = list(
+            client.query_table_data_partitioned(
+                "table-id", QueryTableDataRequest(), partitions=8
+            )
+        )
+
+        assert [row for frame in frames for row in frame.data] == [
+            ["1", "a"],
+            ["2", "b"],
+        ]
+
+    @responses.activate
+    def test__user_filters__query__combines_with_partition_filters(
+        self, client: DataFrameClient
+    ):
+        table = _add_table(client, [(index, "v") for index in range(10)])
+        query = QueryTableDataRequest(
+            columns=["value"],
+            filters=[
+                ColumnFilter(
+                    column="index",
+                    operation=FilterOperation.GreaterThanEquals,
+                    value="6",
+                )
+            ],
+        )
+
+        frames = list(client.query_table_data_partitioned("table-id", query))
+
+        assert sum(len(frame.data) for frame in frames) == 4
+        assert all(q["filters"][0]["value"] == "6" for q in table.queries)
+
+    @responses.activate
+    def test__empty_result__query__returns_no_frames(self, client: DataFrameClient):
+        _add_table(client, [])
+
+        frames = list(
+            client.query_table_data_partitioned("table-id", QueryTableDataRequest())
+        )
+
+        assert frames == []
+
+    @responses.activate
+    def test__request_fails__query__raises(self, client: DataFrameClient):
+        responses.add(
+            responses.GET,
+            f"{client.session.base_url}tables/table-id",
+            json=_metadata(),
+        )
+        responses.add(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/query-data",
+            status=500,
+        )
+
+        with pytest.raises(ApiException):
+            client.query_table_data_partitioned("table-id", QueryTableDataRequest())
+
+    @responses.activate
+    def test__ordered_by_other_column__query__raises(self, client: DataFrameClient):
+        _add_table(client, [])
+        query = QueryTableDataRequest(order_by=[ColumnOrderBy(column="value")])
+
+        with pytest.raises(ValueError, match="ordered by 'index'"):
+            client.query_table_data_partitioned("table-id", query)
+
+    @responses.activate
+    def test__string_partition_column__query__raises(self, client: DataFrameClient):
+        _add_table(client, [])
+
+        with pytest.raises(ValueError, match="numeric or timestamp"):
+            client.query_table_data_partitioned(
+                "table-id", QueryTableDataRequest(), partition_column="value"
+            )
+
+    @responses.activate
+    def test__no_index_column__query__raises(self, client: DataFrameClient):
+        metadata = _metadata()
+        metadata["columns"] = metadata["columns"][1:]
+        responses.add(
+            responses.GET, f"{client.session.base_url}tables/table-id", json=metadata
+        )
+
+        with pytest.raises(ValueError, match="Table 'table-id' has no index column"):
+            client.query_table_data_partitioned("table-id", QueryTableDataRequest())
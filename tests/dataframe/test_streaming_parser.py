@@ -0,0 +1,75 @@
+import json
+
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe._streaming_parser import PagedTableRowsParser
+
+page = {
+    "frame": {
+        "columns": ["index", "name"],
+        "data": [["1", 'café "]"'], ["2", None], ["3", "☃"]],
+    },
+    "totalRowCount": 12345,
+    "continuationToken": "token",
+}
+
+
+class TestPagedTableRowsParser:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+    def test__chunked_response__feed__returns_rows_as_completed(self, chunk_size):
+        data = json.dumps(page, indent=2, ensure_ascii=False).encode()
+        parser = PagedTableRowsParser()
+
+        rows = []
+        for start in range(0, len(data), chunk_size):
+            rows.extend(parser.feed(data[start : start + chunk_size]))
+        result = parser.close()
+
+        assert rows == page["frame"]["data"]
+        assert result.frame.data == rows
+        assert result.frame.columns == ["index", "name"]
+        assert result.total_row_count == 12345
+        assert result.continuation_token == "token"
+
+    def test__row_split_across_chunks__feed__returns_row_once_complete(self):
+        parser = PagedTableRowsParser()
+
+        first = parser.feed(b'{"frame": {"data": [["1"], ["2')
+        second = parser.feed(b'"]]}, "totalRowCount": 2}')
+
+        assert first == [["1"]]
+        assert second == [["2"]]
+        assert parser.close().total_row_count == 2
+
+    def test__number_split_across_chunks__close__parses_whole_number(self):
+        parser = PagedTableRowsParser()
+
+        parser.feed(b'{"frame": {"data": []}, "totalRowCount": 12')
+        parser.feed(b"34}")
+
+        assert parser.close().total_row_count == 1234
+
+    def test__collect_rows_false__close__returns_empty_data(self):
+        parser = PagedTableRowsParser(collect_rows=False)
+
+        rows = parser.feed(json.dumps(page).encode())
+        result = parser.close()
+
+        assert len(rows) == 3
+        assert result.frame.data == []
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b'{"frame": {"data": [["1"]',
+            b'{"frame": {"data": [[1]]}, "totalRowCount": 1}',
+            b'{"frame": {"data": [["1"}}',
+            b'{"frame": {"data": []}}',
+            b"[]",
+        ],
+    )
+    def test__invalid_response__close__raises(self, data):
+        parser = PagedTableRowsParser()
+
+        with pytest.raises(ValueError):
+            parser.feed(data)
+            parser.close()
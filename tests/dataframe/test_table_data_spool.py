@@ -0,0 +1,234 @@
+import json
+import os
+import threading
+from datetime import timedelta
+from typing import List, Tuple
+from unittest import mock
+
+import pytest  # type: ignore
+import requests
+from nisystemlink.clients.core import ApiException
+from nisystemlink.clients.dataframe import DataFrameClient, TableDataSpool
+from nisystemlink.clients.dataframe.models import AppendTableDataRequest, DataFrame
+
+no_delay = timedelta(0)
+timeout = timedelta(seconds=5)
+
+
+@pytest.fixture
+def client():
+    """Fixture to create a mock DataFrameClient."""
+    return mock.Mock(spec=DataFrameClient)
+
+
+def _appends(client: mock.Mock) -> List[Tuple[str, AppendTableDataRequest]]:
+    return [
+        (call.args[0], call.args[1]) for call in client.append_table_data.call_args_list
+    ]
+
+
+def _segments(path: str) -> List[str]:
+    return sorted(name for name in os.listdir(path) if name.startswith("segment-"))
+
+
+class TestTableDataSpool:
+    def test__rows_appended__flush__sends_in_order(self, client, tmp_path):
+        with TableDataSpool(client, str(tmp_path)) as spool:
+            spool.append_rows("table-1", [["1"]], columns=["a"])
+            spool.append_rows("table-2", [["2"], [None]])
+            spool.append_rows("table-1", [], end_of_data=True)
+
+            assert spool.flush(timeout)
+
+        assert _appends(client) == [
+            (
+                "table-1",
+                AppendTableDataRequest(frame=DataFrame(columns=["a"], data=[["1"]])),
+            ),
+            ("table-2", AppendTableDataRequest(frame=DataFrame(data=[["2"], [None]]))),
+            ("table-1", AppendTableDataRequest(end_of_data=True)),
+        ]
+        assert _appends(client)[2][1].frame is None
+
+    def test__service_blocked__append_rows__returns_without_waiting(
+        self, client, tmp_path
+    ):
+        release = threading.Event()
+        client.append_table_data.side_effect = lambda *args: release.wait()
+        spool = TableDataSpool(client, str(tmp_path))
+
+        spool.append_rows("table-id", [["1"]])
+        spool.append_rows("table-id", [["2"]])
+
+        assert not spool.flush(timedelta(milliseconds=10))
+        release.set()
+        assert spool.flush(timeout)
+        spool.close()
+
+    def test__temporary_failures__sends_again_until_success(self, client, tmp_path):
+        client.append_table_data.side_effect = [
+            requests.ConnectionError("unreachable"),
+            ApiException("unavailable", http_status_code=503),
+            None,
+            None,
+        ]
+        with TableDataSpool(client, str(tmp_path), retry_delay=no_delay) as spool:
+            spool.append_rows("table-id", [["1"]])
+            spool.append_rows("table-id", [["2"]])
+
+            assert spool.flush(timeout)
+            assert spool.last_error is None
+
+        frames = [request.frame for _, request in _appends(client)]
+        assert frames == [DataFrame(data=[["1"]])] * 3 + [DataFrame(data=[["2"]])]
+
+    def test__append_rejected__moves_to_rejected_file_and_continues(
+        self, client, tmp_path
+    ):
+        client.append_table_data.side_effect = [
+            ApiException("bad value", http_status_code=400),
+            None,
+        ]
+        with TableDataSpool(client, str(tmp_path), retry_delay=no_delay) as spool:
+            spool.append_rows("table-id", [["x"]])
+            spool.append_rows("table-id", [["2"]])
+
+            assert spool.flush(timeout)
+
+        assert client.append_table_data.call_count == 2
+        with open(os.path.join(tmp_path, "rejected.jsonl")) as file:
+            rejected = [json.loads(line) for line in file]
+        assert rejected == [
+            {
+                "id": "table-id",
+                "request": {"frame": {"columns": None, "data": [["x"]]}},
+                "error": "bad value",
+            }
+        ]
+
+    def test__authentication_failure__sends_again_until_success(self, client, tmp_path):
+        client.append_table_data.side_effect = [
+            ApiException("unauthorized", http_status_code=401),
+            None,
+        ]
+        with TableDataSpool(client, str(tmp_path), retry_delay=no_delay) as spool:
+            spool.append_rows("table-id", [["1"]])
+
+            assert spool.flush(timeout)
+
+        assert client.append_table_data.call_count == 2
+        assert not os.path.exists(os.path.join(tmp_path, "rejected.jsonl"))
+
+    def test__permission_denied__moves_to_rejected_file_and_continues(
+        self, client, tmp_path
+    ):
+        client.append_table_data.side_effect = [
+            ApiException("forbidden", http_status_code=403),
+            None,
+        ]
+        with TableDataSpool(client, str(tmp_path), retry_delay=no_delay) as spool:
+            spool.append_rows("forbidden-table", [["1"]])
+            spool.append_rows("table-id", [["2"]])
+
+            assert spool.flush(timeout)
+
+        assert [id for id, _ in _appends(client)] == ["forbidden-table", "table-id"]
+        with open(os.path.join(tmp_path, "rejected.jsonl")) as file:
+            assert json.loads(file.readline())["id"] == "forbidden-table"
+
+    def test__unexpected_error__flush_and_close__raise_error(self, client, tmp_path):
+        error = KeyError("unexpected")
+        client.append_table_data.side_effect = error
+        spool = TableDataSpool(client, str(tmp_path), retry_delay=no_delay)
+        spool.append_rows("table-id", [["1"]])
+
+        with pytest.raises(KeyError):
+            spool.flush(timeout)
+        assert spool.last_error is error
+        with pytest.raises(KeyError):
+            spool.close()
+
+        client.append_table_data.side_effect = None
+        with TableDataSpool(client, str(tmp_path)) as spool:
+            assert spool.flush(timeout)
+        assert client.append_table_data.call_count == 2
+
+    def test__closed_before_sending__new_spool__sends_remaining_appends(
+        self, client, tmp_path
+    ):
+        client.append_table_data.side_effect = ApiException("unavailable")
+        spool = TableDataSpool(client, str(tmp_path), retry_delay=timedelta(hours=1))
+        spool.append_rows("table-id", [["1"]])
+        spool.append_rows("table-id", [["2"]])
+        spool.close()
+
+        restarted = mock.Mock(spec=DataFrameClient)
+        with TableDataSpool(restarted, str(tmp_path)) as spool:
+            spool.append_rows("table-id", [["3"]])
+            assert spool.flush(timeout)
+
+        frames = [request.frame for _, request in _appends(restarted)]
+        assert frames == [
+            DataFrame(data=[["1"]]),
+            DataFrame(data=[["2"]]),
+            DataFrame(data=[["3"]]),
+        ]
+
+    def test__partly_sent_segment__new_spool__resumes_after_checkpoint(
+        self, client, tmp_path
+    ):
+        sent = threading.Event()
+
+        def append(id: str, request: AppendTableDataRequest) -> None:
+            if request.frame is not None and request.frame.data == [["2"]]:
+                sent.set()
+                raise ApiException("unavailable")
+
+        client.append_table_data.side_effect = append
+        spool = TableDataSpool(client, str(tmp_path), retry_delay=timedelta(hours=1))
+        spool.append_rows("table-id", [["1"]])
+        spool.append_rows("table-id", [["2"]])
+        assert sent.wait(5)
+        spool.close()
+
+        restarted = mock.Mock(spec=DataFrameClient)
+        with TableDataSpool(restarted, str(tmp_path)) as spool:
+            assert spool.flush(timeout)
+            spool.append_rows("table-id", [["3"]])
+            assert spool.flush(timeout)
+
+        frames = [request.frame for _, request in _appends(restarted)]
+        assert frames == [DataFrame(data=[["2"]]), DataFrame(data=[["3"]])]
+
+    def test__partly_written_line__new_spool__skips_line(self, client, tmp_path):
+        with open(os.path.join(tmp_path, "segment-000000000001.jsonl"), "wb") as file:
+            file.write(b'{"id": "table-id", "request": {"frame": {"data": [["1"]]}}}\n')
+            file.write(b'{"id": "table-id", "requ')
+
+        with TableDataSpool(client, str(tmp_path)) as spool:
+            spool.append_rows("table-id", [["2"]])
+            assert spool.flush(timeout)
+
+        frames = [request.frame for _, request in _appends(client)]
+        assert frames == [DataFrame(data=[["1"]]), DataFrame(data=[["2"]])]
+
+    def test__segment_full__sends_and_deletes_old_segments(self, client, tmp_path):
+        with TableDataSpool(client, str(tmp_path), max_segment_bytes=100) as spool:
+            for value in range(5):
+                spool.append_rows("table-id", [[str(value) * 30]])
+            assert spool.flush(timeout)
+
+            assert len(_segments(str(tmp_path))) == 1
+
+        assert client.append_table_data.call_count == 5
+
+    def test__closed__append_rows__raises(self, client, tmp_path):
+        spool = TableDataSpool(client, str(tmp_path))
+        spool.close()
+
+        with pytest.raises(ReferenceError):
+            spool.append_rows("table-id", [["1"]])
+
+    def test__invalid_segment_size__raises(self, client, tmp_path):
+        with pytest.raises(ValueError, match="max_segment_bytes cannot be 0"):
+            TableDataSpool(client, str(tmp_path), max_segment_bytes=0)
@@ -0,0 +1,160 @@
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional
+from unittest import mock
+
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.columnar import TableMirror
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    ColumnType,
+    DataFrame,
+    DataType,
+    PagedTableRows,
+    QueryTableDataRequest,
+    TableMetadata,
+)
+
+columns = [
+    Column(name="index", data_type=DataType.Int64, column_type=ColumnType.Index),
+    Column(name="value", data_type=DataType.Float64, column_type=ColumnType.Nullable),
+    Column(name="label", data_type=DataType.String, column_type=ColumnType.Nullable),
+]
+
+
+class FakeTable:
+    """Serves a mock client's metadata and data requests from a list of rows."""
+
+    def __init__(self, client: mock.Mock):
+        self.columns = columns
+        self.rows = []  # type: List[List[Optional[str]]]
+        self.modified = 0
+        self.queries = []  # type: List[QueryTableDataRequest]
+        client.get_table_metadata.side_effect = self.get_table_metadata
+        client.query_table_data_pages.side_effect = self.query_table_data_pages
+
+    def append(self, *rows: List[Optional[str]]) -> None:
+        self.rows.extend(rows)
+        self.modified += 1
+
+    def get_table_metadata(self, id: str, refresh: bool = False) -> TableMetadata:
+        assert refresh
+        timestamp = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        return TableMetadata(
+            columns=self.columns,
+            created_at=timestamp,
+            id=id,
+            metadata_modified_at=timestamp,
+            metadata_revision=1,
+            name="table",
+            properties={},
+            row_count=len(self.rows),
+            rows_modified_at=datetime(
+                2023, 1, 1, 0, self.modified, tzinfo=timezone.utc
+            ),
+            supports_append=True,
+            workspace="workspace",
+        )
+
+    def query_table_data_pages(
+        self, id: str, query: QueryTableDataRequest
+    ) -> Iterator[PagedTableRows]:
+        self.queries.append(query)
+        rows = self.rows
+        for filter in query.filters or []:
+            assert filter.value is not None
+            rows = [row for row in rows if int(row[0] or 0) > int(filter.value)]
+        for start in range(0, max(len(rows), 1), 2):
+            yield PagedTableRows(
+                frame=DataFrame(columns=query.columns, data=rows[start : start + 2]),
+                total_row_count=len(rows),
+                continuation_token=None,
+            )
+
+
+@pytest.fixture
+def client():
+    """Fixture to create a mock DataFrameClient."""
+    return mock.Mock(spec=DataFrameClient)
+
+
+class TestTableMirror:
+    def test__first_sync__open__returns_memory_mapped_rows(self, client, tmp_path):
+        table = FakeTable(client)
+        table.append(["1", "1.5", "a"], ["2", None, None], ["3", "3.5", "ünï"])
+        mirror = TableMirror(client, "table-id", str(tmp_path / "mirror"))
+
+        written = mirror.sync()
+        frame = mirror.open()
+
+        assert written == 3
+        assert mirror.row_count == 3
+        assert not frame["index"].values.flags.owndata
+        assert not frame["index"].values.flags.writeable
+        assert frame["index"].values.tolist() == [1, 2, 3]
+        assert frame["value"].to_list() == [1.5, None, 3.5]
+        assert frame["label"].to_list() == ["a", None, "ünï"]
+
+    def test__rows_appended__sync__downloads_only_new_rows(self, client, tmp_path):
+        table = FakeTable(client)
+        table.append(["1", "1.5", "a"], ["2", "2.5", "b"])
+        mirror = TableMirror(client, "table-id", str(tmp_path))
+        mirror.sync()
+
+        table.append(["3", "3.5", "c"])
+        written = mirror.sync()
+
+        assert written == 1
+        assert table.queries[-1].filters is not None
+        assert table.queries[-1].filters[0].value == "2"
+        assert mirror.open()["label"].to_list() == ["a", "b", "c"]
+
+    def test__table_unchanged__sync__does_not_query_data(self, client, tmp_path):
+        table = FakeTable(client)
+        table.append(["1", "1.5", "a"])
+        mirror = TableMirror(client, "table-id", str(tmp_path))
+        mirror.sync()
+
+        written = mirror.sync()
+
+        assert written == 0
+        assert len(table.queries) == 1
+
+    def test__rows_removed__sync__downloads_table_again(self, client, tmp_path):
+        table = FakeTable(client)
+        table.append(["1", "1.5", "a"], ["2", "2.5", "b"])
+        mirror = TableMirror(client, "table-id", str(tmp_path))
+        mirror.sync()
+
+        table.rows = [["5", "5.5", "e"]]
+        table.modified += 1
+        written = mirror.sync()
+
+        assert written == 1
+        assert mirror.open()["index"].values.tolist() == [5]
+
+    def test__rows_inserted_before_last_row__sync__downloads_table_again(
+        self, client, tmp_path
+    ):
+        table = FakeTable(client)
+        table.append(["2", "2.5", "b"])
+        mirror = TableMirror(client, "table-id", str(tmp_path))
+        mirror.sync()
+
+        table.rows.insert(0, ["1", "1.5", "a"])
+        table.modified += 1
+        mirror.sync()
+
+        assert mirror.open()["index"].values.tolist() == [1, 2]
+
+    def test__no_index_column__sync__raises(self, client, tmp_path):
+        table = FakeTable(client)
+        table.columns = columns[1:]
+        mirror = TableMirror(client, "table-id", str(tmp_path))
+
+        with pytest.raises(ValueError, match="Table 'table-id' has no index column"):
+            mirror.sync()
+
+    def test__not_synced__open__raises(self, client, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            TableMirror(client, "table-id", str(tmp_path)).open()
@@ -2847,3 +2847,17 @@ class TestTagManager(HttpClientTestBase):
                 params={"path": path},
             ),
         ]
+
+    def test__with_block__closes_connections_on_exit(self):
+        with mock.patch.object(self._client, "close") as close:
+            with self._uut as manager:
+                assert manager is self._uut
+                close.assert_not_called()
+
+        close.assert_called_once_with()
+
+    def test__connection_pool_stats__returns_http_client_stats(self):
+        stats = core.ConnectionPoolStats(1, 2, 1, 3)
+
+        with mock.patch.object(self._client, "pool_stats", return_value=stats):
+            assert self._uut.connection_pool_stats == stats